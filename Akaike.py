@@ -1,7 +1,11 @@
 import numpy as np
+from concurrent.futures import ProcessPoolExecutor
+from inspect import signature
+from scipy.optimize import curve_fit
+from typing import Callable, Optional, Sequence, Tuple
 
 
-def Akaike(n, k, x, y, params):
+def Akaike(n, k, x, y, params, model=None):
     """
     Computes the Akaike Information Criterion (AIC) for the given data.
 
@@ -13,6 +17,8 @@ def Akaike(n, k, x, y, params):
     - y (Numpy array): An array of size n with the y-values of the data set.
     - params (Numpy array): An array of size k with the parameters of the fitted
     equation listed from lowest-order to highest-order term.
+    - model (function): The fitted function, model(x, *params). A polynomial
+    of k terms if not given.
 
     Returns
     -------
@@ -20,15 +26,263 @@ def Akaike(n, k, x, y, params):
     """
 
     # Compute the residuals of the sum of the squares first.
-    rss = 0
-    if k == 2:
-        a, b = params
-        rss = np.sum((y - (a + (b * x))) ** 2)
-    elif k == 3:
-        a, b, c = params
-        rss = np.sum((y - (a + (b * x) + (c * (x ** 2)))) ** 2)
+    rss = residual_sum_squares(model, x, y, params)
 
     # Compute the AIC.
-    aic = (n * np.math.log(rss / n)) + (2 * k)
+    aic = (n * np.log(rss / n)) + (2 * k)
 
-    return aic
\ No newline at end of file
+    return aic
+
+
+def residual_sum_squares(model: Optional[Callable], x: np.ndarray,\
+    y: np.ndarray, params: np.ndarray) -> np.ndarray:
+    """
+    Computes the residual sum of squares of a model for many parameter sets
+    in one vectorized call.
+
+    Parameters
+    ----------
+    - model (function): A function of the form model(x, *params) that
+    broadcasts over its parameters, or None for a polynomial with the
+    parameters from lowest to highest order.
+    - x (1-d array): The x-values of the data.
+    - y (1-d array): The y-values of the data.
+    - params (array): One parameter set of size k, or an (m, k) array of m
+    sets.
+
+    Returns
+    -------
+    - rss (float or array): The residual sum of squares of each set.
+    """
+
+    x = np.asarray(x, dtype=float)
+    y = np.asarray(y, dtype=float)
+    params = np.asarray(params, dtype=float)
+    if model is None:
+        # polyval takes the coefficients along the first axis and puts the
+        # parameter sets in front of x.
+        predicted = np.polynomial.polynomial.polyval(x, params.T,\
+            tensor=params.ndim > 1)
+    else:
+        columns = params.T[..., np.newaxis] if params.ndim > 1 else params
+        predicted = model(x, *columns)
+
+    return np.sum((y - predicted) ** 2, axis=-1)
+
+
+def information_criteria(rss: np.ndarray, n: int, k: np.ndarray) -> dict:
+    """
+    Computes the usual information criteria from the residual sum of squares
+    of least squares fits with Gaussian errors.
+
+    Parameters
+    ----------
+    - rss (float or array): The residual sums of squares.
+    - n (int): The number of data points.
+    - k (int or array): The number of fitted parameters of each model.
+
+    Returns
+    -------
+    - criteria (dict): The 'aic', the small sample 'aicc' (infinite when
+    n <= k + 1) and the 'bic' of each model; lower is better.
+    """
+
+    rss = np.asarray(rss, dtype=float)
+    k = np.asarray(k, dtype=float)
+    with np.errstate(divide='ignore'):
+        fit = n * np.log(rss / n)
+        aic = fit + (2 * k)
+        correction = np.where(n > k + 1, (2 * k * (k + 1))\
+            / np.maximum(n - k - 1, 1), np.inf)
+
+    return {'aic': aic, 'aicc': aic + correction, 'bic': fit + (k * np.log(n))}
+
+
+_qr_cache = {}
+
+
+def _vandermonde_qr(x: np.ndarray, degree: int)\
+    -> Tuple[np.ndarray, np.ndarray, Tuple[float, float]]:
+    """
+    QR factorization of the Vandermonde matrix of x up to the given degree,
+    cached for the last few x arrays. x is mapped onto [-1, 1] first to keep
+    the matrix well conditioned; the leading columns of Q and block of R are
+    the factorization for every lower degree.
+    """
+
+    key = (x.tobytes(), degree)
+    if key not in _qr_cache:
+        if len(_qr_cache) >= 8:
+            _qr_cache.pop(next(iter(_qr_cache)))
+        domain = (x.min(), x.max())
+        if domain[0] == domain[1]:
+            domain = (domain[0] - 1, domain[1] + 1)
+        t = ((2 * x) - (domain[0] + domain[1])) / (domain[1] - domain[0])
+        Q, R = np.linalg.qr(np.polynomial.polynomial.polyvander(t, degree))
+        _qr_cache[key] = (Q, R, domain)
+
+    return _qr_cache[key]
+
+
+def _from_window(domain: Tuple[float, float], degree: int) -> np.ndarray:
+    """
+    The matrix taking the coefficients of a polynomial in t, the x of the
+    domain mapped onto [-1, 1], to its coefficients in x; column j holds the
+    coefficients of t**j.
+    """
+
+    low, high = domain
+    t = np.array([-(low + high), 2.0]) / (high - low)
+    matrix = np.zeros((degree + 1, degree + 1))
+    power = np.ones(1)
+    for j in range(degree + 1):
+        matrix[:len(power), j] = power
+        power = np.polynomial.polynomial.polymul(power, t)
+
+    return matrix
+
+
+def polynomial_fits(x: np.ndarray, y: np.ndarray, degrees: Sequence[int])\
+    -> Tuple[list, np.ndarray]:
+    """
+    Fits polynomials of several degrees to one or many data sets from a
+    single QR factorization of the Vandermonde matrix at the highest degree.
+
+    Parameters
+    ----------
+    - x (1-d array): The x-values, shared by every data set.
+    - y (array): The y-values, of shape (n,) or (m, n) for m data sets.
+    - degrees (sequence): The degrees to fit.
+
+    Returns
+    -------
+    - params (list): For each degree, the coefficients from lowest to
+    highest order, of shape (degree + 1,) or (m, degree + 1).
+    - rss (array): The residual sums of squares, of shape (len(degrees),) or
+    (len(degrees), m).
+    """
+
+    x = np.asarray(x, dtype=float)
+    y = np.asarray(y, dtype=float)
+    degrees = [int(d) for d in degrees]
+    Q, R, domain = _vandermonde_qr(x, max(degrees))
+    convert = _from_window(domain, max(degrees))
+
+    # Projections onto the orthonormal columns; the residual of degree d is
+    # what is left of y after the first d + 1 of them.
+    projection = y @ Q
+    total = np.sum(y ** 2, axis=-1)
+    explained = np.cumsum(projection ** 2, axis=-1)
+
+    params, rss = [], []
+    for d in degrees:
+        scaled = np.linalg.solve(R[:d + 1, :d + 1],\
+            projection[..., :d + 1, np.newaxis] if y.ndim > 1 else\
+            projection[:d + 1])
+        scaled = scaled[..., 0] if y.ndim > 1 else scaled
+        # Back from the [-1, 1] window to the x of the data, for every data
+        # set at once.
+        params.append(scaled @ convert[:d + 1, :d + 1].T)
+        rss.append(np.maximum(total - explained[..., d], 0.0))
+
+    return params, np.array(rss)
+
+
+def score(model: Optional[Callable], x: np.ndarray, y: np.ndarray,\
+    params: np.ndarray) -> dict:
+    """
+    Scores one model for many parameter sets in one vectorized pass.
+
+    Parameters
+    ----------
+    - model (function): As for residual_sum_squares; None for a polynomial.
+    - x (1-d array): The x-values of the data.
+    - y (1-d array): The y-values of the data.
+    - params (array): One parameter set of size k, or an (m, k) array of m
+    sets.
+
+    Returns
+    -------
+    - criteria (dict): The 'rss', 'aic', 'aicc' and 'bic' of each set.
+    """
+
+    params = np.asarray(params, dtype=float)
+    rss = residual_sum_squares(model, x, y, params)
+    criteria = information_criteria(rss, len(x), params.shape[-1])
+    criteria['rss'] = rss
+
+    return criteria
+
+
+def _curve_fit(args: Tuple) -> np.ndarray:
+    """Fits one model for the process pool; nan parameters if it fails."""
+
+    model, x, y, p0 = args
+    if p0 is None:
+        # curve_fit's own default: one parameter per argument after x.
+        p0 = np.ones(len(signature(model).parameters) - 1)
+    try:
+        params, param_cov = curve_fit(model, x, y, p0)
+    except RuntimeError:
+        params = np.full(len(p0), np.nan)
+
+    return params
+
+
+def Model_Selection(x: np.ndarray, y: np.ndarray,\
+    models: Sequence[Callable] = (), p0: Optional[Sequence] = None,\
+    degrees: Sequence[int] = (), workers: int = 1) -> dict:
+    """
+    Fits candidate models to one data set and scores them with the AIC, AICc
+    and BIC. Polynomial candidates are fitted together from one cached QR
+    factorization; other models are fitted with curve_fit, optionally spread
+    over a process pool.
+
+    Parameters
+    ----------
+    - x (1-d array): The x-values of the data.
+    - y (1-d array): The y-values of the data.
+    - models (sequence): Functions of the form model(x, *params). They must
+    be defined at module level to use workers > 1.
+    - p0 (sequence): The initial guess for each model, with None entries to
+    start from ones.
+    - degrees (sequence): The degrees of the polynomial candidates.
+    - workers (int): The number of processes for the curve_fit calls.
+
+    Returns
+    -------
+    - results (dict): In the order of models then degrees, the 'params' of
+    each candidate and arrays of its number of parameters 'k', 'rss', 'aic',
+    'aicc' and 'bic', plus 'best', the index of the lowest AICc. Fits that
+    fail to converge have nan parameters and scores; 'best' is None if
+    every fit failed.
+    """
+
+    x = np.asarray(x, dtype=float)
+    y = np.asarray(y, dtype=float)
+    models = list(models)
+    p0 = list(p0) if p0 is not None else [None] * len(models)
+
+    work = [(model, x, y, guess) for model, guess in zip(models, p0)]
+    if workers > 1 and len(work) > 1:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            params = list(pool.map(_curve_fit, work))
+    else:
+        params = [_curve_fit(item) for item in work]
+    rss = [residual_sum_squares(model, x, y, p)\
+        for model, p in zip(models, params)]
+
+    if len(degrees):
+        polynomial_params, polynomial_rss = polynomial_fits(x, y, degrees)
+        params += polynomial_params
+        rss += list(polynomial_rss)
+
+    results = {'params': params, 'k': np.array([len(p) for p in params])}
+    results['rss'] = np.array(rss, dtype=float)
+    results.update(information_criteria(results['rss'], len(x), results['k']))
+    # nanargmin raises when there is nothing to choose from.
+    fitted = ~np.isnan(results['aicc'])
+    results['best'] = int(np.nanargmin(results['aicc'])) if np.any(fitted)\
+        else None
+
+    return results
@@ -0,0 +1,151 @@
+import numpy as np
+from concurrent.futures import ProcessPoolExecutor
+from typing import Callable, Optional, Tuple
+
+
+def logistic(x: np.ndarray, r: np.ndarray) -> np.ndarray:
+    """The logistic map, x -> 4 r x (1 - x)."""
+    return 4 * r * x * (1 - x)
+
+
+def sine(x: np.ndarray, r: np.ndarray) -> np.ndarray:
+    """The sine map used in bifurcation.py, x -> 4 r sin(x)."""
+    return 4 * r * np.sin(x)
+
+
+def _estimate_range(map_fun: Callable, r: np.ndarray, x0: float,\
+    transient: int, probe: int = 64) -> Tuple[float, float]:
+    """
+    Finds the range of the attractor from a thinned sample of the columns,
+    padded a little so the extremes stay inside the image.
+    """
+
+    sample = r[::max(1, len(r) // 1000)]
+    x = np.full(len(sample), x0, dtype=float)
+    for i in range(transient):
+        x = map_fun(x, sample)
+    low, high = np.inf, -np.inf
+    for i in range(probe):
+        x = map_fun(x, sample)
+        finite = x[np.isfinite(x)]
+        if len(finite):
+            low, high = min(low, finite.min()), max(high, finite.max())
+    if not np.isfinite(low):
+        raise ValueError("The map diverges for every sampled parameter.")
+    pad = 0.05 * max(high - low, 1e-12)
+
+    return low - pad, high + pad
+
+
+def _accumulate(map_fun: Callable, r: np.ndarray, columns: np.ndarray,\
+    x0: float, transient: int, iterations: int, x_range: Tuple[float, float],\
+    height: int, width: int, batch: int) -> np.ndarray:
+    """
+    Iterates the map for a block of parameters and bins the post-transient
+    points into an image.
+    """
+
+    image = np.zeros(height * width, dtype=np.int64)
+    x = np.full(len(r), x0, dtype=float)
+    for i in range(transient):
+        x = map_fun(x, r)
+
+    low, high = x_range
+    scale = height / (high - low)
+    # Several iterations are binned per bincount call to cut overhead.
+    rows = np.empty((batch, len(r)), dtype=np.int64)
+    done = 0
+    while done < iterations:
+        count = min(batch, iterations - done)
+        for i in range(count):
+            x = map_fun(x, r)
+            # Lanes that diverged, and points far outside the image, are put
+            # just outside it so the cast to pixel indices is well defined.
+            pixel = (x - low) * scale
+            pixel[~np.isfinite(pixel)] = -1
+            rows[i] = np.floor(np.clip(pixel, -1, height))
+        block = rows[:count]
+        inside = (block >= 0) & (block < height)
+        flat = (block * width) + columns
+        image += np.bincount(flat[inside], minlength=height * width)
+        done += count
+
+    return image.reshape(height, width)
+
+
+def _accumulate_args(args: Tuple) -> np.ndarray:
+    """Unpacks a work item for the process pool."""
+    return _accumulate(*args)
+
+
+def Bifurcation_Diagram(map_fun: Callable[[np.ndarray, np.ndarray],\
+    np.ndarray], r_values: np.ndarray, x0: float = 0.25,\
+    transient: int = 800, iterations: int = 100,\
+    resolution: Tuple[int, Optional[int]] = (800, None),\
+    x_range: Optional[Tuple[float, float]] = None, workers: int = 1,\
+    block: int = 20000, batch: int = 16)\
+    -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Computes a bifurcation diagram as a density image. The map is iterated for
+    every parameter value at once as one array, and the points after the
+    transient are binned straight into a fixed-size 2-d histogram instead of
+    being stored.
+
+    Parameters
+    ----------
+    - map_fun (function): A vectorized map of the form map_fun(x, r), e.g.
+    logistic or sine. It must be defined at module level to use workers > 1.
+    - r_values (1-d array): The parameter values, in increasing order.
+    - x0 (float): The starting value of x for every parameter.
+    - transient (int): The number of iterations discarded first.
+    - iterations (int): The number of iterations binned after the transient.
+    - resolution (2-tuple): The (height, width) of the image in pixels. A
+    width of None gives one column per parameter, up to 2000 columns; the
+    width is never more than the number of parameters.
+    - x_range (2-tuple): The (min, max) of x covered by the image; estimated
+    from a sample of the parameters if not given.
+    - workers (int): The number of processes to split the parameters over.
+    - block (int): The most parameters iterated at once by one process, which
+    bounds the memory used.
+    - batch (int): The number of iterations binned together.
+
+    Returns
+    -------
+    - image (2-d array): The (height, width) counts of points per pixel, with
+    x increasing along the rows.
+    - r_edges (1-d array): The width + 1 parameter values bounding the columns.
+    - x_edges (1-d array): The height + 1 x values bounding the rows.
+    """
+
+    r = np.asarray(r_values, dtype=float)
+    height, width = resolution
+    if width is None:
+        width = 2000
+    # A column needs at least one parameter value.
+    width = min(width, len(r))
+    if x_range is None:
+        x_range = _estimate_range(map_fun, r, x0, transient)
+
+    # Column of every parameter value; several values share a column when
+    # there are more of them than pixels.
+    columns = (np.arange(len(r)) * width) // len(r)
+
+    work = [(map_fun, r[start:start + block], columns[start:start + block],\
+        x0, transient, iterations, x_range, height, width, batch)\
+        for start in range(0, len(r), block)]
+    if workers > 1 and len(work) > 1:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            images = pool.map(_accumulate_args, work)
+            image = sum(images)
+    else:
+        image = sum(_accumulate_args(item) for item in work)
+
+    # Column edges halfway between the first parameters of neighbouring
+    # columns.
+    first = np.searchsorted(columns, np.arange(width))
+    starts = r[first]
+    r_edges = np.concatenate(([r[0]], (starts[1:] + r[first[1:] - 1]) / 2,\
+        [r[-1]]))
+    x_edges = np.linspace(x_range[0], x_range[1], height + 1)
+
+    return image, r_edges, x_edges
@@ -0,0 +1,225 @@
+import numpy as np
+from typing import Optional, Tuple
+
+
+# The rider of cycling_drag.py.
+C_D = 1.0 # Drag coefficient
+RHO = 1.225 # Density of air, kg/m**3
+AREA = 0.33 # Frontal area of the cyclist, m**2
+MASS = 70.0 # Mass of the cyclist, kg
+G = 9.81
+
+
+class Course:
+    """
+    A course as a sequence of straight segments of constant gradient. The
+    segment containing a position x is the one with edges[i] < x <=
+    edges[i + 1], and the first and last segments carry on past the ends.
+    """
+
+    def __init__(self, edges: np.ndarray, sin_theta: np.ndarray):
+        """
+        Parameters
+        ----------
+        - edges (1-d array): The increasing distances along the course in m
+        where the segments start and end, starting at 0.
+        - sin_theta (1-d array): The sine of the slope of each segment,
+        positive uphill; one fewer than the edges.
+        """
+
+        self.edges = np.asarray(edges, dtype=float)
+        self.sin_theta = np.asarray(sin_theta, dtype=float)
+        if len(self.edges) != len(self.sin_theta) + 1:
+            raise ValueError("A course needs one more edge than segments.")
+        if np.any(np.diff(self.edges) <= 0):
+            raise ValueError("The edges of a course must increase.")
+
+    @classmethod
+    def from_grades(cls, lengths: np.ndarray, angles: np.ndarray) -> 'Course':
+        """
+        A course from the lengths of its segments in m and their slopes in
+        degrees.
+        """
+        edges = np.concatenate(([0.0], np.cumsum(lengths)))
+        return cls(edges, np.sin(np.radians(angles)))
+
+    @classmethod
+    def from_profile(cls, x: np.ndarray, elevation: np.ndarray) -> 'Course':
+        """
+        A course from its elevation in m at increasing horizontal distances
+        x in m, e.g. a surveyed or GPS profile. The distance along the course
+        is measured along the slope.
+        """
+        dx, dh = np.diff(x), np.diff(elevation)
+        length = np.hypot(dx, dh)
+        return cls(np.concatenate(([0.0], np.cumsum(length))), dh / length)
+
+    @property
+    def length(self) -> float:
+        """The length of the course in m."""
+        return self.edges[-1]
+
+    def segment(self, x: np.ndarray) -> np.ndarray:
+        """The index of the segment at each distance x."""
+        return np.clip(np.searchsorted(self.edges, x) - 1, 0,\
+            len(self.sin_theta) - 1)
+
+    def slope(self, x: np.ndarray) -> np.ndarray:
+        """The sine of the slope at each distance x."""
+        return self.sin_theta[self.segment(x)]
+
+
+def three_segment_course(theta: float = 6.0, length: float = 1000.0)\
+    -> Course:
+    """The course of cycling_drag.py: uphill, flat, then downhill."""
+    return Course.from_grades([length]*3, [theta, 0.0, -theta])
+
+
+def simulate_pacing(course: Course, power: np.ndarray,\
+    edges: Optional[np.ndarray] = None, v0: float = 4.0, dx: float = 1.0,\
+    m: float = MASS, C_D: float = C_D, rho: float = RHO, A: float = AREA,\
+    g: float = G) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Rides many pacing plans over a course at once, with the forces of
+    cycling_drag.py. The ride is stepped in distance rather than time: every
+    plan is at the same point of the course on each step, so the slope and
+    the power of every plan are looked up once per step as whole columns,
+    and each plan's finish time is simply its time on the last step.
+
+    Parameters
+    ----------
+    - course (Course): The course to ride.
+    - power (array): The plans, of shape (..., k): each is the power in W
+    over k bins along the course. k = 1 is a constant power, the course's
+    segments give a plan per segment, and k = course length gives a power
+    per metre.
+    - edges (1-d array): The k + 1 distances bounding the bins; k equal bins
+    over the course if not given, e.g. course.edges for its segments.
+    - v0 (float): The starting speed in m/s; it must be above zero.
+    - dx (float): The distance step in m.
+    - m, C_D, rho, A, g (float): The rider and air, as in cycling_drag.py.
+
+    Returns
+    -------
+    - time (array): The finish time of each plan in s, of shape (...); nan
+    for plans that stall on a climb.
+    - energy (array): The work done by the rider up to the finish in J.
+    """
+
+    power = np.asarray(power, dtype=float)
+    shape, k = power.shape[:-1], power.shape[-1]
+    # One contiguous row of every plan's power per bin.
+    power = np.ascontiguousarray(power.reshape(-1, k).T)
+    if edges is None:
+        edges = np.linspace(0, course.length, k + 1)
+    edges = np.asarray(edges, dtype=float)
+
+    steps = int(np.ceil(course.length / dx))
+    points = np.linspace(0, course.length, steps + 1)
+    h = np.diff(points)
+    # The bin and slope of the middle of each step, shared by every plan.
+    middle = points[:-1] + h/2
+    bins = np.clip(np.searchsorted(edges, middle) - 1, 0, k - 1)
+    climb = g * course.slope(middle)
+
+    n = power.shape[1]
+    # The kinetic energy per unit mass, K = v**2/2, obeys
+    # dK/dx = P/(m v) - drag v**2 - g sin(theta).
+    v = np.full(n, float(v0))
+    K = v**2 / 2
+    time = np.zeros(n)
+    energy = np.zeros(n)
+    stalled = np.zeros(n, dtype=bool)
+    drag = 0.5*C_D*rho*A/m
+    for i in range(steps):
+        P = power[bins[i]]
+        K_new = K + h[i]*((P/(m*v)) - (2*drag*K) - climb[i])
+        # A plan that runs out of speed on a climb never finishes.
+        stalled |= K_new <= 0
+        K_new = np.maximum(K_new, 1e-6)
+        v_new = np.sqrt(2*K_new)
+        dt = 2*h[i] / (v + v_new)
+        time += dt
+        energy += P*dt
+        K, v = K_new, v_new
+
+    time[stalled] = np.nan
+    energy[stalled] = np.nan
+
+    return time.reshape(shape), energy.reshape(shape)
+
+
+def optimize_pacing(course: Course, budget: float,\
+    edges: Optional[np.ndarray] = None, initial: Optional[np.ndarray] = None,\
+    population: int = 500, elite: float = 0.1, iterations: int = 20,\
+    spread: float = 0.3, seed: Optional[int] = None, **physics)\
+    -> Tuple[np.ndarray, float, float]:
+    """
+    Searches for the fastest pacing plan over a course that does no more
+    than a given amount of work, with the cross-entropy method. Each
+    iteration draws a population of plans around the current one, scales
+    each to spend the budget, rides them all as one batch with
+    simulate_pacing, and moves to the average of the fastest few. Plans that
+    stall are never chosen.
+
+    Parameters
+    ----------
+    - course (Course): The course to ride.
+    - budget (float): The most work the rider can do, in J.
+    - edges (1-d array): The distances bounding the bins of the plans, as
+    in simulate_pacing; the course's segments if not given.
+    - initial (1-d array): The starting plan; a constant power if not given.
+    - population (int): The number of plans ridden per iteration.
+    - elite (float): The fraction of fastest plans averaged.
+    - iterations (int): The number of iterations.
+    - spread (float): The starting spread of the plans, in log power.
+    - seed (int): The seed of the random plans.
+    - physics: Any further arguments of simulate_pacing, e.g. m or dx.
+
+    Returns
+    -------
+    - plan (1-d array): The fastest plan found, in W per bin.
+    - time (float): Its finish time in s; inf if no plan within the budget
+    finished.
+    - energy (float): The work it does in J.
+    """
+
+    if edges is None:
+        edges = course.edges
+    k = len(edges) - 1
+    rng = np.random.default_rng(seed)
+
+    def ride(plans: np.ndarray) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        # Doing more work also finishes sooner, so the scaling to the
+        # budget is repeated a few times to settle, aiming just under it.
+        for i in range(3):
+            time, energy = simulate_pacing(course, plans, edges, **physics)
+            scale = np.where(np.isfinite(energy),\
+                budget * (1 - 1e-4) / energy, 1.0)
+            plans = plans * scale[:, np.newaxis]
+        time, energy = simulate_pacing(course, plans, edges, **physics)
+        # Plans over the budget or stalled are out of the running.
+        score = np.where(energy <= budget, time, np.inf)
+        return plans, np.nan_to_num(score, nan=np.inf), energy
+
+    if initial is None:
+        initial = np.full(k, 200.0)
+    plans, score, energy = ride(np.asarray(initial, dtype=float)[np.newaxis])
+    best, best_time, best_energy = plans[0], score[0], energy[0]
+    mean = np.log(best)
+    sigma = np.full(k, spread)
+    count = max(2, int(elite * population))
+
+    for iteration in range(iterations):
+        plans = np.exp(mean + sigma * rng.standard_normal((population, k)))
+        plans, score, energy = ride(plans)
+        fastest = np.argsort(score)[:count]
+        if score[fastest[0]] < best_time:
+            best = plans[fastest[0]]
+            best_time, best_energy = score[fastest[0]], energy[fastest[0]]
+        logs = np.log(plans[fastest[np.isfinite(score[fastest])]])
+        if len(logs) >= 2:
+            mean = np.mean(logs, axis=0)
+            sigma = np.maximum(np.std(logs, axis=0), 1e-3)
+
+    return best, float(best_time), float(best_energy)
@@ -0,0 +1,167 @@
+import os
+import re
+import numpy as np
+from itertools import islice
+from typing import Callable, Iterator, List, NamedTuple, Optional
+
+
+class Format(NamedTuple):
+    """
+    How to parse one kind of text data file.
+
+    - dtype (numpy dtype): The structured dtype of one row.
+    - skiprows (int): The number of header lines.
+    - parse (function): Turns a list of data lines into an array of dtype.
+    """
+    dtype: np.dtype
+    skiprows: int
+    parse: Callable[[List[str]], np.ndarray]
+
+
+def columns(dtype: np.dtype) -> Callable[[List[str]], np.ndarray]:
+    """
+    A parser for files of whitespace separated numbers, one per field of
+    dtype in order.
+    """
+
+    dtype = np.dtype(dtype)
+
+    def parse(lines: List[str]) -> np.ndarray:
+        values = np.loadtxt(lines, ndmin=2)
+        rows = np.empty(len(values), dtype=dtype)
+        for i, name in enumerate(dtype.names):
+            rows[name] = values[:, i]
+        return rows
+
+    return parse
+
+
+O2_DTYPE = np.dtype([('date', 'M8[m]'), ('julian_date', 'f8'),\
+    ('value', 'f8'), ('std', 'f8')])
+
+
+def _parse_o2(lines: List[str]) -> np.ndarray:
+    """
+    Parses rows like '11/17/2010  00:49  10321  -487.63  2.5', turning the
+    date and time into one datetime64.
+    """
+
+    table = str.maketrans('/:', '  ')
+    values = np.loadtxt([line.translate(table) for line in lines], ndmin=2)
+    month, day, year, hour, minute = values[:, :5].astype(np.int64).T
+
+    rows = np.empty(len(values), dtype=O2_DTYPE)
+    date = (year - 1970).astype('m8[Y]') + np.datetime64(0, 'Y')
+    date = date.astype('M8[M]') + (month - 1).astype('m8[M]')
+    date = date.astype('M8[D]') + (day - 1).astype('m8[D]')
+    rows['date'] = date.astype('M8[m]')\
+        + ((60 * hour) + minute).astype('m8[m]')
+    rows['julian_date'] = values[:, 5]
+    rows['value'] = values[:, 6]
+    rows['std'] = values[:, 7]
+
+    return rows
+
+
+CSIRO_DTYPE = np.dtype([('year', 'f8'), ('level', 'f8'), ('error', 'f8')])
+
+# The formats of the data files bundled with the repo, by file name.
+FORMATS = {
+    'CSIRO_Recons_gmsl_mo_2011.txt': Format(CSIRO_DTYPE, 1,\
+        columns(CSIRO_DTYPE)),
+    'Global_O2_Concentration_2010_2020.txt': Format(O2_DTYPE, 1, _parse_o2),
+}
+
+_loaded = {}
+
+
+def _data_lines(filename: str, skiprows: int) -> Iterator[str]:
+    """Yields the non-blank lines of a file after its header."""
+
+    with open(filename) as f:
+        for line in islice(f, skiprows, None):
+            if line.strip():
+                yield line
+
+
+def _convert(filename: str, data_format: Format, cache: str,\
+    chunk_size: int) -> None:
+    """
+    Parses a text file a chunk at a time straight into a .npy file, so files
+    larger than memory can be converted.
+    """
+
+    rows = sum(1 for line in _data_lines(filename, data_format.skiprows))
+    partial = cache + '.partial'
+    out = np.lib.format.open_memmap(partial, mode='w+',\
+        dtype=data_format.dtype, shape=(rows,))
+    lines = _data_lines(filename, data_format.skiprows)
+    done = 0
+    while done < rows:
+        chunk = data_format.parse(list(islice(lines, chunk_size)))
+        out[done:done + len(chunk)] = chunk
+        done += len(chunk)
+    out.flush()
+    del out
+    # Only a complete file ever has the cache name.
+    os.replace(partial, cache)
+
+
+def load(filename: str, data_format: Optional[Format] = None,\
+    cache_dir: Optional[str] = None, chunk_size: int = 100000) -> np.ndarray:
+    """
+    Loads a text data file as a structured array. The file is parsed once
+    into a binary .npy cache, which is memory-mapped on every later load, so
+    loading costs nothing but opening the map. The cache is rebuilt whenever
+    the size or modification time of the text file changes.
+
+    Parameters
+    ----------
+    - filename (str): The text file.
+    - data_format (Format): How to parse it; looked up by file name in
+    FORMATS if not given.
+    - cache_dir (str): Where to keep the cache; a .npy_cache directory next
+    to the file by default.
+    - chunk_size (int): The number of lines parsed at once when building the
+    cache.
+
+    Returns
+    -------
+    - data (memmap): A read-only structured array with one record per row,
+    e.g. data['date'] for the dates of the O2 file.
+    """
+
+    if data_format is None:
+        name = os.path.basename(filename)
+        if name not in FORMATS:
+            raise ValueError("No format is known for {0}; pass data_format."\
+                .format(name))
+        data_format = FORMATS[name]
+
+    stat = os.stat(filename)
+    if cache_dir is None:
+        cache_dir = os.path.join(os.path.dirname(os.path.abspath(filename)),\
+            '.npy_cache')
+    base = os.path.basename(filename)
+    cache = os.path.join(cache_dir, '{0}.{1}.{2}.npy'.format(base,\
+        stat.st_size, stat.st_mtime_ns))
+
+    if cache in _loaded:
+        return _loaded[cache]
+    if not os.path.exists(cache):
+        os.makedirs(cache_dir, exist_ok=True)
+        # Older caches of the same file are out of date; those of other
+        # files whose names start the same, e.g. a.txt.bak, are left alone.
+        stale = re.compile(re.escape(base) + r'\.\d+\.\d+\.npy')
+        for old in os.listdir(cache_dir):
+            if stale.fullmatch(old):
+                os.remove(os.path.join(cache_dir, old))
+        _convert(filename, data_format, cache, chunk_size)
+
+    data = np.load(cache, mmap_mode='r')
+    if data.dtype != data_format.dtype:
+        raise ValueError("The cache {0} does not match the format.".format(\
+            cache))
+    _loaded[cache] = data
+
+    return data
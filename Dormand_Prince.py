@@ -0,0 +1,255 @@
+import numpy as np
+from typing import Callable, Optional, Tuple
+
+
+# Butcher tableau of the Dormand-Prince 5(4) pair.
+C = np.array([0, 1/5, 3/10, 4/5, 8/9, 1, 1])
+A = np.array([
+    [0, 0, 0, 0, 0, 0],
+    [1/5, 0, 0, 0, 0, 0],
+    [3/40, 9/40, 0, 0, 0, 0],
+    [44/45, -56/15, 32/9, 0, 0, 0],
+    [19372/6561, -25360/2187, 64448/6561, -212/729, 0, 0],
+    [9017/3168, -355/33, 46732/5247, 49/176, -5103/18656, 0],
+    [35/384, 0, 500/1113, 125/192, -2187/6784, 11/84]])
+B = np.array([35/384, 0, 500/1113, 125/192, -2187/6784, 11/84, 0])
+# Difference between the 5th- and embedded 4th-order weights.
+E = np.array([71/57600, 0, -71/16695, 71/1920, -17253/339200, 22/525, -1/40])
+# Coefficients of the 4th-order continuous extension (Hairer's dense output),
+# one column per power of the normalized step position theta.
+P = np.array([
+    [1, -8048581381/2820520608, 8663915743/2820520608,
+     -12715105075/11282082432],
+    [0, 0, 0, 0],
+    [0, 131558114200/32700410799, -68118460800/10900136933,
+     87487479700/32700410799],
+    [0, -1754552775/470086768, 14199869525/1410260304,
+     -10690763975/1880347072],
+    [0, 127303824393/49829197408, -318862633887/49829197408,
+     701980252875/199316789632],
+    [0, -282668133/205662961, 2019193451/616988883,
+     -1453857185/822651844],
+    [0, 40617522/29380423, -110615467/29380423, 69997945/29380423]])
+
+# Step size controller settings.
+SAFETY = 0.9
+MIN_FACTOR = 0.2
+MAX_FACTOR = 10.0
+
+
+class DenseOutput:
+    """
+    Piecewise 4th-order interpolant over the accepted steps of a
+    Dormand-Prince integration, evaluable at any x inside the integrated range.
+    """
+
+    def __init__(self, x: np.ndarray, y: np.ndarray, h: np.ndarray,\
+        Q: np.ndarray):
+        """
+        Parameters
+        ----------
+        - x (1-d array): The x value at the start of every accepted step.
+        - y (2-d array): The state at the start of every accepted step.
+        - h (1-d array): The size of every accepted step.
+        - Q (3-d array): A (steps, n, 4) array of the interpolant coefficients
+        of every step.
+        """
+
+        self.x = x
+        self.y = y
+        self.h = h
+        self.Q = Q
+
+    def __call__(self, x_eval) -> np.ndarray:
+        """
+        Evaluates the interpolant.
+
+        Parameters
+        ----------
+        - x_eval (float or 1-d array): The x value(s) to evaluate at.
+
+        Returns
+        -------
+        - y (1-d or 2-d array): The state at each x value, one row per value.
+        """
+
+        x_eval = np.asarray(x_eval, dtype=float)
+        scalar = x_eval.ndim == 0
+        x_eval = np.atleast_1d(x_eval)
+
+        # Pick the step containing each x; points at the very end belong to
+        # the last step. Steps run backwards when integrating towards smaller x.
+        sign = 1.0 if self.h[0] >= 0 else -1.0
+        index = np.searchsorted(sign * self.x, sign * x_eval, side='right') - 1
+        index = np.clip(index, 0, len(self.x) - 1)
+        theta = (x_eval - self.x[index]) / self.h[index]
+        powers = np.cumprod(np.repeat(theta[:, np.newaxis], 4, axis=1),\
+            axis=1)
+        y = self.y[index] + self.h[index, np.newaxis]\
+            * np.einsum('mnk,mk->mn', self.Q[index], powers)
+
+        return y[0] if scalar else y
+
+
+def _rms_norm(v: np.ndarray) -> float:
+    """Root-mean-square norm used by the error controller."""
+    return np.linalg.norm(v) / np.sqrt(v.size)
+
+
+def _initial_step(fun: Callable[[float, np.ndarray], np.ndarray], x0: float,\
+    y0: np.ndarray, f0: np.ndarray, direction: float, rtol: float,\
+    atol: float) -> float:
+    """
+    Estimates a starting step size from the size of the state and its first
+    two derivatives (Hairer, Norsett & Wanner, section II.4).
+    """
+
+    scale = atol + (np.abs(y0) * rtol)
+    d0 = _rms_norm(y0 / scale)
+    d1 = _rms_norm(f0 / scale)
+    h0 = 1e-6 if (d0 < 1e-5 or d1 < 1e-5) else 0.01 * d0 / d1
+
+    y1 = y0 + (h0 * direction * f0)
+    f1 = fun(x0 + (h0 * direction), y1)
+    d2 = _rms_norm((f1 - f0) / scale) / h0
+
+    if d1 <= 1e-15 and d2 <= 1e-15:
+        h1 = max(1e-6, h0 * 1e-3)
+    else:
+        h1 = (0.01 / max(d1, d2)) ** (1 / 5)
+
+    return min(100 * h0, h1)
+
+
+def Dormand_Prince(diff_fun: Callable[..., float],\
+    x_span: Tuple[float, float], initial_value: np.ndarray, params: Tuple,\
+    rtol: float = 1e-6, atol: float = 1e-9, first_step: Optional[float] = None,\
+    max_step: float = np.inf, x_eval: Optional[np.ndarray] = None,\
+    system: bool = False, dense_output: bool = False) -> Tuple:
+    """
+    Uses the adaptive-step Dormand-Prince 5(4) algorithm to numerically
+    integrate an arbitrary differential function to a given tolerance.
+
+    Parameters
+    ----------
+    - diff_fun (function): A function of the form f(x, Y, *args). By default,
+    as in Runge_Kutta_4, it returns the value of the highest-order derivative
+    and Y is a vector of y(x) and its lower-order derivatives. With system set,
+    it returns the derivative of every element of Y instead, which allows
+    coupled first-order systems.
+    - x_span (2-tuple): A tuple of the form (min, max) for the range over which
+    x will be integrated.
+    - initial_value (1-d array): An array representing a vector of the initial
+    values for the function and its derivatives.
+    - params (n-tuple): A tuple of any additional parameters for diff_fun.
+    - rtol (float): The relative tolerance of the local error.
+    - atol (float): The absolute tolerance of the local error.
+    - first_step (float): The initial step size; estimated if not given.
+    - max_step (float): The largest step size allowed.
+    - x_eval (1-d array): Optional x values at which to report the solution.
+    They are filled in from the interpolant, so they do not constrain the
+    step size. By default the accepted steps are reported.
+    - system (bool): Whether diff_fun returns the full derivative vector.
+    - dense_output (bool): Whether to also return the interpolant.
+
+    Returns
+    -------
+    - x (1-d array): The x values of the accepted steps, or x_eval.
+    - y (2-d array): A matrix containing the values of the state vector for
+    each x value.
+    - dense (DenseOutput): Only if dense_output is set; a callable giving the
+    state at any x in x_span.
+    """
+
+    if system:
+        def fun(x: float, y: np.ndarray) -> np.ndarray:
+            return np.asarray(diff_fun(x, y, *params), dtype=float)
+    else:
+        def fun(x: float, y: np.ndarray) -> np.ndarray:
+            # The lower-order derivatives are the next entries of the state.
+            dy = np.empty_like(y)
+            dy[:-1] = y[1:]
+            dy[-1] = diff_fun(x, y, *params)
+            return dy
+
+    x_start, x_end = x_span
+    direction = np.sign(x_end - x_start) if x_end != x_start else 1.0
+    y_n = np.array(initial_value, dtype=float)
+    n = len(y_n)
+    x_n = x_start
+
+    f_n = fun(x_n, y_n)
+    if first_step is None:
+        h_abs = _initial_step(fun, x_n, y_n, f_n, direction, rtol, atol)
+    else:
+        h_abs = abs(first_step)
+    h_abs = min(h_abs, max_step)
+
+    xs, ys = [x_n], [y_n.copy()]
+    step_x, step_y, step_h, step_Q = [], [], [], []
+    K = np.empty((7, n))
+
+    while direction * (x_end - x_n) > 0:
+        # Don't step past the end of the range.
+        h_abs = min(h_abs, abs(x_end - x_n))
+        rejected = False
+
+        while True:
+            if h_abs < 10 * np.abs(np.nextafter(x_n, direction * np.inf) - x_n):
+                raise RuntimeError(f"Step size underflow at x = {x_n}.")
+            h = h_abs * direction
+
+            K[0] = f_n
+            for s in range(1, 6):
+                K[s] = fun(x_n + (C[s] * h), y_n + (h * (A[s, :s] @ K[:s])))
+            y_new = y_n + (h * (B[:6] @ K[:6]))
+            x_new = x_n + h
+            # First same as last: the final stage is the next step's first.
+            K[6] = fun(x_new, y_new)
+
+            scale = atol + (np.maximum(np.abs(y_n), np.abs(y_new)) * rtol)
+            error = _rms_norm((h * (E @ K)) / scale)
+
+            if error <= 1:
+                if error == 0:
+                    factor = MAX_FACTOR
+                else:
+                    factor = min(MAX_FACTOR, SAFETY * error ** (-1 / 5))
+                # Don't grow straight after a rejection.
+                if rejected:
+                    factor = min(1.0, factor)
+                break
+
+            h_abs *= max(MIN_FACTOR, SAFETY * error ** (-1 / 5))
+            rejected = True
+
+        if dense_output or x_eval is not None:
+            step_x.append(x_n)
+            step_y.append(y_n)
+            step_h.append(h)
+            step_Q.append(K.T @ P)
+
+        x_n, y_n, f_n = x_new, y_new, K[6].copy()
+        xs.append(x_n)
+        ys.append(y_n)
+        h_abs = min(h_abs * factor, max_step)
+
+    dense = None
+    if dense_output or x_eval is not None:
+        if step_x:
+            dense = DenseOutput(np.array(step_x), np.array(step_y),\
+                np.array(step_h), np.array(step_Q))
+        else:
+            dense = DenseOutput(np.array([x_n]), np.array([y_n]),\
+                np.ones(1), np.zeros((1, n, 4)))
+
+    if x_eval is not None:
+        x = np.asarray(x_eval, dtype=float)
+        y = dense(x)
+    else:
+        x = np.array(xs)
+        y = np.array(ys)
+
+    if dense_output:
+        return x, y, dense
+    return x, y
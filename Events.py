@@ -0,0 +1,122 @@
+import numpy as np
+from scipy.optimize import brentq
+from typing import Callable, List, Sequence, Tuple
+
+
+def event_settings(events: Sequence[Callable[..., float]])\
+    -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Reads the optional terminal and direction attributes of event functions.
+
+    An event function has the form g(x, Y, *args) and an event occurs where it
+    crosses zero. As in scipy's solve_ivp, it may carry two attributes:
+    - terminal (bool or int): True stops the integration at the first
+    occurrence, an int n stops it at the n-th. False (the default) only counts.
+    - direction (float): Only crossings from negative to positive are recorded
+    if positive, only from positive to negative if negative, both if 0 (the
+    default).
+
+    Parameters
+    ----------
+    - events (sequence of functions): The event functions.
+
+    Returns
+    -------
+    - max_count (1-d array): The number of occurrences after which each event
+    stops the integration; 0 for non-terminal events.
+    - direction (1-d array): The crossing direction of each event.
+    """
+
+    max_count = np.array([int(getattr(g, 'terminal', False)) for g in events])
+    direction = np.array([np.sign(getattr(g, 'direction', 0)) for g in events])
+
+    return max_count, direction
+
+
+def hermite(x0: float, x1: float, y0: np.ndarray, y1: np.ndarray,\
+    f0: np.ndarray, f1: np.ndarray, x: float) -> np.ndarray:
+    """
+    Evaluates the cubic Hermite interpolant of a step, which matches the
+    state and its derivative at both ends.
+
+    Parameters
+    ----------
+    - x0, x1 (float): The x values at the start and end of the step.
+    - y0, y1 (float or array): The state at x0 and x1.
+    - f0, f1 (float or array): The derivative of the state at x0 and x1.
+    - x (float): Where to evaluate the interpolant.
+
+    Returns
+    -------
+    - y (float or array): The interpolated state at x.
+    """
+
+    h = x1 - x0
+    s = (x - x0) / h
+    h00 = (1 + (2 * s)) * (1 - s) ** 2
+    h10 = s * (1 - s) ** 2
+    h01 = s ** 2 * (3 - (2 * s))
+    h11 = s ** 2 * (s - 1)
+
+    return (h00 * y0) + (h10 * h * f0) + (h01 * y1) + (h11 * h * f1)
+
+
+def crossings(g0: np.ndarray, g1: np.ndarray, direction: np.ndarray)\
+    -> np.ndarray:
+    """
+    Finds which events changed sign over a step in their allowed direction.
+    A value that lands exactly on zero counts at the end of a step, so it is
+    not found again at the start of the next one.
+
+    Parameters
+    ----------
+    - g0, g1 (1-d array): The event function values at the start and end.
+    - direction (1-d array): The crossing direction of each event.
+
+    Returns
+    -------
+    - active (1-d array): The indices of the events that crossed zero.
+    """
+
+    up = (g0 < 0) & (g1 >= 0)
+    down = (g0 > 0) & (g1 <= 0)
+    mask = (up & (direction >= 0)) | (down & (direction <= 0))
+
+    return np.nonzero(mask)[0]
+
+
+def locate(events: Sequence[Callable[..., float]], active: np.ndarray,\
+    params: Tuple, x0: float, x1: float, y0: np.ndarray, y1: np.ndarray,\
+    f0: np.ndarray, f1: np.ndarray, xtol: float)\
+    -> List[Tuple[int, float, np.ndarray]]:
+    """
+    Refines the events that crossed zero over a step by root-finding on the
+    step's Hermite interpolant.
+
+    Parameters
+    ----------
+    - events (sequence of functions): The event functions.
+    - active (1-d array): The indices of the events to locate.
+    - params (n-tuple): Any additional parameters of the event functions.
+    - x0, x1, y0, y1, f0, f1: The step, as in hermite.
+    - xtol (float): The tolerance on the x value of each event.
+
+    Returns
+    -------
+    - found (list): Tuples of (event index, x, state) ordered along the
+    direction of integration.
+    """
+
+    found = []
+    for i in active:
+        def g(x: float) -> float:
+            return events[i](x, hermite(x0, x1, y0, y1, f0, f1, x), *params)
+
+        lo, hi = min(x0, x1), max(x0, x1)
+        x_root = brentq(g, lo, hi, xtol=xtol)
+        found.append((i, x_root, hermite(x0, x1, y0, y1, f0, f1, x_root)))
+
+    sign = 1.0 if x1 >= x0 else -1.0
+    found.sort(key=lambda event: sign * event[1])
+
+    return found
@@ -0,0 +1,142 @@
+import numpy as np
+from typing import Callable, NamedTuple, Tuple, Union
+
+
+class Tableau(NamedTuple):
+    """
+    The Butcher tableau of an explicit Runge-Kutta method.
+
+    - A (2-d array): The (s, s) strictly lower-triangular stage coefficients.
+    - b (1-d array): The s weights of the stages in the solution.
+    - c (1-d array): The s fractions of the step at which stages are evaluated.
+    - order (int): The order of accuracy of the method.
+    - fsal (bool): First same as last; the final stage is evaluated at the new
+    solution, so it doubles as the first stage of the next step.
+    """
+
+    A: np.ndarray
+    b: np.ndarray
+    c: np.ndarray
+    order: int
+    fsal: bool = False
+
+
+def _tableau(A, b, c, order: int, fsal: bool = False) -> Tableau:
+    """Builds a Tableau from nested lists."""
+    return Tableau(np.array(A, dtype=float), np.array(b, dtype=float),\
+        np.array(c, dtype=float), order, fsal)
+
+
+TABLEAUX = {
+    'euler': _tableau([[0]], [1], [0], 1),
+    'heun': _tableau([[0, 0], [1, 0]], [1/2, 1/2], [0, 1], 2),
+    'midpoint': _tableau([[0, 0], [1/2, 0]], [0, 1], [0, 1/2], 2),
+    'ralston': _tableau([[0, 0], [2/3, 0]], [1/4, 3/4], [0, 2/3], 2),
+    'bogacki_shampine': _tableau(
+        [[0, 0, 0, 0], [1/2, 0, 0, 0], [0, 3/4, 0, 0], [2/9, 1/3, 4/9, 0]],
+        [2/9, 1/3, 4/9, 0], [0, 1/2, 3/4, 1], 3, fsal=True),
+    'rk4': _tableau(
+        [[0, 0, 0, 0], [1/2, 0, 0, 0], [0, 1/2, 0, 0], [0, 0, 1, 0]],
+        [1/6, 1/3, 1/3, 1/6], [0, 1/2, 1/2, 1], 4),
+    '3/8': _tableau(
+        [[0, 0, 0, 0], [1/3, 0, 0, 0], [-1/3, 1, 0, 0], [1, -1, 1, 0]],
+        [1/8, 3/8, 3/8, 1/8], [0, 1/3, 2/3, 1], 4),
+}
+
+
+def Explicit_RK(diff_fun: Callable[..., float],\
+    x_range: Tuple[float, float, float], initial_value: np.ndarray,\
+    params: Tuple, method: Union[str, Tableau] = 'rk4',\
+    system: bool = False) -> Tuple[np.ndarray, np.ndarray, int]:
+    """
+    Numerically integrates an arbitrary differential function with any
+    explicit Runge-Kutta method given by its Butcher tableau.
+
+    Runge_Kutta_4 and Heun.Heun keep loops of their own: the fused RK4 step
+    and Heun's scalar loop are faster than the general stage sums here, and
+    they carry the events, streaming and numba options this engine lacks.
+
+    Parameters
+    ----------
+    - diff_fun (function): A function of the form f(x, Y, *args). By default,
+    as in Runge_Kutta_4, it returns the value of the highest-order derivative
+    and Y is a vector of y(x) and its lower-order derivatives. With system set,
+    it returns the derivative of every element of Y instead.
+    - x_range (3-tuple): A tuple of the form (min, max, step) for the values
+    over which x will be evaluated.
+    - initial_value (1-d array): An array representing a vector of the initial
+    values for the function and its derivatives.
+    - params (n-tuple): A tuple of any additional parameters for diff_fun.
+    - method (str or Tableau): One of the names in TABLEAUX ('euler', 'heun',
+    'midpoint', 'ralston', 'bogacki_shampine', 'rk4', '3/8'), or a Tableau.
+    - system (bool): Whether diff_fun returns the full derivative vector.
+
+    Returns
+    -------
+    - x (1-d array): The x values over the given range.
+    - y (2-d array): A matrix containing the values of the state vector for
+    each x value.
+    - nfev (int): The number of times diff_fun was evaluated.
+    """
+
+    if isinstance(method, str):
+        try:
+            method = TABLEAUX[method.lower()]
+        except KeyError:
+            raise ValueError(f"Unknown method {method!r}; expected one of "\
+                f"{sorted(TABLEAUX)} or a Tableau.") from None
+    A, b, c, order, fsal = method
+    stages = len(b)
+
+    # Only the nonzero coefficients of each row take part in the sums.
+    rows = [np.nonzero(A[i, :i])[0] for i in range(stages)]
+    weights = np.nonzero(b)[0]
+
+    # Extract the time step for ease of use and readability.
+    dx = x_range[2]
+    x = np.arange(x_range[0], x_range[1] + dx, dx)
+    num_steps = len(x)
+    vec_size = len(initial_value)
+    y = np.empty((num_steps, vec_size))
+    y[0] = initial_value
+
+    # One row per stage, holding dY/dx at that stage, plus the trial state.
+    K = np.empty((stages, vec_size))
+    y_trial = np.empty(vec_size)
+    nfev = 0
+
+    def derivative(x_s: float, y_s: np.ndarray, k: np.ndarray) -> None:
+        if system:
+            k[:] = diff_fun(x_s, y_s, *params)
+        else:
+            k[:-1] = y_s[1:]
+            k[-1] = diff_fun(x_s, y_s, *params)
+
+    have_first = False
+    for n in range(1, num_steps):
+        x_prev = x[n-1]
+        y_prev = y[n-1]
+
+        for i in range(stages):
+            if i == 0 and have_first:
+                # FSAL: already evaluated at the end of the last step.
+                continue
+            if len(rows[i]) == 0:
+                y_s = y_prev
+            else:
+                np.dot(A[i, rows[i]], K[rows[i]], out=y_trial)
+                y_trial *= dx
+                y_trial += y_prev
+                y_s = y_trial
+            derivative(x_prev + (c[i] * dx), y_s, K[i])
+            nfev += 1
+
+        np.dot(b[weights], K[weights], out=y_trial)
+        y_trial *= dx
+        np.add(y_prev, y_trial, out=y[n])
+
+        if fsal:
+            K[0] = K[-1]
+            have_first = True
+
+    return x, y, nfev
@@ -1,10 +1,13 @@
 import numpy as np
-from typing import Callable, Tuple
+import Events
+import JIT_Backend
+from typing import Callable, Optional, Sequence, Tuple
 
 
 def Heun(func: Callable[..., float], params: Tuple,\
-    frange: Tuple[float, float, float], y0: float)\
-    -> Tuple[np.ndarray, np.ndarray]:
+    frange: Tuple[float, float, float], y0: float,\
+    events: Optional[Sequence[Callable[..., float]]] = None,\
+    event_xtol: float = 1e-12, backend: str = 'numpy') -> Tuple:
     """
     A generic implementation of Heun's method for finding the antiderivative of 
     a given function.
@@ -17,11 +20,24 @@ def Heun(func: Callable[..., float], params: Tuple,\
     - frange (3-tuple): The range of x values to be passed into func in the 
     form (min, max, step).
     - y0 (float): The value of y at the minimum value of x given in frange.
+    - events (sequence of functions): Optional event functions of the form
+    g(x, y, *args), with the terminal and direction attributes described in
+    Events.event_settings. Each zero crossing is located to event_xtol on the
+    cubic Hermite interpolant of its step.
+    - event_xtol (float): The tolerance on the x value of each event.
+    - backend (str): 'numpy', or 'numba' to compile the loop together with 
+    func. Falls back to 'numpy' when numba is not installed or func can't be 
+    compiled. Not used with events.
 
     Returns
     -------
     - x (ndarray): The x values of the antiderivative over the given range.
-    - y (ndarray): The y values of the antiderivative over the given range.
+    - y (ndarray): The y values of the antiderivative over the given range. If
+    a terminal event stopped the integration, the arrays end at the event.
+    - x_events (list of ndarrays): Only if events are given; the x values at
+    which each event occurred.
+    - y_events (list of ndarrays): Only if events are given; the y values at
+    each of those x values.
     """
 
     # Unpack the range tuple into useable values. Don't unpack params here, 
@@ -33,11 +49,46 @@ def Heun(func: Callable[..., float], params: Tuple,\
     y: np.ndarray[float] = np.zeros(n)
     y[0] = y0
 
+    if backend == 'numba' and events is None\
+        and JIT_Backend.Heun(func, x, y, params):
+        return x, y
+
+    if events is not None:
+        max_count, direction = Events.event_settings(events)
+        counts = np.zeros(len(events), dtype=int)
+        x_events = [[] for g in events]
+        y_events = [[] for g in events]
+        g0 = np.array([g(x[0], y[0], *params) for g in events])
+
     # Fill out the arrays using Heun's method to refine the estimate given by 
     # Euler's method.
     for i in range(1, n):
-        y_euler = y[i-1] + (func(x[i-1], y[i-1], *params) * step)
-        y[i] = y[i-1] + ((1 / 2) * (func(x[i-1], y[i-1], *params)\
-            + func(x[i], y_euler, *params)) * step)
+        slope = func(x[i-1], y[i-1], *params)
+        y_euler = y[i-1] + (slope * step)
+        y[i] = y[i-1] + ((1 / 2) * (slope + func(x[i], y_euler, *params))\
+            * step)
+
+        if events is None:
+            continue
+        g1 = np.array([g(x[i], y[i], *params) for g in events])
+        active = Events.crossings(g0, g1, direction)
+        if len(active) > 0:
+            found = Events.locate(events, active, params, x[i-1], x[i],\
+                y[i-1], y[i], slope, func(x[i], y[i], *params), event_xtol)
+            for j, x_root, y_root in found:
+                counts[j] += 1
+                x_events[j].append(x_root)
+                y_events[j].append(y_root)
+                if max_count[j] and counts[j] >= max_count[j]:
+                    # Stop at the event itself.
+                    x, y = x[:i+1], y[:i+1]
+                    x[i], y[i] = x_root, y_root
+                    return x, y, [np.array(x_e) for x_e in x_events],\
+                        [np.array(y_e) for y_e in y_events]
+        g0 = g1
+
+    if events is not None:
+        return x, y, [np.array(x_e) for x_e in x_events],\
+            [np.array(y_e) for y_e in y_events]
 
-    return x, y
\ No newline at end of file
+    return x, y
@@ -0,0 +1,183 @@
+"""
+Optional numba backend for the fixed-step integrators.
+
+The whole stepping loop is compiled together with the user's right-hand side,
+so no Python code runs between steps. numba is not a requirement: when it is
+not installed, or the right-hand side can't be compiled, the functions here
+return False and the caller carries on with its pure NumPy loop.
+"""
+
+import numpy as np
+from typing import Callable, Dict, Set, Tuple
+
+try:
+    import numba
+    from numba.core import errors as numba_errors
+    # Unsupported bytecode is not a NumbaError in recent releases.
+    COMPILE_ERRORS = (numba_errors.NumbaError,) + tuple(\
+        getattr(numba_errors, name) for name in ['UnsupportedBytecodeError']\
+        if hasattr(numba_errors, name))
+except ImportError:
+    numba = None
+
+
+# The stepping loops compiled for each user function, built on first use so
+# that importing this module stays cheap. numba specializes a loop for every
+# function passed to it and keeps that specialization for as long as the loop
+# lives, so each (kind, func) gets a loop of its own, and only the most
+# recently used few are kept: every fresh lambda or closure is a new key.
+# Each entry also holds the argument types that failed to compile for that
+# func, so they are not tried again while other types still are.
+_kernels: Dict[Tuple[str, Callable], Tuple[Callable, Callable, Set[Tuple]]]\
+    = {}
+_CACHE_SIZE = 32
+
+
+def available() -> bool:
+    """Whether numba is installed."""
+    return numba is not None
+
+
+def _remember(cache: Dict, key, value) -> None:
+    """Stores value in cache as the most recent entry, dropping the oldest."""
+    cache.pop(key, None)
+    if len(cache) >= _CACHE_SIZE:
+        cache.pop(next(iter(cache)))
+    cache[key] = value
+
+
+def _rk4_loop(f, x, y, params):
+    # Plain loops; numba turns these into tight machine code.
+    num_steps, n = y.shape
+    dx = x[1] - x[0]
+    k1 = np.empty(n)
+    k2 = np.empty(n)
+    k3 = np.empty(n)
+    k4 = np.empty(n)
+    y_trial = np.empty(n)
+
+    for s in range(1, num_steps):
+        x0 = x[s-1]
+        y0 = y[s-1]
+
+        for j in range(n - 1):
+            k1[j] = y0[j+1] * dx
+        k1[n-1] = f(x0, y0, *params) * dx
+
+        for j in range(n):
+            y_trial[j] = y0[j] + (k1[j] / 2)
+        for j in range(n - 1):
+            k2[j] = y_trial[j+1] * dx
+        k2[n-1] = f(x0 + (dx / 2), y_trial, *params) * dx
+
+        for j in range(n):
+            y_trial[j] = y0[j] + (k2[j] / 2)
+        for j in range(n - 1):
+            k3[j] = y_trial[j+1] * dx
+        k3[n-1] = f(x0 + (dx / 2), y_trial, *params) * dx
+
+        for j in range(n):
+            y_trial[j] = y0[j] + k3[j]
+        for j in range(n - 1):
+            k4[j] = y_trial[j+1] * dx
+        k4[n-1] = f(x0 + dx, y_trial, *params) * dx
+
+        for j in range(n):
+            y[s, j] = y0[j] + ((k1[j] + (2 * k2[j]) + (2 * k3[j]) + k4[j]) / 6)
+
+
+def _heun_loop(f, x, y, params):
+    step = x[1] - x[0]
+
+    for i in range(1, len(x)):
+        slope = f(x[i-1], y[i-1], *params)
+        y_euler = y[i-1] + (slope * step)
+        y[i] = y[i-1] + ((1 / 2) * (slope + f(x[i], y_euler, *params)) * step)
+
+
+_PYTHON_LOOPS = {'rk4': _rk4_loop, 'heun': _heun_loop}
+
+
+def _run(kind: str, func: Callable, x: np.ndarray, y: np.ndarray,\
+    params: Tuple) -> bool:
+    """
+    Runs one of the compiled loops, compiling it and func first if needed.
+
+    Returns
+    -------
+    - success (bool): False if numba is missing or compilation failed, in
+    which case y may be partially written and should be recomputed.
+    """
+
+    if numba is None or len(x) < 2:
+        return False
+    params = tuple(params)
+    try:
+        signature = tuple(numba.typeof(a) for a in (x, y) + params)
+    except ValueError:
+        # numba has no type for one of the arguments.
+        return False
+
+    key = (kind, func)
+    entry = _kernels.get(key)
+    if entry is None:
+        # Accept functions the caller already decorated with njit.
+        compiled = func if hasattr(func, 'py_func') else numba.njit(func)
+        entry = (numba.njit(_PYTHON_LOOPS[kind]), compiled, set())
+    _remember(_kernels, key, entry)
+    kernel, compiled, failed = entry
+    if signature in failed:
+        # Compiling it for these argument types failed before.
+        return False
+
+    try:
+        kernel(compiled, x, y, params)
+    except COMPILE_ERRORS:
+        # Not compilable in nopython mode for these arguments; remember that
+        # so we don't retry them.
+        failed.add(signature)
+        return False
+
+    return True
+
+
+def Runge_Kutta_4(diff_fun: Callable[..., float], x: np.ndarray,\
+    y: np.ndarray, params: Tuple) -> bool:
+    """
+    Fills in y with the compiled RK4 loop used by Runge_Kutta_4.
+
+    Parameters
+    ----------
+    - diff_fun (function): As in Runge_Kutta_4.Runge_Kutta_4; it must be
+    compilable by numba in nopython mode.
+    - x (1-d array): The evenly spaced x values.
+    - y (2-d array): The (num_steps, n) output with the initial value in y[0].
+    - params (n-tuple): Any additional numeric parameters for diff_fun.
+
+    Returns
+    -------
+    - success (bool): Whether the compiled backend was used.
+    """
+
+    return _run('rk4', diff_fun, x, y, params)
+
+
+def Heun(func: Callable[..., float], x: np.ndarray, y: np.ndarray,\
+    params: Tuple) -> bool:
+    """
+    Fills in y with the compiled loop used by Heun.Heun.
+
+    Parameters
+    ----------
+    - func (function): As in Heun.Heun; it must be compilable by numba in
+    nopython mode.
+    - x (1-d array): The evenly spaced x values.
+    - y (1-d array): The output with the initial value in y[0].
+    - params (n-tuple): Any additional numeric parameters for func.
+
+    Returns
+    -------
+    - success (bool): Whether the compiled backend was used.
+    """
+
+    return _run('heun', func, x, y, params)
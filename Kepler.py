@@ -0,0 +1,239 @@
+import numpy as np
+from Dormand_Prince import Dormand_Prince
+from typing import Callable, Optional, Tuple
+
+
+def stumpff_C(z: np.ndarray) -> np.ndarray:
+    """
+    The Stumpff function C(z) = (1 - cos(sqrt(z))) / z, continued to z <= 0.
+    """
+
+    z = np.asarray(z, dtype=float)
+    out = np.empty_like(z)
+    pos, neg = z > 1e-8, z < -1e-8
+    small = ~(pos | neg)
+    s = np.sqrt(z[pos])
+    out[pos] = (1 - np.cos(s)) / z[pos]
+    s = np.sqrt(-z[neg])
+    out[neg] = (np.cosh(s) - 1) / -z[neg]
+    out[small] = (1 / 2) - (z[small] / 24) + (z[small] ** 2 / 720)
+
+    return out
+
+
+def stumpff_S(z: np.ndarray) -> np.ndarray:
+    """
+    The Stumpff function S(z) = (sqrt(z) - sin(sqrt(z))) / sqrt(z)^3,
+    continued to z <= 0.
+    """
+
+    z = np.asarray(z, dtype=float)
+    out = np.empty_like(z)
+    pos, neg = z > 1e-8, z < -1e-8
+    small = ~(pos | neg)
+    s = np.sqrt(z[pos])
+    out[pos] = (s - np.sin(s)) / s ** 3
+    s = np.sqrt(-z[neg])
+    out[neg] = (np.sinh(s) - s) / s ** 3
+    out[small] = (1 / 6) - (z[small] / 120) + (z[small] ** 2 / 5040)
+
+    return out
+
+
+def orbital_elements(r0: np.ndarray, v0: np.ndarray, mu: float) -> dict:
+    """
+    Converts a state vector into classical orbital elements.
+
+    Parameters
+    ----------
+    - r0 (1-d array): The position relative to the central body.
+    - v0 (1-d array): The velocity relative to the central body.
+    - mu (float): The gravitational parameter G * (M + m).
+
+    Returns
+    -------
+    - elements (dict): 'a' (semi-major axis, negative for hyperbolas), 'e'
+    (eccentricity), 'i' (inclination), 'Omega' (longitude of the ascending
+    node), 'omega' (argument of periapsis), 'nu' (true anomaly), all angles
+    in radians, and 'period' (inf unless the orbit is bound).
+    """
+
+    r0 = np.asarray(r0, dtype=float)
+    v0 = np.asarray(v0, dtype=float)
+    r = np.linalg.norm(r0)
+    h = np.cross(r0, v0)
+    h_norm = np.linalg.norm(h)
+    e_vec = (np.cross(v0, h) / mu) - (r0 / r)
+    e = np.linalg.norm(e_vec)
+    alpha = (2 / r) - (np.dot(v0, v0) / mu)
+    a = 1 / alpha if alpha != 0 else np.inf
+
+    i = np.arccos(np.clip(h[2] / h_norm, -1, 1))
+    node = np.cross([0, 0, 1], h)
+    node_norm = np.linalg.norm(node)
+    Omega = np.arctan2(node[1], node[0]) % (2 * np.pi) if node_norm > 0\
+        else 0.0
+
+    # Angles in the orbital plane, measured from the node (or the x axis for
+    # equatorial orbits) and from periapsis (or the node for circular ones).
+    reference = node / node_norm if node_norm > 0 else np.array([1.0, 0, 0])
+    normal = h / h_norm
+    def angle(u: np.ndarray) -> float:
+        return np.arctan2(np.dot(np.cross(reference, u), normal),\
+            np.dot(reference, u)) % (2 * np.pi)
+    if e > 1e-12:
+        omega = angle(e_vec)
+        nu = (angle(r0) - omega) % (2 * np.pi)
+    else:
+        omega = 0.0
+        nu = angle(r0)
+
+    period = 2 * np.pi * np.sqrt(a ** 3 / mu) if alpha > 0 else np.inf
+
+    return {'a': a, 'e': e, 'i': i, 'Omega': Omega, 'omega': omega, 'nu': nu,\
+        'period': period}
+
+
+def Kepler(r0: np.ndarray, v0: np.ndarray, mu: float, t: np.ndarray,\
+    perturbation: Optional[Callable[..., np.ndarray]] = None,\
+    params: Tuple = (), tol: float = 1e-12, max_iter: int = 50,\
+    rtol: float = 1e-10, atol: float = 1e-6)\
+    -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Propagates a two-body orbit to any number of times at once by solving
+    Kepler's equation in universal variables, which covers elliptic,
+    parabolic and hyperbolic orbits alike.
+
+    Parameters
+    ----------
+    - r0 (1-d array): The position at t = 0 relative to the central body.
+    - v0 (1-d array): The velocity at t = 0.
+    - mu (float): The gravitational parameter G * (M + m).
+    - t (float or 1-d array): The times to evaluate, relative to t = 0.
+    - perturbation (function): An optional extra acceleration of the form
+    perturbation(t, r, v, *params). When given, there is no closed form, so
+    the orbit is integrated numerically with Dormand_Prince instead.
+    - params (n-tuple): Any additional parameters of perturbation.
+    - tol (float): The tolerance on the universal anomaly, relative to its
+    size.
+    - max_iter (int): The most Newton iterations per time.
+    - rtol, atol (float): The tolerances of the numerical integration used
+    with a perturbation.
+
+    Returns
+    -------
+    - r (2-d array): The positions, one row per time.
+    - v (2-d array): The velocities, one row per time.
+    """
+
+    r0 = np.asarray(r0, dtype=float)
+    v0 = np.asarray(v0, dtype=float)
+    t = np.asarray(t, dtype=float)
+    scalar = t.ndim == 0
+    t = np.atleast_1d(t)
+
+    if perturbation is not None:
+        r, v = _integrate(r0, v0, mu, t, perturbation, params, rtol, atol)
+        return (r[0], v[0]) if scalar else (r, v)
+
+    # Everything that doesn't depend on time is computed once.
+    r0_norm = np.linalg.norm(r0)
+    vr0 = np.dot(r0, v0) / r0_norm
+    alpha = (2 / r0_norm) - (np.dot(v0, v0) / mu)
+    sqrt_mu = np.sqrt(mu)
+    elements = orbital_elements(r0, v0, mu)
+
+    # A bound orbit repeats, so only the time since the last full period
+    # matters; this keeps Newton's method well started for any epoch.
+    dt = t % elements['period'] if np.isfinite(elements['period']) else t.copy()
+
+    chi = _initial_anomaly(dt, r0, v0, r0_norm, vr0, alpha, mu)
+    active = np.ones(len(dt), dtype=bool)
+    for iteration in range(max_iter):
+        c = chi[active]
+        z = alpha * c ** 2
+        C, S = stumpff_C(z), stumpff_S(z)
+        F = (r0_norm * vr0 / sqrt_mu * c ** 2 * C)\
+            + ((1 - (alpha * r0_norm)) * c ** 3 * S) + (r0_norm * c)\
+            - (sqrt_mu * dt[active])
+        dF = (r0_norm * vr0 / sqrt_mu * c * (1 - (z * S)))\
+            + ((1 - (alpha * r0_norm)) * c ** 2 * C) + r0_norm
+        step = F / dF
+        chi[active] = c - step
+        converged = np.abs(step) <= tol * np.maximum(1.0, np.abs(c))
+        active[np.nonzero(active)[0][converged]] = False
+        if not np.any(active):
+            break
+    else:
+        raise RuntimeError(f"Kepler's equation did not converge for "\
+            f"{np.count_nonzero(active)} times.")
+
+    # Lagrange coefficients.
+    z = alpha * chi ** 2
+    C, S = stumpff_C(z), stumpff_S(z)
+    f = 1 - (chi ** 2 / r0_norm * C)
+    g = dt - (chi ** 3 / sqrt_mu * S)
+    r = (f[:, np.newaxis] * r0) + (g[:, np.newaxis] * v0)
+    r_norm = np.linalg.norm(r, axis=1)
+    f_dot = sqrt_mu / (r_norm * r0_norm) * ((z * chi * S) - chi)
+    g_dot = 1 - (chi ** 2 / r_norm * C)
+    v = (f_dot[:, np.newaxis] * r0) + (g_dot[:, np.newaxis] * v0)
+
+    return (r[0], v[0]) if scalar else (r, v)
+
+
+def _initial_anomaly(dt: np.ndarray, r0: np.ndarray, v0: np.ndarray,\
+    r0_norm: float, vr0: float, alpha: float, mu: float) -> np.ndarray:
+    """
+    Starting guesses for the universal anomaly (Vallado, algorithm 8).
+    """
+
+    sqrt_mu = np.sqrt(mu)
+    if alpha > 1e-12:
+        return sqrt_mu * dt * alpha
+    if alpha < -1e-12:
+        a = 1 / alpha
+        sign = np.where(dt >= 0, 1.0, -1.0)
+        argument = (-2 * mu * alpha * dt) / ((np.dot(r0, v0)) + (sign\
+            * np.sqrt(-mu * a) * (1 - (r0_norm * alpha))))
+        # Very short times can make the logarithm invalid; start at zero.
+        with np.errstate(invalid='ignore', divide='ignore'):
+            guess = sign * np.sqrt(-a) * np.log(argument)
+        return np.where(np.isfinite(guess), guess, sqrt_mu * dt / r0_norm)
+
+    # Parabolic: solve Barker's equation through the semi-latus rectum.
+    h = np.cross(r0, v0)
+    p = np.dot(h, h) / mu
+    s = 0.5 * np.arctan(1 / (3 * np.sqrt(mu / p ** 3) * dt + 1e-300))
+    w = np.arctan(np.cbrt(np.tan(s)))
+    return np.sqrt(p) * 2 / np.tan(2 * w)
+
+
+def _integrate(r0: np.ndarray, v0: np.ndarray, mu: float, t: np.ndarray,\
+    perturbation: Callable[..., np.ndarray], params: Tuple, rtol: float,\
+    atol: float) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Numerical fallback for perturbed orbits.
+    """
+
+    dim = len(r0)
+    def motion(time: float, state: np.ndarray) -> np.ndarray:
+        r, v = state[:dim], state[dim:]
+        a = (-mu * r / np.linalg.norm(r) ** 3)\
+            + perturbation(time, r, v, *params)
+        return np.concatenate((v, a))
+
+    state0 = np.concatenate((r0, v0))
+    r = np.empty((len(t), dim))
+    v = np.empty((len(t), dim))
+    # Integrate forwards and backwards from t = 0 as needed.
+    for side in (t >= 0, t < 0):
+        if not np.any(side):
+            continue
+        t_side = t[side]
+        end = t_side.max() if t_side[0] >= 0 else t_side.min()
+        x, y = Dormand_Prince(motion, (0.0, end), state0, (), rtol=rtol,\
+            atol=atol, x_eval=t_side, system=True)
+        r[side], v[side] = y[:, :dim], y[:, dim:]
+
+    return r, v
@@ -0,0 +1,334 @@
+import os
+import numpy as np
+from concurrent.futures import ProcessPoolExecutor
+from itertools import islice
+from typing import Iterable, Iterator, Optional, Sequence, Tuple
+
+
+def least_squares(x: np.ndarray, y: np.ndarray)\
+    -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Calculates the least squares straight line y = A + B x for one data set,
+    or for many at once.
+
+    Parameters
+    ----------
+    - x (array): The x data, with the points along the last axis. Any leading
+    axes index separate data sets, e.g. (trials, N) for Monte Carlo trials.
+    - y (array): The y data, of the same shape (or broadcastable to it).
+
+    Returns
+    -------
+    - A (array): The intercept of each data set.
+    - sigma_A (array): Its uncertainty.
+    - B (array): The slope of each data set.
+    - sigma_B (array): Its uncertainty.
+    """
+
+    x, y = np.broadcast_arrays(np.asarray(x, dtype=float),\
+        np.asarray(y, dtype=float))
+    N = x.shape[-1]
+
+    # Perform the sums
+    sum_x = np.sum(x, axis=-1)
+    sum_y = np.sum(y, axis=-1)
+    sum_xx = np.einsum('...i,...i->...', x, x)
+    sum_xy = np.einsum('...i,...i->...', x, y)
+
+    # Now calculate the coefficients
+    delta = (N * sum_xx) - sum_x**2
+    A = (sum_xx * sum_y - sum_x * sum_xy) / delta
+    B = (N * sum_xy - sum_x * sum_y) / delta
+    # The residual scatter is shared by both uncertainties; compute it once.
+    residuals = y - (A[..., np.newaxis] + (B[..., np.newaxis] * x))
+    scatter = np.sqrt(np.einsum('...i,...i->...', residuals, residuals)\
+        / (N - 2))
+    sigma_A = scatter * np.sqrt(sum_xx / delta)
+    sigma_B = scatter * np.sqrt(N / delta)
+
+    return A, sigma_A, B, sigma_B
+
+
+def _trial_chunk(seed: np.random.SeedSequence, trials: int, A: float,\
+    B: float, y_error: float, x_min: float, x_max: float, N: int)\
+    -> np.ndarray:
+    """
+    Runs one chunk of Monte Carlo trials from its own random stream.
+
+    Returns
+    -------
+    - fits (2-d array): One row of (A, sigma_A, B, sigma_B) per trial.
+    """
+
+    rng = np.random.default_rng(seed)
+    # Uniform random distribution for x values, Gaussian scatter in y.
+    x_trial = rng.uniform(x_min, x_max, size=(trials, N))
+    y_trial = A + (B * x_trial) + rng.normal(loc=0, scale=y_error,\
+        size=(trials, N))
+
+    return np.stack(least_squares(x_trial, y_trial), axis=-1)
+
+
+def _trial_chunk_args(args: Tuple) -> np.ndarray:
+    """Unpacks a work item for the process pool."""
+    return _trial_chunk(*args)
+
+
+def monte_carlo(A: float, B: float, y_error: float, x_min: float,\
+    x_max: float, N: int, number_of_trials: int,\
+    seed: Optional[int] = None, chunk: int = 10000, workers: int = 1)\
+    -> Tuple[np.ndarray, dict]:
+    """
+    Estimates the spread of straight-line fits by Monte Carlo, as in
+    monte_carlo_example.py: each trial draws N uniformly random x values,
+    adds Gaussian noise to the line A + B x, and refits it.
+
+    Trials are fitted a chunk at a time as rows of a 2-d array. Every chunk
+    has its own random stream spawned from one SeedSequence, and the chunks
+    are the same whatever the number of workers, so a given seed gives
+    bit-identical results serially or in parallel.
+
+    Parameters
+    ----------
+    - A, B (float): The intercept and slope of the true line.
+    - y_error (float): The standard deviation of the noise in y.
+    - x_min, x_max (float): The range the x values are drawn from.
+    - N (int): The number of points per trial.
+    - number_of_trials (int): How many trials to run.
+    - seed (int): The seed of the random streams; fresh entropy if None.
+    - chunk (int): The number of trials fitted together, which bounds the
+    memory to about 2 * chunk * N floats per worker.
+    - workers (int): The number of processes to run chunks on.
+
+    Returns
+    -------
+    - fits (2-d array): One row of (A, sigma_A, B, sigma_B) per trial.
+    - summary (dict): The 'mean' and standard deviation 'std' over the
+    trials, each an array ordered as the columns of fits.
+    """
+
+    sizes = [min(chunk, number_of_trials - start)\
+        for start in range(0, number_of_trials, chunk)]
+    seeds = np.random.SeedSequence(seed).spawn(len(sizes))
+    work = [(s, size, A, B, y_error, x_min, x_max, N)\
+        for s, size in zip(seeds, sizes)]
+
+    if workers > 1 and len(work) > 1:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            fits = np.concatenate(list(pool.map(_trial_chunk_args, work)))
+    else:
+        fits = np.concatenate([_trial_chunk_args(item) for item in work])
+
+    summary = {'mean': np.mean(fits, axis=0), 'std': np.std(fits, axis=0)}
+
+    return fits, summary
+
+
+class LeastSquaresAccumulator:
+    """
+    Running least squares straight line fit that takes the data a chunk at a
+    time, so it never holds more than one chunk in memory.
+
+    It keeps the count, the means and the centred sums of squares and
+    products. Each chunk is reduced about its own mean and folded in with the
+    pairwise update of Chan, Golub and LeVeque (Welford's update, a chunk at
+    a time), which avoids the cancellation of raw sums like sum_xx. Two
+    accumulators over different parts of the data merge the same way, so
+    workers can each fit a part.
+    """
+
+    def __init__(self):
+        self.n = 0
+        self.mean_x = 0.0
+        self.mean_y = 0.0
+        self.S_xx = 0.0
+        self.S_xy = 0.0
+        self.S_yy = 0.0
+
+    def _combine(self, n: int, mean_x: float, mean_y: float, S_xx: float,\
+        S_xy: float, S_yy: float) -> None:
+        """Folds the statistics of another part of the data into these."""
+
+        if n == 0:
+            return
+        total = self.n + n
+        dx = mean_x - self.mean_x
+        dy = mean_y - self.mean_y
+        weight = self.n * n / total
+        self.mean_x += dx * n / total
+        self.mean_y += dy * n / total
+        self.S_xx += S_xx + (dx * dx * weight)
+        self.S_xy += S_xy + (dx * dy * weight)
+        self.S_yy += S_yy + (dy * dy * weight)
+        self.n = total
+
+    def update(self, x: np.ndarray, y: np.ndarray)\
+        -> 'LeastSquaresAccumulator':
+        """
+        Adds a chunk of points.
+
+        Parameters
+        ----------
+        - x (1-d array): The x values of the chunk.
+        - y (1-d array): The y values of the chunk.
+
+        Returns
+        -------
+        - self, so calls can be chained.
+        """
+
+        x = np.asarray(x, dtype=float).ravel()
+        y = np.asarray(y, dtype=float).ravel()
+        if len(x) != len(y):
+            raise ValueError("x and y must have the same number of points.")
+        if len(x) == 0:
+            return self
+        mean_x, mean_y = np.mean(x), np.mean(y)
+        dx, dy = x - mean_x, y - mean_y
+        self._combine(len(x), mean_x, mean_y, np.dot(dx, dx), np.dot(dx, dy),\
+            np.dot(dy, dy))
+
+        return self
+
+    def merge(self, other: 'LeastSquaresAccumulator')\
+        -> 'LeastSquaresAccumulator':
+        """
+        Adds the points seen by another accumulator, e.g. one run by a
+        different worker on another part of the data.
+
+        Returns
+        -------
+        - self, so calls can be chained.
+        """
+
+        self._combine(other.n, other.mean_x, other.mean_y, other.S_xx,\
+            other.S_xy, other.S_yy)
+
+        return self
+
+    def fit(self) -> Tuple[float, float, float, float]:
+        """
+        The fit to the points seen so far, the same as least_squares over
+        all of them.
+
+        Returns
+        -------
+        - (A, sigma_A, B, sigma_B) of the line y = A + B x.
+        """
+
+        if self.n < 3:
+            raise ValueError("A straight line fit with uncertainties needs "\
+                "at least 3 points.")
+        B = self.S_xy / self.S_xx
+        A = self.mean_y - (B * self.mean_x)
+        rss = max(self.S_yy - (B * self.S_xy), 0.0)
+        scatter = np.sqrt(rss / (self.n - 2))
+        sigma_B = scatter / np.sqrt(self.S_xx)
+        sigma_A = sigma_B * np.sqrt((self.S_xx / self.n) + self.mean_x**2)
+
+        return A, sigma_A, B, sigma_B
+
+    @classmethod
+    def from_file(cls, filename: str, usecols: Sequence[int] = (0, 1),\
+        skiprows: int = 0, chunk_size: int = 100000, workers: int = 1)\
+        -> 'LeastSquaresAccumulator':
+        """
+        Fits two columns of a whitespace separated text file in constant
+        memory.
+
+        Parameters
+        ----------
+        - filename (str): The file to read.
+        - usecols (2-tuple): The columns of x and y.
+        - skiprows (int): The number of header lines.
+        - chunk_size (int): The number of lines parsed at once.
+        - workers (int): The number of processes to split the file over. Each
+        takes a contiguous byte range and the results are merged.
+
+        Returns
+        -------
+        - accumulator (LeastSquaresAccumulator): The statistics of the file.
+        """
+
+        with open(filename, 'rb') as f:
+            for i in range(skiprows):
+                f.readline()
+            start = f.tell()
+        stop = os.path.getsize(filename)
+
+        edges = np.linspace(start, stop, max(workers, 1) + 1).astype(int)
+        work = [(filename, edges[i], edges[i + 1], start, tuple(usecols),\
+            chunk_size) for i in range(len(edges) - 1)]
+        if workers > 1:
+            with ProcessPoolExecutor(max_workers=workers) as pool:
+                parts = list(pool.map(_accumulate_range_args, work))
+        else:
+            parts = [_accumulate_range_args(item) for item in work]
+
+        accumulator = cls()
+        for part in parts:
+            accumulator.merge(part)
+
+        return accumulator
+
+
+def read_chunks(lines: Iterable, usecols: Sequence[int] = (0, 1),\
+    chunk_size: int = 100000) -> Iterator[np.ndarray]:
+    """
+    Parses whitespace separated lines of text a chunk at a time.
+
+    Parameters
+    ----------
+    - lines (iterable): The lines, e.g. an open file past its header.
+    - usecols (sequence): The columns to keep.
+    - chunk_size (int): The number of lines parsed at once.
+
+    Yields
+    ------
+    - chunk (2-d array): One row per line and one column per usecols entry.
+    """
+
+    lines = iter(lines)
+    while True:
+        block = [line.decode() if isinstance(line, bytes) else line\
+            for line in islice(lines, chunk_size)]
+        if not block:
+            return
+        yield np.loadtxt(block, usecols=usecols, ndmin=2)
+
+
+def _byte_range(f, start: int, stop: int, first: int) -> Iterator[bytes]:
+    """
+    Yields the lines of an open binary file that begin in [start, stop).
+    """
+
+    if start > first:
+        # Finish the line running into the range; it belongs to the last one.
+        f.seek(start - 1)
+        f.readline()
+    else:
+        f.seek(start)
+    while f.tell() < stop:
+        line = f.readline()
+        if not line:
+            return
+        if line.strip():
+            yield line
+
+
+def _accumulate_range(filename: str, start: int, stop: int, first: int,\
+    usecols: Tuple[int, int], chunk_size: int) -> LeastSquaresAccumulator:
+    """Fits the lines of a file that begin in the byte range [start, stop)."""
+
+    accumulator = LeastSquaresAccumulator()
+    with open(filename, 'rb') as f:
+        for chunk in read_chunks(_byte_range(f, start, stop, first), usecols,\
+            chunk_size):
+            accumulator.update(chunk[:, 0], chunk[:, 1])
+
+    return accumulator
+
+
+def _accumulate_range_args(args: Tuple) -> LeastSquaresAccumulator:
+    """Unpacks a work item for the process pool."""
+    return _accumulate_range(*args)
@@ -0,0 +1,183 @@
+import numpy as np
+from Bifurcation_Diagram import logistic
+from typing import Callable, Tuple
+
+
+def logistic_derivative(x: np.ndarray, r: np.ndarray) -> np.ndarray:
+    """The derivative of the logistic map with respect to x."""
+    return 4 * r * (1 - (2 * x))
+
+
+def map_exponent(map_fun: Callable[[np.ndarray, np.ndarray], np.ndarray],\
+    derivative: Callable[[np.ndarray, np.ndarray], np.ndarray],\
+    r_values: np.ndarray, x0: float = 0.25, transient: int = 5000,\
+    iterations: int = 5000, base: float = np.e) -> np.ndarray:
+    """
+    Computes the Lyapunov exponent of a 1-d map for every parameter value at
+    once, as the average of log|f'(x)| along the orbit.
+
+    Parameters
+    ----------
+    - map_fun (function): A vectorized map of the form map_fun(x, r).
+    - derivative (function): Its derivative with respect to x, of the same
+    form.
+    - r_values (array): The parameter values, of any shape.
+    - x0 (float): The starting value of x for every parameter.
+    - transient (int): The number of iterations discarded first.
+    - iterations (int): The number of iterations averaged.
+    - base (float): The base of the logarithm; 2 gives bits per iteration as
+    in lyapunov.py.
+
+    Returns
+    -------
+    - exponent (array): The exponent for each parameter value. Positive means
+    chaos; superstable orbits give -inf.
+    """
+
+    r = np.asarray(r_values, dtype=float)
+    x = np.full(r.shape, x0, dtype=float)
+    for i in range(transient):
+        x = map_fun(x, r)
+
+    total = np.zeros(r.shape)
+    with np.errstate(divide='ignore'):
+        for i in range(iterations):
+            total += np.log(np.abs(derivative(x, r)))
+            x = map_fun(x, r)
+
+    return total / iterations / np.log(base)
+
+
+def lorenz(t: float, Y: np.ndarray, s=10, r=28, b=2.667) -> np.ndarray:
+    """The Lorenz system of lorenz_3d.py, for a (batch, 3) array of states."""
+    x, y, z = Y[..., 0], Y[..., 1], Y[..., 2]
+    return np.stack((s*(y - x), r*x - y - x*z, x*y - b*z), axis=-1)
+
+
+def lorenz_jacobian(t: float, Y: np.ndarray, s=10, r=28, b=2.667)\
+    -> np.ndarray:
+    """The (batch, 3, 3) Jacobian of the Lorenz system."""
+    x, y, z = Y[..., 0], Y[..., 1], Y[..., 2]
+    s, r, b = (np.broadcast_to(p, x.shape) for p in (s, r, b))
+    one, zero = np.ones_like(x), np.zeros_like(x)
+    return np.stack((
+        np.stack((-s, s, zero), axis=-1),
+        np.stack((r - z, -one, -x), axis=-1),
+        np.stack((y, x, -b), axis=-1)), axis=-2)
+
+
+def rossler(t: float, Y: np.ndarray, a=0.398, b=2, c=4) -> np.ndarray:
+    """The Rossler system of rossler_attractor.py, for a (batch, 3) array."""
+    x, y, z = Y[..., 0], Y[..., 1], Y[..., 2]
+    return np.stack((-y - z, x + a*y, b + z*(x - c)), axis=-1)
+
+
+def rossler_jacobian(t: float, Y: np.ndarray, a=0.398, b=2, c=4)\
+    -> np.ndarray:
+    """The (batch, 3, 3) Jacobian of the Rossler system."""
+    x, y, z = Y[..., 0], Y[..., 1], Y[..., 2]
+    a, c = (np.broadcast_to(p, x.shape) for p in (a, c))
+    one, zero = np.ones_like(x), np.zeros_like(x)
+    return np.stack((
+        np.stack((zero, -one, -one), axis=-1),
+        np.stack((one, a, zero), axis=-1),
+        np.stack((z, zero, x - c), axis=-1)), axis=-2)
+
+
+def _orthonormalize(V: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Orthonormalizes the columns of a (batch, n, n) stack of matrices by
+    modified Gram-Schmidt, vectorized over the batch; np.linalg.qr only
+    takes stacks from numpy 1.22.
+
+    Returns
+    -------
+    - Q (3-d array): The orthonormal columns.
+    - diagonal (2-d array): The (batch, n) diagonal of R, all positive.
+    """
+
+    Q = V.copy()
+    diagonal = np.empty(V.shape[:-1])
+    for j in range(V.shape[-1]):
+        for k in range(j):
+            overlap = np.sum(Q[:, :, k] * Q[:, :, j], axis=1)
+            Q[:, :, j] -= overlap[:, np.newaxis] * Q[:, :, k]
+        diagonal[:, j] = np.sqrt(np.sum(Q[:, :, j] ** 2, axis=1))
+        Q[:, :, j] /= diagonal[:, j, np.newaxis]
+
+    return Q, diagonal
+
+
+def flow_spectrum(flow: Callable[..., np.ndarray],\
+    jacobian: Callable[..., np.ndarray], initial_values: np.ndarray,\
+    params: Tuple = (), dt: float = 0.01, steps: int = 100000,\
+    transient: int = 1000, renormalize_every: int = 10)\
+    -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Computes the full Lyapunov spectrum of a flow with the method of Benettin
+    et al.: a set of tangent vectors is integrated along with the orbit by
+    RK4 and re-orthonormalized by QR decomposition every few steps, and the
+    exponents are the average logarithmic growth rates on the diagonal of R.
+
+    Parameters
+    ----------
+    - flow (function): A vectorized function of the form flow(t, Y, *args)
+    returning dY/dt for a (batch, n) array of states; each of args is a
+    scalar or a (batch,) array, one value per orbit.
+    - jacobian (function): Its (batch, n, n) Jacobian, of the same form.
+    - initial_values (array): The (batch, n) starting states, or one (n,)
+    state.
+    - params (n-tuple): Additional parameters for flow and jacobian.
+    - dt (float): The time step.
+    - steps (int): The number of steps averaged over.
+    - transient (int): The number of steps taken first to settle onto the
+    attractor.
+    - renormalize_every (int): The number of steps between QR decompositions.
+
+    Returns
+    -------
+    - exponents (array): The (batch, n) spectrum of each orbit, largest first.
+    - Y (array): The (batch, n) final states.
+    """
+
+    Y = np.array(initial_values, dtype=float, ndmin=2)
+    batch, n = Y.shape
+    params = tuple(np.asarray(p, dtype=float) for p in params)
+    t = 0.0
+
+    def rk4(t: float, Y: np.ndarray, V: np.ndarray, tangent: bool):
+        # Orbit and tangent vectors advanced together, dV/dt = J(Y) V.
+        def rates(t, Y, V):
+            dY = flow(t, Y, *params)
+            dV = jacobian(t, Y, *params) @ V if tangent else None
+            return dY, dV
+        k1 = rates(t, Y, V)
+        k2 = rates(t + (dt / 2), Y + (dt / 2) * k1[0],\
+            V + (dt / 2) * k1[1] if tangent else None)
+        k3 = rates(t + (dt / 2), Y + (dt / 2) * k2[0],\
+            V + (dt / 2) * k2[1] if tangent else None)
+        k4 = rates(t + dt, Y + dt * k3[0], V + dt * k3[1] if tangent else None)
+        Y = Y + (dt / 6) * (k1[0] + 2*k2[0] + 2*k3[0] + k4[0])
+        if tangent:
+            V = V + (dt / 6) * (k1[1] + 2*k2[1] + 2*k3[1] + k4[1])
+        return Y, V
+
+    for i in range(transient):
+        Y, _ = rk4(t, Y, None, False)
+        t += dt
+
+    V = np.broadcast_to(np.eye(n), (batch, n, n)).copy()
+    log_growth = np.zeros((batch, n))
+    elapsed = 0.0
+    for i in range(1, steps + 1):
+        Y, V = rk4(t, Y, V, True)
+        t += dt
+        if i % renormalize_every == 0 or i == steps:
+            V, diagonal = _orthonormalize(V)
+            log_growth += np.log(diagonal)
+            elapsed = i * dt
+
+    exponents = log_growth / elapsed
+    exponents = -np.sort(-exponents, axis=1)
+
+    return exponents, Y
@@ -0,0 +1,272 @@
+import numpy as np
+from Symplectic import Symplectic
+from typing import Tuple
+
+
+G = 6.67E-11  # Gravitational constant
+
+# Number of bodies above which method='auto' switches to Barnes-Hut.
+DIRECT_MAX = 2000
+
+
+def direct_accelerations(positions: np.ndarray, masses: np.ndarray,\
+    G: float = G, softening: float = 0.0, block: int = 1024) -> np.ndarray:
+    """
+    Computes the gravitational acceleration of every body from every other one
+    by direct summation, O(N^2).
+
+    Parameters
+    ----------
+    - positions (2-d array): The (N, 3) positions of the bodies.
+    - masses (1-d array): The N masses.
+    - G (float): The gravitational constant.
+    - softening (float): A length added in quadrature to every separation, to
+    keep close encounters finite.
+    - block (int): How many bodies to work on at once, which bounds the
+    temporary memory to about block * N * 3 floats.
+
+    Returns
+    -------
+    - acc (2-d array): The (N, 3) accelerations.
+    """
+
+    positions = np.ascontiguousarray(positions, dtype=float)
+    masses = np.asarray(masses, dtype=float)
+    acc = np.empty_like(positions)
+
+    for start in range(0, len(positions), block):
+        stop = min(start + block, len(positions))
+        # Separation vectors from each body in the block to every body.
+        d = positions[np.newaxis, :, :] - positions[start:stop, np.newaxis, :]
+        r2 = np.einsum('ijk,ijk->ij', d, d) + softening ** 2
+        # A body exerts no force on itself.
+        r2[np.arange(stop - start), np.arange(start, stop)] = np.inf
+        inv_r3 = r2 ** -1.5
+        acc[start:stop] = G * np.einsum('ij,ijk->ik', masses * inv_r3, d)
+
+    return acc
+
+
+def build_octree(positions: np.ndarray, masses: np.ndarray,\
+    max_depth: int = 32) -> dict:
+    """
+    Builds a Barnes-Hut octree, one level at a time with array operations.
+
+    Parameters
+    ----------
+    - positions (2-d array): The (N, 3) positions of the bodies.
+    - masses (1-d array): The N masses.
+    - max_depth (int): The deepest level; bodies that still share a cell there
+    (e.g. coincident ones) share a leaf.
+
+    Returns
+    -------
+    - tree (dict): Flat arrays describing the nodes: 'children' (nodes, 8),
+    -1 where empty; 'size' (edge length); 'mass'; 'com' (center of mass);
+    'depth'; 'leaf'; and 'path' (levels, N), the node containing each body at
+    each level, or -1 below its leaf.
+    """
+
+    N = len(positions)
+    low = positions.min(axis=0)
+    high = positions.max(axis=0)
+    half = max(np.max(high - low) / 2, np.finfo(float).tiny) * (1 + 1e-9)
+
+    centers = [((low + high) / 2)[np.newaxis, :]]
+    halves = [np.array([half])]
+    depths = [np.array([0])]
+    children = [np.full((1, 8), -1)]
+    num_nodes = 1
+
+    node_of = np.zeros(N, dtype=int)
+    path = [node_of.copy()]
+    # Bodies in cells that still hold more than one body.
+    splitting = np.arange(N) if N > 1 else np.arange(0)
+    octant_bits = np.array([1, 2, 4])
+
+    for depth in range(1, max_depth + 1):
+        if len(splitting) == 0:
+            break
+        center_all = np.concatenate(centers)
+        half_all = np.concatenate(halves)
+
+        parent = node_of[splitting]
+        above = positions[splitting] > center_all[parent]
+        octant = above @ octant_bits
+        keys, inverse, counts = np.unique((parent * 8) + octant,\
+            return_inverse=True, return_counts=True)
+        new_ids = num_nodes + np.arange(len(keys))
+        key_parent, key_octant = keys // 8, keys % 8
+
+        child_table = np.concatenate(children)
+        child_table[key_parent, key_octant] = new_ids
+        signs = ((key_octant[:, np.newaxis] & octant_bits) > 0) * 2 - 1
+        centers = [center_all,\
+            center_all[key_parent] + (signs * half_all[key_parent, np.newaxis]\
+            / 2)]
+        halves = [half_all, half_all[key_parent] / 2]
+        depths.append(np.full(len(keys), depth))
+        children = [child_table, np.full((len(keys), 8), -1)]
+        num_nodes += len(keys)
+
+        node_of[splitting] = new_ids[inverse]
+        level = np.full(N, -1)
+        level[splitting] = node_of[splitting]
+        path.append(level)
+        splitting = splitting[counts[inverse] > 1]
+
+    children = np.concatenate(children)
+    depth = np.concatenate(depths)
+    path = np.array(path)
+
+    # Accumulate mass and first moment up every level of each body's path.
+    mass = np.zeros(num_nodes)
+    moment = np.zeros((num_nodes, 3))
+    for level in path:
+        inside = level >= 0
+        nodes = level[inside]
+        mass += np.bincount(nodes, masses[inside], minlength=num_nodes)
+        for k in range(3):
+            moment[:, k] += np.bincount(nodes, masses[inside]\
+                * positions[inside, k], minlength=num_nodes)
+    com = moment / np.where(mass > 0, mass, 1)[:, np.newaxis]
+
+    return {'children': children, 'size': 2 * np.concatenate(halves),\
+        'mass': mass, 'com': com, 'depth': depth,\
+        'leaf': np.all(children < 0, axis=1), 'path': path}
+
+
+def barnes_hut_accelerations(positions: np.ndarray, masses: np.ndarray,\
+    G: float = G, softening: float = 0.0, theta: float = 0.5) -> np.ndarray:
+    """
+    Computes the gravitational accelerations with the Barnes-Hut
+    approximation, O(N log N). The tree is walked for all bodies at once: each
+    pass handles every pending (body, node) pair together.
+
+    Parameters
+    ----------
+    - positions (2-d array): The (N, 3) positions of the bodies.
+    - masses (1-d array): The N masses.
+    - G (float): The gravitational constant.
+    - softening (float): A length added in quadrature to every separation.
+    - theta (float): The opening angle. A cell of size s at distance d is
+    treated as a point mass if s < theta * d; 0 gives the exact sum.
+
+    Returns
+    -------
+    - acc (2-d array): The (N, 3) accelerations.
+    """
+
+    positions = np.ascontiguousarray(positions, dtype=float)
+    masses = np.asarray(masses, dtype=float)
+    N = len(positions)
+    tree = build_octree(positions, masses)
+    children, size, mass = tree['children'], tree['size'], tree['mass']
+    com, depth, leaf, path = tree['com'], tree['depth'], tree['leaf'],\
+        tree['path']
+
+    acc = np.zeros((N, 3))
+    body = np.arange(N)
+    node = np.zeros(N, dtype=int)
+
+    while len(body) > 0:
+        contains = path[np.minimum(depth[node], len(path) - 1), body] == node
+        d = com[node] - positions[body]
+        r2 = np.einsum('ij,ij->i', d, d)
+        far = (size[node] ** 2 < (theta ** 2) * r2) & ~contains
+        take = far | leaf[node]
+
+        # A leaf holding the body itself only acts through its other bodies.
+        m = mass[node[take]]
+        d_take = d[take]
+        own = contains[take]
+        if np.any(own):
+            m_self = masses[body[take][own]]
+            m_rest = m[own] - m_self
+            moment_rest = (com[node[take][own]] * m[own, np.newaxis])\
+                - (positions[body[take][own]] * m_self[:, np.newaxis])
+            m[own] = m_rest
+            d_take[own] = np.where(m_rest[:, np.newaxis] > 0,\
+                moment_rest / np.where(m_rest > 0, m_rest, 1)[:, np.newaxis]\
+                - positions[body[take][own]], 0.0)
+        r2_take = np.einsum('ij,ij->i', d_take, d_take) + softening ** 2
+        with np.errstate(divide='ignore', invalid='ignore'):
+            weight = np.where((m > 0) & (r2_take > 0), G * m * r2_take ** -1.5,\
+                0.0)
+        for k in range(3):
+            acc[:, k] += np.bincount(body[take], weight * d_take[:, k],\
+                minlength=N)
+
+        # Open the remaining cells.
+        opened = ~take
+        child = children[node[opened]]
+        filled = child >= 0
+        body = np.repeat(body[opened], filled.sum(axis=1))
+        node = child[filled]
+
+    return acc
+
+
+def accelerations(positions: np.ndarray, masses: np.ndarray, G: float = G,\
+    softening: float = 0.0, theta: float = 0.5, method: str = 'auto')\
+    -> np.ndarray:
+    """
+    Computes the gravitational accelerations of N bodies.
+
+    Parameters
+    ----------
+    - positions (2-d array): The (N, 3) positions of the bodies.
+    - masses (1-d array): The N masses.
+    - G (float): The gravitational constant.
+    - softening (float): A length added in quadrature to every separation.
+    - theta (float): The Barnes-Hut opening angle.
+    - method (str): 'direct', 'barnes_hut', or 'auto' to use direct summation
+    up to DIRECT_MAX bodies and Barnes-Hut above.
+
+    Returns
+    -------
+    - acc (2-d array): The (N, 3) accelerations.
+    """
+
+    if method == 'auto':
+        method = 'direct' if len(positions) <= DIRECT_MAX else 'barnes_hut'
+    if method == 'direct':
+        return direct_accelerations(positions, masses, G, softening)
+    if method == 'barnes_hut':
+        return barnes_hut_accelerations(positions, masses, G, softening, theta)
+    raise ValueError(f"Unknown method {method!r}; expected 'direct', "\
+        "'barnes_hut' or 'auto'.")
+
+
+def N_Body(positions: np.ndarray, velocities: np.ndarray, masses: np.ndarray,\
+    t_range: Tuple[float, float, float], G: float = G,\
+    softening: float = 0.0, theta: float = 0.5, method: str = 'auto',\
+    integrator: str = 'verlet', save_every: int = 1)\
+    -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Simulates N gravitating bodies, headless, with a symplectic integrator.
+
+    Parameters
+    ----------
+    - positions (2-d array): The (N, 3) initial positions.
+    - velocities (2-d array): The (N, 3) initial velocities.
+    - masses (1-d array): The N masses.
+    - t_range (3-tuple): A tuple of the form (min, max, step) for the times.
+    - G (float): The gravitational constant.
+    - softening (float): A length added in quadrature to every separation.
+    - theta (float): The Barnes-Hut opening angle.
+    - method (str): How forces are computed; see accelerations.
+    - integrator (str): One of the methods of Symplectic.Symplectic.
+    - save_every (int): Only every save_every-th step is saved.
+
+    Returns
+    -------
+    - t (1-d array): The saved times.
+    - x (3-d array): The (steps, N, 3) positions.
+    - v (3-d array): The (steps, N, 3) velocities.
+    """
+
+    masses = np.ascontiguousarray(masses, dtype=float)
+
+    return Symplectic(accelerations, t_range, positions, velocities,\
+        (masses, G, softening, theta, method), integrator, save_every)
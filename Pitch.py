@@ -0,0 +1,165 @@
+import numpy as np
+from Events import hermite
+from Root_Finding import newton
+from typing import Tuple
+
+
+PLATE = 18.44 # m, from the pitcher's mound to home plate
+
+# The spin of the pitch types of baseballpitch.py, as (omega in rad/s, phi).
+PITCH_TYPES = {
+    'curveball': (1800.0/60.0*2*np.pi, 45.0*np.pi/180.0),
+    'slider': (1800.0/60.0*2*np.pi, 0.0),
+    'fastball': (1800.0/60.0*2*np.pi, 225.0*np.pi/180.0),
+    'screwball': (1800.0/60.0*2*np.pi, 135.0*np.pi/180.0),
+    'no spin': (0.0, 0.0),
+}
+
+
+def k_D(v: np.ndarray) -> np.ndarray:
+    """Drag coefficient of a baseball at speed v, from baseballpitch.py."""
+    delta = 5.0
+    vd = 35.0
+    return 0.0039 + 0.0058/(1 + np.exp((v-vd)/delta))
+
+
+def acceleration(V: np.ndarray, omega: np.ndarray, phi: np.ndarray,\
+    k_L: float = 4.0E-4, g: float = 9.81) -> np.ndarray:
+    """
+    Acceleration of spinning baseballs with drag and the Magnus force, for an
+    (n, 3) array of velocities and n spin rates omega and spin axes phi.
+    """
+
+    vx, vy, vz = V[:, 0], V[:, 1], V[:, 2]
+    v = np.sqrt(vx**2 + vy**2 + vz**2)
+    drag = -k_D(v)*v
+    lift = k_L*omega
+    return np.stack((drag*vx + lift*(vz*np.sin(phi) - vy*np.cos(phi)),\
+        drag*vy + lift*vx*np.cos(phi),\
+        drag*vz - lift*vx*np.sin(phi) - g), axis=-1)
+
+
+def _plate_gap(t, t0, t1, x0, x1, vx0, vx1, plate):
+    """How far short of the plate a pitch is within its last step."""
+    return hermite(t0, t1, x0, x1, vx0, vx1, t) - plate
+
+
+def _fly(speed: np.ndarray, theta: np.ndarray, omega: np.ndarray,\
+    phi: np.ndarray, release: Tuple[float, float, float], plate: float,\
+    dt: float, k_L: float, g: float, max_time: float)\
+    -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Integrates flat arrays of pitches with RK4 until each crosses the plate.
+
+    Returns
+    -------
+    - t (1-d array): The time each pitch crosses the plate.
+    - P (2-d array): Its (n, 3) position there.
+    - V (2-d array): Its (n, 3) velocity there.
+    """
+
+    n = len(speed)
+    P = np.tile(np.asarray(release, dtype=float), (n, 1))
+    V = np.stack((speed*np.cos(theta), np.zeros(n), speed*np.sin(theta)),\
+        axis=-1)
+    # The two ends of the step in which each pitch crosses; nan until then.
+    t0 = np.full(n, np.nan)
+    P0, P1 = np.full((n, 3), np.nan), np.full((n, 3), np.nan)
+    V0, V1 = np.full((n, 3), np.nan), np.full((n, 3), np.nan)
+    # Only the pitches still on their way are stepped.
+    active = np.arange(n)
+
+    for step in range(int(np.ceil(max_time / dt))):
+        w, p = omega[active], phi[active]
+        k1x, k1v = V, acceleration(V, w, p, k_L, g)
+        k2x, k2v = V + k1v*dt/2, acceleration(V + k1v*dt/2, w, p, k_L, g)
+        k3x, k3v = V + k2v*dt/2, acceleration(V + k2v*dt/2, w, p, k_L, g)
+        k4x, k4v = V + k3v*dt, acceleration(V + k3v*dt, w, p, k_L, g)
+        P_new = P + (k1x + 2*k2x + 2*k3x + k4x)*dt/6
+        V_new = V + (k1v + 2*k2v + 2*k3v + k4v)*dt/6
+
+        crossed = P_new[:, 0] >= plate
+        if np.any(crossed):
+            index = active[crossed]
+            t0[index] = step * dt
+            P0[index], P1[index] = P[crossed], P_new[crossed]
+            V0[index], V1[index] = V[crossed], V_new[crossed]
+            keep = ~crossed
+            active = active[keep]
+            if len(active) == 0:
+                break
+            P_new, V_new = P_new[keep], V_new[keep]
+        P, V = P_new, V_new
+
+    # Every crossing is located inside its last step in one solve, starting
+    # from the straight line between the two ends.
+    t1 = t0 + dt
+    with np.errstate(invalid='ignore'):
+        guess = t0 + dt*(plate - P0[:, 0])/(P1[:, 0] - P0[:, 0])
+    t, converged = newton(_plate_gap, guess, args=(t0, t1, P0[:, 0],\
+        P1[:, 0], V0[:, 0], V1[:, 0], plate), tol=1e-12*dt)
+    # The Hermite interpolant of the position uses the velocity as its
+    # derivative, and that of the velocity uses the acceleration.
+    A0 = acceleration(V0, omega, phi, k_L, g)
+    A1 = acceleration(V1, omega, phi, k_L, g)
+    s = t[:, np.newaxis]
+    P = hermite(t0[:, np.newaxis], t1[:, np.newaxis], P0, P1, V0, V1, s)
+    V = hermite(t0[:, np.newaxis], t1[:, np.newaxis], V0, V1, A0, A1, s)
+
+    return t, P, V
+
+
+def simulate_pitches(speed, theta, omega, phi,\
+    release: Tuple[float, float, float] = (0.0, 0.0, 1.8),\
+    plate: float = PLATE, dt: float = 0.01, k_L: float = 4.0E-4,\
+    g: float = 9.81, max_time: float = 5.0) -> dict:
+    """
+    Throws a whole batch of pitches with drag and the Magnus force, as in
+    baseballpitch.py, and finds exactly where and when each one crosses the
+    plate. All pitches are integrated together with RK4, each stopping at
+    the plate; the crossing is located inside the last step with the cubic
+    Hermite interpolant.
+
+    Parameters
+    ----------
+    - speed (float or array): The release speeds in m/s.
+    - theta (float or array): The release angles above horizontal in rad.
+    - omega (float or array): The spin rates in rad/s.
+    - phi (float or array): The spin axes in rad; see PITCH_TYPES.
+    All of the above are broadcast together; each element is one pitch.
+    - release (3-tuple): The (x, y, z) release point in m.
+    - plate (float): The x of the plate in m.
+    - dt (float): The time step in s.
+    - k_L (float): The lift coefficient of the Magnus force.
+    - g (float): The gravitational acceleration in m/s**2.
+    - max_time (float): The longest flight integrated; pitches that have not
+    reached the plate by then get nan.
+
+    Returns
+    -------
+    - crossing (dict): Arrays of the broadcast shape: the time 't', the
+    sideways 'y' and height 'z' at the plate, the 'speed' there, and the
+    'break_y' and 'break_z' of each pitch, its displacement at the plate
+    from the same pitch thrown without spin.
+    """
+
+    speed, theta, omega, phi = np.broadcast_arrays(*(np.asarray(p,\
+        dtype=float) for p in (speed, theta, omega, phi)))
+    shape = speed.shape
+    t, P, V = _fly(speed.ravel(), theta.ravel(), omega.ravel(), phi.ravel(),\
+        release, plate, dt, k_L, g, max_time)
+
+    # The spinless pitches only depend on the speed and angle, so only the
+    # distinct pairs of those are thrown again.
+    pairs, inverse = np.unique(np.stack((speed.ravel(), theta.ravel())),\
+        axis=1, return_inverse=True)
+    zeros = np.zeros(pairs.shape[1])
+    t_ref, P_ref, V_ref = _fly(pairs[0], pairs[1], zeros, zeros, release,\
+        plate, dt, k_L, g, max_time)
+    P_ref = P_ref[inverse.ravel()]
+
+    return {'t': t.reshape(shape), 'y': P[:, 1].reshape(shape),\
+        'z': P[:, 2].reshape(shape),\
+        'speed': np.sqrt(np.sum(V**2, axis=-1)).reshape(shape),\
+        'break_y': (P[:, 1] - P_ref[:, 1]).reshape(shape),\
+        'break_z': (P[:, 2] - P_ref[:, 2]).reshape(shape)}
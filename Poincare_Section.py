@@ -0,0 +1,123 @@
+import numpy as np
+from concurrent.futures import ProcessPoolExecutor
+from typing import Callable, Tuple
+
+
+def driven_pendulum(x: np.ndarray, v: np.ndarray, t: np.ndarray,\
+    k: np.ndarray, c: np.ndarray, omega: np.ndarray) -> np.ndarray:
+    """
+    Acceleration of the damped driven pendulum of poincare_oscillator.py.
+    """
+    return -k*v - np.sin(x) + c*np.cos(omega*t)
+
+
+def _sections(acc: Callable[..., np.ndarray], x0: np.ndarray, v0: np.ndarray,\
+    params: Tuple[np.ndarray, ...], omega: np.ndarray, steps_per_period: int,\
+    transient_periods: int, periods: int, phase: float, wrap: bool)\
+    -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Integrates a block of lanes with RK4 and strobes them once per period.
+    """
+
+    x = x0.copy()
+    v = v0.copy()
+    period = 2 * np.pi / omega
+    h = period / steps_per_period
+    xs = np.empty((len(x), periods))
+    vs = np.empty((len(x), periods))
+
+    # Each time is computed from the step count rather than accumulated, so
+    # the strobe never drifts off the drive phase.
+    offset = phase * period
+    total = (transient_periods + periods) * steps_per_period
+    for step in range(total):
+        t = offset + (step * h)
+        k1v = acc(x, v, t, *params) * h
+        k1x = v * h
+        k2v = acc(x + k1x/2, v + k1v/2, t + h/2, *params) * h
+        k2x = (v + k1v/2) * h
+        k3v = acc(x + k2x/2, v + k2v/2, t + h/2, *params) * h
+        k3x = (v + k2v/2) * h
+        k4v = acc(x + k3x, v + k3v, t + h, *params) * h
+        k4x = (v + k3v) * h
+        x = x + (k1x + 2*k2x + 2*k3x + k4x)/6
+        v = v + (k1v + 2*k2v + 2*k3v + k4v)/6
+
+        if wrap:
+            # Keep the angle in the [-pi, pi) range.
+            x = ((x + np.pi) % (2 * np.pi)) - np.pi
+
+        done = step + 1
+        if done % steps_per_period == 0:
+            index = (done // steps_per_period) - 1 - transient_periods
+            if index >= 0:
+                xs[:, index] = x
+                vs[:, index] = v
+
+    return xs, vs
+
+
+def _sections_args(args: Tuple) -> Tuple[np.ndarray, np.ndarray]:
+    """Unpacks a work item for the process pool."""
+    return _sections(*args)
+
+
+def Poincare_Section(k, c, omega, x0=0.0, v0=0.0,\
+    acc: Callable[..., np.ndarray] = driven_pendulum,\
+    steps_per_period: int = 100, transient_periods: int = 100,\
+    periods: int = 200, phase: float = 0.0, wrap: bool = True,\
+    workers: int = 1, block: int = 10000) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Computes Poincare sections of a periodically driven oscillator for many
+    parameter sets at once. Every parameter set is a lane of one vectorized
+    RK4 integration whose step divides the drive period exactly, so the
+    section is sampled at exactly the same drive phase every period.
+
+    Parameters
+    ----------
+    - k (float or array): The damping coefficients.
+    - c (float or array): The drive amplitudes.
+    - omega (float or array): The drive angular frequencies.
+    - x0, v0 (float or array): The initial positions and velocities.
+    All of the above are broadcast against each other, and each element of
+    the result is one lane.
+    - acc (function): A vectorized acceleration of the form
+    acc(x, v, t, k, c, omega); driven_pendulum by default. It must be defined
+    at module level to use workers > 1.
+    - steps_per_period (int): The number of RK4 steps per drive period.
+    - transient_periods (int): The number of periods discarded first.
+    - periods (int): The number of section points kept per lane.
+    - phase (float): The drive phase of the section, as a fraction of a
+    period.
+    - wrap (bool): Whether to keep x in [-pi, pi), as for an angle.
+    - workers (int): The number of processes to split the lanes over.
+    - block (int): The most lanes integrated together by one process.
+
+    Returns
+    -------
+    - x (array): The section positions, of shape broadcast shape + (periods,).
+    - v (array): The section velocities, of the same shape.
+    """
+
+    k, c, omega, x0, v0 = np.broadcast_arrays(*(np.asarray(p, dtype=float)\
+        for p in (k, c, omega, x0, v0)))
+    shape = k.shape
+    lanes = [p.ravel() for p in (k, c, omega, x0, v0)]
+    size = lanes[0].size
+
+    work = []
+    for start in range(0, size, block):
+        k_b, c_b, omega_b, x_b, v_b = (p[start:start + block] for p in lanes)
+        work.append((acc, x_b, v_b, (k_b, c_b, omega_b), omega_b,\
+            steps_per_period, transient_periods, periods, phase, wrap))
+
+    if workers > 1 and len(work) > 1:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            results = list(pool.map(_sections_args, work))
+    else:
+        results = [_sections_args(item) for item in work]
+
+    xs = np.concatenate([r[0] for r in results]).reshape(shape + (periods,))
+    vs = np.concatenate([r[1] for r in results]).reshape(shape + (periods,))
+
+    return xs, vs
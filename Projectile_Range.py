@@ -0,0 +1,155 @@
+import numpy as np
+from Events import hermite
+from Root_Finding import newton
+from typing import Tuple
+
+
+def drag_acceleration(vx: np.ndarray, vy: np.ndarray, vt: np.ndarray,\
+    g: float = 9.81) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Acceleration of a projectile with quadratic air resistance, as in
+    dak_prescott.py, for a terminal velocity vt.
+    """
+    v = np.sqrt(vx*vx + vy*vy)
+    return -g*vx*v/(vt**2), -g*(1 + vy*v/(vt**2))
+
+
+def _crossing(t, t0, t1, y0, y1, vy0, vy1):
+    """The height between two steps, for locating the landing."""
+    return hermite(t0, t1, y0, y1, vy0, vy1, t)
+
+
+def landing_range(v0, vt, theta, y0=1.8, g: float = 9.81, dt: float = 0.01,\
+    max_time: float = 100.0) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Computes how far projectiles with air resistance fly before landing,
+    for every launch at once. All launches are integrated together with RK4
+    and each one stops as soon as it lands; the landing is located inside
+    its last step with the cubic Hermite interpolant, so the range is a
+    smooth function of the launch parameters.
+
+    Parameters
+    ----------
+    - v0 (float or array): The launch speeds in m/s.
+    - vt (float or array): The terminal velocities in m/s.
+    - theta (float or array): The launch angles in degrees.
+    - y0 (float or array): The launch heights in m.
+    All of the above are broadcast together; each element is one launch.
+    - g (float): The gravitational acceleration in m/s**2.
+    - dt (float): The time step in s.
+    - max_time (float): The longest flight integrated; launches still in
+    the air by then get nan.
+
+    Returns
+    -------
+    - x (array): The horizontal distance at landing of each launch.
+    - t (array): The time of flight of each launch.
+    """
+
+    v0, vt, theta, y0 = np.broadcast_arrays(*(np.asarray(p, dtype=float)\
+        for p in (v0, vt, theta, y0)))
+    shape = v0.shape
+    vt = vt.ravel()
+    x = np.zeros(vt.size)
+    y = y0.ravel().copy()
+    vx = (v0 * np.cos(np.radians(theta))).ravel()
+    vy = (v0 * np.sin(np.radians(theta))).ravel()
+    # The two ends of the step in which each launch lands, as rows of
+    # (t0, x0, x1, y0, y1, vx0, vx1, vy0, vy1); nan until it lands.
+    ends = np.full((9, vt.size), np.nan)
+    # Only the launches still in the air are stepped.
+    active = np.arange(vt.size)
+
+    def rates(vx, vy):
+        ax, ay = drag_acceleration(vx, vy, vt_a, g)
+        return vx, vy, ax, ay
+
+    for step in range(int(np.ceil(max_time / dt))):
+        vt_a = vt[active]
+        k1 = rates(vx, vy)
+        k2 = rates(vx + k1[2]*dt/2, vy + k1[3]*dt/2)
+        k3 = rates(vx + k2[2]*dt/2, vy + k2[3]*dt/2)
+        k4 = rates(vx + k3[2]*dt, vy + k3[3]*dt)
+        new = [s + (a + 2*b + 2*c + d)*dt/6 for s, a, b, c, d in\
+            zip((x, y, vx, vy), k1, k2, k3, k4)]
+
+        landed = new[1] < 0
+        if np.any(landed):
+            ends[:, active[landed]] = [np.full(np.count_nonzero(landed),\
+                step * dt)] + [s[landed] for pair in zip((x, y, vx, vy), new)\
+                for s in pair]
+            keep = ~landed
+            active = active[keep]
+            if len(active) == 0:
+                break
+            new = [s[keep] for s in new]
+        x, y, vx, vy = new
+
+    # Every landing is located inside its last step in one solve, starting
+    # from the straight line between the two heights.
+    t0, x0, x1, y0, y1, vx0, vx1, vy0, vy1 = ends
+    with np.errstate(invalid='ignore'):
+        guess = t0 + dt * y0 / (y0 - y1)
+    t_land, converged = newton(_crossing, guess,\
+        args=(t0, t0 + dt, y0, y1, vy0, vy1), tol=1e-12 * dt)
+    x_land = hermite(t0, t0 + dt, x0, x1, vx0, vx1, t_land)
+
+    return x_land.reshape(shape), t_land.reshape(shape)
+
+
+def optimal_angle(v0, vt, y0=1.8, g: float = 9.81, dt: float = 0.01,\
+    bounds: Tuple[float, float] = (5.0, 85.0), grid: int = 17,\
+    xtol: float = 0.01) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Finds the launch angle of longest range for every combination of launch
+    speed and terminal velocity at once. A coarse grid of angles, all flown
+    as one batch, brackets the best angle of each combination, and the
+    brackets are then narrowed together by golden-section search, one batch
+    of flights per iteration.
+
+    Parameters
+    ----------
+    - v0 (float or array): The launch speeds in m/s.
+    - vt (float or array): The terminal velocities in m/s.
+    - y0 (float or array): The launch heights in m.
+    - g (float): The gravitational acceleration in m/s**2.
+    - dt (float): The time step of the flights in s.
+    - bounds (2-tuple): The range of angles searched, in degrees.
+    - grid (int): The number of angles in the coarse grid.
+    - xtol (float): The accuracy of the angles, in degrees.
+
+    Returns
+    -------
+    - angle (array): The best launch angle of each combination, in degrees.
+    - x (array): The range at that angle.
+    """
+
+    v0, vt, y0 = np.broadcast_arrays(*(np.asarray(p, dtype=float)\
+        for p in (v0, vt, y0)))
+
+    def flight(theta):
+        return landing_range(v0, vt, theta, y0, g, dt)[0]
+
+    angles = np.linspace(bounds[0], bounds[1], grid)
+    ranges = flight(angles.reshape((grid,) + (1,) * v0.ndim))
+    best = np.argmax(ranges, axis=0)
+    spacing = angles[1] - angles[0]
+    a = np.maximum(angles[best] - spacing, bounds[0])
+    b = np.minimum(angles[best] + spacing, bounds[1])
+
+    ratio = (np.sqrt(5) - 1) / 2
+    c = b - ratio * (b - a)
+    d = a + ratio * (b - a)
+    f_c, f_d = flight(c), flight(d)
+    while np.max(b - a) > xtol:
+        # Keep the side holding the larger range; one new flight per lane.
+        left = f_c > f_d
+        a, b = np.where(left, a, c), np.where(left, d, b)
+        c, d = np.where(left, b - ratio * (b - a), d),\
+            np.where(left, c, a + ratio * (b - a))
+        new = flight(np.where(left, c, d))
+        f_c, f_d = np.where(left, new, f_d), np.where(left, f_c, new)
+
+    angle = (a + b) / 2
+
+    return angle, flight(angle)
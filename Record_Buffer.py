@@ -0,0 +1,142 @@
+import numpy as np
+from typing import Optional
+
+
+class RecordBuffer:
+    """
+    A growable table of records for simulation loops, to use instead of
+    np.append, which copies the whole array on every step. Each column is
+    its own array of fixed dtype; the capacity doubles when it runs out, so
+    appending n rows costs O(n) in total.
+
+    With maxlen set it becomes a ring buffer that only keeps the last maxlen
+    rows, in memory bounded by 2 * maxlen rows: when the storage fills up,
+    the rows kept are copied to the front of fresh storage. The columns are
+    therefore always contiguous and are handed out as views, without
+    copying, and storage that has been handed out is never written over.
+
+    Example
+    -------
+    trajectory = RecordBuffer([('t', float), ('x', float), ('y', float)])
+    while y >= 0:
+        ...
+        trajectory.append(t, x, y)
+    x_calculated = trajectory['x']
+    """
+
+    def __init__(self, columns, capacity: int = 1024,\
+        maxlen: Optional[int] = None):
+        """
+        Parameters
+        ----------
+        - columns (list): The columns as (name, dtype) or (name, dtype,
+        shape) tuples, as for a numpy structured dtype; a column with a shape
+        holds an array per row, e.g. ('position', float, 3).
+        - capacity (int): The number of rows to allocate at first.
+        - maxlen (int): The most rows kept; the oldest are dropped first.
+        None keeps every row.
+        """
+
+        if maxlen is not None and maxlen < 1:
+            raise ValueError("maxlen must be at least 1.")
+        dtype = np.dtype(columns)
+        self.names = dtype.names
+        self.maxlen = maxlen
+        if maxlen is not None:
+            capacity = min(capacity, 2 * maxlen)
+        capacity = max(capacity, 1)
+        self._fields = [dtype.fields[name][0] for name in self.names]
+        self._data = [np.empty((capacity,) + field.shape, dtype=field.base)\
+            for field in self._fields]
+        self._start = 0
+        self._stop = 0
+
+    def __len__(self) -> int:
+        return self._stop - self._start
+
+    @property
+    def capacity(self) -> int:
+        """The number of rows the storage holds before it grows or shifts."""
+        return len(self._data[0])
+
+    def _reserve(self, rows: int) -> None:
+        """Makes room for rows more rows at the end of the storage."""
+
+        if self._stop + rows <= self.capacity:
+            return
+        size = len(self)
+        capacity = self.capacity
+        while capacity < size + rows:
+            capacity *= 2
+        if self.maxlen is not None:
+            # Ring mode: the storage stays at 2 * maxlen rows, and the rows
+            # kept start it afresh rather than being moved within it, which
+            # would overwrite the views taken earlier.
+            capacity = max(min(capacity, 2 * self.maxlen), size + rows)
+        for i, column in enumerate(self._data):
+            grown = np.empty((capacity,) + column.shape[1:],\
+                dtype=column.dtype)
+            grown[:size] = column[self._start:self._stop]
+            self._data[i] = grown
+        self._start, self._stop = 0, size
+
+    def _trim(self) -> None:
+        """Drops the oldest rows beyond maxlen."""
+        if self.maxlen is not None and len(self) > self.maxlen:
+            self._start = self._stop - self.maxlen
+
+    def append(self, *values, **named) -> None:
+        """
+        Adds one row, with a value per column either in column order or by
+        name.
+        """
+
+        if named:
+            values = tuple(named[name] for name in self.names)
+        if len(values) != len(self.names):
+            raise ValueError("Expected a value for each of the columns {0}."\
+                .format(self.names))
+        self._reserve(1)
+        for column, value in zip(self._data, values):
+            column[self._stop] = value
+        self._stop += 1
+        self._trim()
+
+    def extend(self, *values, **named) -> None:
+        """
+        Adds many rows, with an array per column either in column order or
+        by name, each holding one entry per row.
+        """
+
+        if named:
+            values = tuple(named[name] for name in self.names)
+        if len(values) != len(self.names):
+            raise ValueError("Expected an array for each of the columns {0}."\
+                .format(self.names))
+        rows = len(values[0])
+        if self.maxlen is not None and rows > self.maxlen:
+            # Only the last maxlen rows of the batch would be kept anyway.
+            values = tuple(np.asarray(v)[-self.maxlen:] for v in values)
+            rows = self.maxlen
+        self._reserve(rows)
+        for column, value in zip(self._data, values):
+            column[self._stop:self._stop + rows] = value
+        self._stop += rows
+        self._trim()
+
+    def __getitem__(self, name: str) -> np.ndarray:
+        """
+        A view of one column, oldest row first. It keeps its values, but
+        does not see rows appended after it was taken, in ring mode too and
+        after clear().
+        """
+        return self._data[self.names.index(name)][self._start:self._stop]
+
+    def columns(self) -> tuple:
+        """Views of every column, in order."""
+        return tuple(self[name] for name in self.names)
+
+    def clear(self) -> None:
+        """Removes every row, leaving the views taken so far as they are."""
+        self._data = [np.empty_like(column) for column in self._data]
+        self._start = self._stop = 0
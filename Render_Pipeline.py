@@ -0,0 +1,184 @@
+import numpy as np
+from typing import Callable, Optional, Sequence
+
+
+def _vpython():
+    """Imports vpython only when something is actually drawn."""
+    try:
+        import vpython
+    except ImportError:
+        raise ImportError("Rendering needs vpython; the physics in this repo "\
+            "runs without it.") from None
+    return vpython
+
+
+def decimate(points: np.ndarray, budget: int) -> np.ndarray:
+    """
+    Picks at most budget evenly spaced rows of points, always keeping the
+    first and last ones.
+
+    Parameters
+    ----------
+    - points (array): The points, one per row.
+    - budget (int): The most points to keep; at least 2.
+
+    Returns
+    -------
+    - points (array): The kept rows, a view when possible.
+    """
+
+    n = len(points)
+    if n <= budget:
+        return points
+    stride = int(np.ceil((n - 1) / (budget - 1)))
+    kept = points[::stride]
+    if (n - 1) % stride != 0:
+        kept = np.concatenate((kept, points[-1:]))
+
+    return kept
+
+
+class TrailBuffer:
+    """
+    A trail that never holds more than a fixed number of points. Points are
+    kept every stride pushes; when the buffer fills up every other point is
+    dropped and the stride doubles, so the trail always spans the whole run
+    with at most budget points.
+    """
+
+    def __init__(self, budget: int, dim: int = 3):
+        """
+        Parameters
+        ----------
+        - budget (int): The most points the trail holds; at least 2.
+        - dim (int): The number of coordinates per point.
+        """
+
+        if budget < 2:
+            raise ValueError("A trail needs a budget of at least 2 points.")
+        self.points = np.empty((budget, dim))
+        self.size = 0
+        self.stride = 1
+        self.pushed = 0
+        # Whether the last push compacted the buffer, so a drawn curve needs
+        # to be redrawn rather than appended to.
+        self.compacted = False
+
+    def push(self, point: np.ndarray) -> bool:
+        """
+        Offers a new point to the trail.
+
+        Returns
+        -------
+        - stored (bool): Whether the point was kept.
+        """
+
+        self.compacted = False
+        keep = self.pushed % self.stride == 0
+        self.pushed += 1
+        if not keep:
+            return False
+
+        if self.size == len(self.points):
+            half = (self.size + 1) // 2
+            self.points[:half] = self.points[:self.size:2]
+            self.size = half
+            self.stride *= 2
+            self.compacted = True
+        self.points[self.size] = point
+        self.size += 1
+
+        return True
+
+    def view(self) -> np.ndarray:
+        """The stored points, oldest first, as a view."""
+        return self.points[:self.size]
+
+
+class _TrailCurve:
+    """Keeps a vpython curve in step with a TrailBuffer."""
+
+    def __init__(self, obj, budget: int):
+        vp = _vpython()
+        self.buffer = TrailBuffer(budget)
+        self.curve = vp.curve(color=obj.color)
+        self.vec = vp.vec
+
+    def push(self, point: np.ndarray) -> None:
+        if not self.buffer.push(point):
+            return
+        if self.buffer.compacted:
+            self.curve.clear()
+            self.curve.append([self.vec(*p) for p in self.buffer.view()])
+        else:
+            self.curve.append(self.vec(*point))
+
+
+def animate(step: Callable[[], None], positions: Callable[[], np.ndarray],\
+    objects: Sequence, substeps: int = 10, fps: int = 60,\
+    trail_budget: Optional[int] = 2000, frames: Optional[int] = None) -> None:
+    """
+    Runs a simulation live in vpython, drawing only once per frame. The
+    physics takes substeps steps between frames, so its speed is set by the
+    cost of the physics, not by the frame rate, and each trail is held to a
+    fixed number of points however long the run.
+
+    Parameters
+    ----------
+    - step (function): Advances the simulation by one step; called with no
+    arguments.
+    - positions (function): Returns the current (N, 3) positions of the N
+    drawn bodies.
+    - objects (sequence): The N vpython objects to move, e.g. spheres.
+    - substeps (int): The number of physics steps per frame.
+    - fps (int): The frame rate limit passed to vpython's rate.
+    - trail_budget (int): The most points in each body's trail, or None for
+    no trails.
+    - frames (int): The number of frames to draw; forever if None.
+    """
+
+    vp = _vpython()
+    trails = [_TrailCurve(obj, trail_budget) for obj in objects]\
+        if trail_budget else []
+
+    frame = 0
+    while frames is None or frame < frames:
+        for i in range(substeps):
+            step()
+        current = np.asarray(positions(), dtype=float)
+        for obj, point in zip(objects, current):
+            obj.pos = vp.vec(*point)
+        for trail, point in zip(trails, current):
+            trail.push(point)
+        vp.rate(fps)
+        frame += 1
+
+
+def replay(trajectory: np.ndarray, objects: Sequence, frames: int = 1000,\
+    fps: int = 60, trail_budget: Optional[int] = 2000) -> None:
+    """
+    Plays back a precomputed trajectory in vpython, e.g. the output of
+    N_Body or Symplectic, in a fixed number of frames.
+
+    Parameters
+    ----------
+    - trajectory (3-d array): The (steps, N, 3) positions of the N bodies.
+    - objects (sequence): The N vpython objects to move.
+    - frames (int): The most frames to show; the trajectory is decimated to
+    fit.
+    - fps (int): The frame rate limit passed to vpython's rate.
+    - trail_budget (int): The most points in each body's trail, or None for
+    no trails.
+    """
+
+    vp = _vpython()
+    trajectory = decimate(np.asarray(trajectory, dtype=float), frames)
+    trails = [_TrailCurve(obj, trail_budget) for obj in objects]\
+        if trail_budget else []
+
+    for current in trajectory:
+        for obj, point in zip(objects, current):
+            obj.pos = vp.vec(*point)
+        for trail, point in zip(trails, current):
+            trail.push(point)
+        vp.rate(fps)
@@ -0,0 +1,240 @@
+import numpy as np
+from typing import Callable, Optional, Tuple
+
+
+def _newton(fun: Callable, x: np.ndarray, args: Tuple[np.ndarray, ...],\
+    fprime: Optional[Callable], fprime2: Optional[Callable], tol: float,\
+    rtol: float, max_iter: int) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Runs vectorized Newton, Halley or secant iterations on flat arrays, only
+    evaluating the elements that have not converged yet.
+    """
+
+    x = x.copy()
+    converged = np.zeros(len(x), dtype=bool)
+    active = np.arange(len(x))
+    xa, aa = x.copy(), args
+    if fprime is None:
+        # Second point of the secant method, as chosen by scipy's newton.
+        xp = xa * (1 + 1e-4) + np.where(xa >= 0, 1e-4, -1e-4)
+        fp = fun(xp, *aa)
+
+    for i in range(max_iter):
+        f = fun(xa, *aa)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            if fprime is None:
+                step = f * (xa - xp) / (f - fp)
+                xp, fp = xa, f
+            else:
+                df = fprime(xa, *aa)
+                step = f / df
+                if fprime2 is not None:
+                    # Halley's correction.
+                    step = step / (1 - (0.5 * step * fprime2(xa, *aa) / df))
+            new = xa - step
+            done = np.abs(step) <= tol + (rtol * np.abs(new))
+
+        # A zero derivative or slope gives no step to take; give up there.
+        failed = ~np.isfinite(new)
+        x[active] = np.where(failed, xa, new)
+        converged[active[done & ~failed]] = True
+
+        keep = ~(done | failed)
+        if not np.any(keep):
+            break
+        if np.all(keep):
+            xa = new
+            continue
+        active = active[keep]
+        xa = new[keep]
+        aa = tuple(a if np.ndim(a) == 0 else a[keep] for a in aa)
+        if fprime is None:
+            xp, fp = xp[keep], fp[keep]
+
+    return x, converged
+
+
+def newton(fun: Callable[..., np.ndarray], x0, args: Tuple = (),\
+    fprime: Optional[Callable[..., np.ndarray]] = None,\
+    fprime2: Optional[Callable[..., np.ndarray]] = None, tol: float = 1.48e-8,\
+    rtol: float = 0.0, max_iter: int = 50, continuation: bool = False)\
+    -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Solves fun(x, *args) = 0 for a whole array of parameters at once with
+    Newton's method, Halley's method if fprime2 is given, or the secant
+    method if fprime is not. Each element stops iterating as soon as it has
+    converged, and only the rest are evaluated again.
+
+    Parameters
+    ----------
+    - fun (function): A vectorized function of the form fun(x, *args).
+    - x0 (float or array): The initial guess.
+    - args (tuple): Additional parameters, each a scalar or an array. x0 and
+    args are broadcast together and each element is one equation.
+    - fprime (function): The derivative of fun with respect to x, of the
+    same form.
+    - fprime2 (function): The second derivative, for Halley's method.
+    - tol (float): The absolute tolerance on the last step.
+    - rtol (float): The relative tolerance on the last step.
+    - max_iter (int): The most iterations for any element.
+    - continuation (bool): Warm-start the elements from their neighbours'
+    roots. The elements are taken in C order, as a path along which the
+    parameters change smoothly, e.g. a sweep or a grid with the fastest
+    varying parameter last. Every 2**j-th element is solved from x0 first,
+    then each level in between starts from the root before it. Elements
+    that fail from a warm start are retried from x0.
+
+    Returns
+    -------
+    - root (array): The roots, of the broadcast shape.
+    - converged (array): Whether each root converged.
+    """
+
+    args = tuple(np.asarray(a) for a in args)
+    # np.broadcast rather than np.broadcast_shapes, which needs numpy 1.20.
+    shape = np.broadcast(x0, *args).shape
+    x0 = np.broadcast_to(np.asarray(x0, dtype=float), shape).ravel()
+    # Scalars stay scalars so they are not copied on every iteration.
+    args = tuple(a if a.ndim == 0 else np.broadcast_to(a, shape).ravel()\
+        for a in args)
+    size = len(x0)
+
+    def solve(index: np.ndarray, start: np.ndarray):
+        return _newton(fun, start, tuple(a if a.ndim == 0 else a[index]\
+            for a in args), fprime, fprime2, tol, rtol, max_iter)
+
+    if not continuation or size < 4:
+        root, converged = solve(np.arange(size), x0)
+        return root.reshape(shape), converged.reshape(shape)
+
+    root = np.empty(size)
+    converged = np.zeros(size, dtype=bool)
+    stride = 1 << int(np.log2(size - 1))
+    index = np.arange(0, size, stride)
+    root[index], converged[index] = solve(index, x0[index])
+    while stride > 1:
+        # Solve the midpoints of the last level from the root before each.
+        index = np.arange(stride // 2, size, stride)
+        start = np.where(converged[index - (stride // 2)],\
+            root[index - (stride // 2)], x0[index])
+        root[index], converged[index] = solve(index, start)
+        stride //= 2
+
+    retry = np.flatnonzero(~converged)
+    if len(retry):
+        root[retry], converged[retry] = solve(retry, x0[retry])
+
+    return root.reshape(shape), converged.reshape(shape)
+
+
+def _illinois(fun: Callable, lo: np.ndarray, hi: np.ndarray, f_lo: np.ndarray,\
+    f_hi: np.ndarray, args: Tuple[np.ndarray, ...], xtol: float, rtol: float,\
+    max_iter: int) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Refines many brackets at once with the Illinois variant of false
+    position, falling back to bisection when the false position point
+    stalls next to one end of the bracket.
+    """
+
+    root = (lo + hi) / 2
+    f_root = np.zeros_like(root)
+    converged = np.zeros(len(lo), dtype=bool)
+    active = np.arange(len(lo))
+    # Which end was kept on the last step: -1 for lo, 1 for hi, 0 neither.
+    side = np.zeros(len(lo), dtype=np.int8)
+
+    for i in range(max_iter):
+        with np.errstate(divide='ignore', invalid='ignore'):
+            c = hi - (f_hi * (hi - lo) / (f_hi - f_lo))
+        width = hi - lo
+        bad = ~np.isfinite(c) | (np.abs(c - lo) < 0.01 * np.abs(width))\
+            | (np.abs(hi - c) < 0.01 * np.abs(width))
+        # Bisect every few steps regardless, so the width always shrinks.
+        if i % 4 == 3:
+            bad[:] = True
+        c = np.where(bad, (lo + hi) / 2, c)
+        f = fun(c, *args)
+
+        left = np.sign(f) == np.sign(f_lo)
+        # Illinois: halve the value of an end kept twice in a row.
+        f_hi = np.where(left & (side == 1), f_hi / 2, f_hi)
+        f_lo = np.where(~left & (side == -1), f_lo / 2, f_lo)
+        side = np.where(left, 1, -1).astype(np.int8)
+        lo, f_lo = np.where(left, c, lo), np.where(left, f, f_lo)
+        hi, f_hi = np.where(left, hi, c), np.where(left, f_hi, f)
+
+        root[active], f_root[active] = c, f
+        done = (f == 0) | (np.abs(hi - lo) <= xtol + (rtol * np.abs(c)))
+        converged[active[done]] = True
+        keep = ~done
+        if not np.any(keep):
+            break
+        if not np.all(keep):
+            active = active[keep]
+            lo, hi, f_lo, f_hi = lo[keep], hi[keep], f_lo[keep], f_hi[keep]
+            side = side[keep]
+            args = tuple(a if np.ndim(a) == 0 else a[keep] for a in args)
+
+    return root, f_root, converged
+
+
+def all_roots(fun: Callable[..., np.ndarray], a, b, args: Tuple = (),\
+    points: int = 1000, xtol: float = 2e-12, rtol: float = 4 * np.finfo(float).eps,\
+    max_iter: int = 100) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Finds all the roots of fun(x, *args) = 0 on [a, b], for one function or a
+    batch of them. fun is evaluated on a grid of points to find sign changes,
+    and every bracket found, from every function of the batch, is refined at
+    once by the Illinois method.
+
+    Roots closer together than the grid spacing, and double roots where fun
+    touches zero without changing sign, can be missed. Sign changes across
+    poles are dropped, as fun does not get smaller there.
+
+    Parameters
+    ----------
+    - fun (function): A vectorized function of the form fun(x, *args).
+    - a, b (float or array): The ends of the interval.
+    - args (tuple): Additional parameters, each a scalar or an array. a, b
+    and args are broadcast together, and each element of the broadcast shape
+    is one function of the batch.
+    - points (int): The number of grid points in each interval.
+    - xtol (float): The absolute tolerance of the roots.
+    - rtol (float): The relative tolerance of the roots.
+    - max_iter (int): The most refinement iterations.
+
+    Returns
+    -------
+    - roots (1-d array): Every root found, ordered by function and then by
+    value.
+    - index (1-d array): The flat index in the batch of the function each
+    root belongs to; use np.unravel_index for a batch of more than one
+    dimension, or ignore it for a single function.
+    """
+
+    args = tuple(np.asarray(p) for p in args)
+    shape = np.broadcast(a, b, *args).shape
+    a = np.broadcast_to(np.asarray(a, dtype=float), shape).reshape(-1, 1)
+    b = np.broadcast_to(np.asarray(b, dtype=float), shape).reshape(-1, 1)
+    args = tuple(p if p.ndim == 0 else np.broadcast_to(p, shape).ravel()\
+        for p in args)
+
+    # One row of the grid per function.
+    grid = a + ((b - a) * np.linspace(0, 1, points))
+    f = fun(grid, *(p if p.ndim == 0 else p[:, np.newaxis] for p in args))
+
+    exact = np.nonzero(f == 0)
+    row, column = np.nonzero((f[:, :-1] * f[:, 1:]) < 0)
+    lo, hi = grid[row, column], grid[row, column + 1]
+    f_lo, f_hi = f[row, column], f[row, column + 1]
+    root, f_root, converged = _illinois(fun, lo, hi, f_lo, f_hi,\
+        tuple(p if p.ndim == 0 else p[row] for p in args), xtol, rtol,\
+        max_iter)
+    real = converged & (np.abs(f_root) <= np.maximum(np.abs(f_lo),\
+        np.abs(f_hi)))
+
+    roots = np.concatenate((grid[exact], root[real]))
+    index = np.concatenate((exact[0], row[real]))
+    order = np.lexsort((roots, index))
+
+    return roots[order], index[order]
@@ -0,0 +1,259 @@
+import numpy as np
+import scipy.sparse as sp
+from scipy.linalg import lu_factor, lu_solve
+from scipy.sparse.linalg import splu
+from typing import Callable, Dict, Optional, Tuple
+
+
+# ROS2 (Verwer et al., 1999). It keeps 2nd order for any approximation of the
+# Jacobian, which is what lets the Jacobian be reused over many steps.
+GAMMA = 1 + (1 / np.sqrt(2))
+
+# Step size controller settings.
+SAFETY = 0.9
+MIN_FACTOR = 0.2
+MAX_FACTOR = 5.0
+# Keep the step, and so the factorization, if the controller only asks for a
+# change inside this band.
+KEEP_BAND = (1.0, 1.2)
+
+
+def color_columns(sparsity) -> np.ndarray:
+    """
+    Groups the columns of a Jacobian so that no two columns in a group have a
+    nonzero in the same row. All the columns of a group can then be estimated
+    with a single finite-difference evaluation.
+
+    Parameters
+    ----------
+    - sparsity (2-d array or sparse matrix): An (n, n) matrix that is nonzero
+    wherever the Jacobian may be nonzero.
+
+    Returns
+    -------
+    - colors (1-d array): The group number of each column.
+    """
+
+    # int32 so the count of rows two columns share cannot wrap round to 0.
+    S = sp.csc_matrix(sparsity, dtype=bool).astype(np.int32)
+    # Two columns conflict if they share a row.
+    conflicts = (S.T @ S).tolil()
+    n = S.shape[1]
+    colors = np.full(n, -1)
+
+    # Greedy coloring, densest columns first.
+    order = np.argsort(-np.diff(S.indptr), kind='stable')
+    for j in order:
+        used = {colors[k] for k in conflicts.rows[j] if colors[k] >= 0}
+        color = 0
+        while color in used:
+            color += 1
+        colors[j] = color
+
+    return colors
+
+
+def fd_jacobian(fun: Callable[[float, np.ndarray], np.ndarray], x: float,\
+    y: np.ndarray, f0: np.ndarray, sparsity=None,\
+    colors: Optional[np.ndarray] = None):
+    """
+    Estimates the Jacobian of fun with forward differences.
+
+    Parameters
+    ----------
+    - fun (function): The right-hand side, fun(x, y).
+    - x (float): The x value to evaluate at.
+    - y (1-d array): The state to evaluate at.
+    - f0 (1-d array): fun(x, y), already computed.
+    - sparsity (2-d array or sparse matrix): Optional sparsity pattern of the
+    Jacobian. If given, the result is a sparse CSC matrix.
+    - colors (1-d array): The column groups from color_columns(sparsity);
+    computed if not given.
+
+    Returns
+    -------
+    - J (2-d array or sparse matrix): The estimated Jacobian.
+    - nfev (int): The number of evaluations of fun used.
+    """
+
+    n = len(y)
+    step = np.sqrt(np.finfo(float).eps) * np.maximum(1.0, np.abs(y))
+    # Make the perturbation exactly representable.
+    step = (y + step) - y
+
+    if sparsity is None:
+        J = np.empty((n, n))
+        for j in range(n):
+            y_step = y.copy()
+            y_step[j] += step[j]
+            J[:, j] = (fun(x, y_step) - f0) / step[j]
+        return J, n
+
+    S = sp.csc_matrix(sparsity, dtype=bool)
+    if colors is None:
+        colors = color_columns(S)
+    rows, cols = S.nonzero()
+    values = np.empty(len(rows))
+
+    num_colors = int(colors.max()) + 1
+    for color in range(num_colors):
+        group = colors == color
+        y_step = y + np.where(group, step, 0.0)
+        df = fun(x, y_step) - f0
+        # Within a group each row belongs to at most one column.
+        mask = group[cols]
+        values[mask] = df[rows[mask]] / step[cols[mask]]
+
+    return sp.csc_matrix((values, (rows, cols)), shape=(n, n)), num_colors
+
+
+def Rosenbrock(diff_fun: Callable[..., np.ndarray],\
+    x_span: Tuple[float, float], initial_value: np.ndarray, params: Tuple,\
+    rtol: float = 1e-4, atol: float = 1e-8, jac: Optional[Callable] = None,\
+    jac_sparsity=None, first_step: Optional[float] = None,\
+    max_step: float = np.inf, max_jac_age: int = 20, system: bool = False)\
+    -> Tuple[np.ndarray, np.ndarray, Dict[str, int]]:
+    """
+    Integrates a stiff differential equation with the adaptive-step, linearly
+    implicit ROS2 Rosenbrock method. The Jacobian is estimated by finite
+    differences (grouped by column coloring when a sparsity pattern is given)
+    and reused across steps; it is only recomputed after a rejected step or
+    every max_jac_age steps.
+
+    Parameters
+    ----------
+    - diff_fun (function): A function of the form f(x, Y, *args). By default,
+    as in Runge_Kutta_4, it returns the value of the highest-order derivative
+    and Y is a vector of y(x) and its lower-order derivatives. With system set,
+    it returns the derivative of every element of Y instead, as needed for
+    decay chains and reaction networks.
+    - x_span (2-tuple): A tuple of the form (min, max) for the range over which
+    x will be integrated.
+    - initial_value (1-d array): An array of the initial values.
+    - params (n-tuple): A tuple of any additional parameters for diff_fun.
+    - rtol (float): The relative tolerance of the local error.
+    - atol (float): The absolute tolerance of the local error.
+    - jac (function): An optional analytic Jacobian of the form
+    jac(x, Y, *args), dense or sparse, used instead of finite differences.
+    - jac_sparsity (2-d array or sparse matrix): Optional sparsity pattern of
+    the Jacobian, which enables colored finite differences and sparse LU.
+    - first_step (float): The initial step size; estimated if not given.
+    - max_step (float): The largest step size allowed.
+    - max_jac_age (int): The most steps a Jacobian is reused for.
+    - system (bool): Whether diff_fun returns the full derivative vector.
+
+    Returns
+    -------
+    - x (1-d array): The x values of the accepted steps.
+    - y (2-d array): A matrix containing the values of the state vector for
+    each x value.
+    - stats (dict): Counts of 'steps', 'rejected' steps, right-hand side
+    evaluations 'nfev', Jacobian evaluations 'njev' and factorizations 'nlu'.
+    """
+
+    if system:
+        def fun(x: float, y: np.ndarray) -> np.ndarray:
+            return np.asarray(diff_fun(x, y, *params), dtype=float)
+    else:
+        def fun(x: float, y: np.ndarray) -> np.ndarray:
+            # The lower-order derivatives are the next entries of the state.
+            dy = np.empty_like(y)
+            dy[:-1] = y[1:]
+            dy[-1] = diff_fun(x, y, *params)
+            return dy
+
+    x_start, x_end = x_span
+    direction = np.sign(x_end - x_start) if x_end != x_start else 1.0
+    y_n = np.array(initial_value, dtype=float)
+    n = len(y_n)
+    x_n = x_start
+
+    sparse = jac_sparsity is not None
+    colors = color_columns(jac_sparsity) if sparse else None
+    identity = sp.identity(n, format='csc') if sparse else np.eye(n)
+    stats = {'steps': 0, 'rejected': 0, 'nfev': 0, 'njev': 0, 'nlu': 0}
+
+    def jacobian(x: float, y: np.ndarray, f: np.ndarray):
+        stats['njev'] += 1
+        if jac is not None:
+            J = jac(x, y, *params)
+            return sp.csc_matrix(J) if sparse else np.asarray(J, dtype=float)
+        J, nfev = fd_jacobian(fun, x, y, f, jac_sparsity, colors)
+        stats['nfev'] += nfev
+        return J
+
+    def factor(J, h: float) -> Callable[[np.ndarray], np.ndarray]:
+        stats['nlu'] += 1
+        W = identity - ((GAMMA * h) * J)
+        if sparse:
+            return splu(sp.csc_matrix(W)).solve
+        lu = lu_factor(W)
+        return lambda b: lu_solve(lu, b)
+
+    f_n = fun(x_n, y_n)
+    stats['nfev'] += 1
+    J = jacobian(x_n, y_n, f_n)
+    jac_age = 0
+
+    if first_step is None:
+        # Aim for a first-order error of about the tolerance.
+        scale = atol + (np.abs(y_n) * rtol)
+        rate = np.linalg.norm(f_n / scale) / np.sqrt(n)
+        h_abs = 1e-6 if rate == 0 else min(0.01 / rate, abs(x_end - x_n))
+    else:
+        h_abs = abs(first_step)
+    h_abs = min(h_abs, max_step)
+
+    xs, ys = [x_n], [y_n.copy()]
+    solve, h_factored = None, None
+
+    while direction * (x_end - x_n) > 0:
+        h_abs = min(h_abs, abs(x_end - x_n))
+        h = h_abs * direction
+        if h_abs < 10 * np.abs(np.nextafter(x_n, direction * np.inf) - x_n):
+            raise RuntimeError(f"Step size underflow at x = {x_n}.")
+        if solve is None or h != h_factored:
+            solve, h_factored = factor(J, h), h
+
+        k1 = solve(f_n)
+        f_mid = fun(x_n + h, y_n + (h * k1))
+        k2 = solve(f_mid - (2 * k1))
+        stats['nfev'] += 1
+        y_new = y_n + (h * ((1.5 * k1) + (0.5 * k2)))
+
+        # Difference from the embedded 1st-order solution y_n + h k1.
+        scale = atol + (np.maximum(np.abs(y_n), np.abs(y_new)) * rtol)
+        error = np.linalg.norm((h * 0.5 * (k1 + k2)) / scale) / np.sqrt(n)
+
+        if error > 1 or not np.all(np.isfinite(y_new)):
+            stats['rejected'] += 1
+            factor_h = MIN_FACTOR if not np.isfinite(error)\
+                else max(MIN_FACTOR, SAFETY / np.sqrt(error))
+            h_abs *= factor_h
+            # A poor step often means the Jacobian has gone stale.
+            if jac_age > 0:
+                J = jacobian(x_n, y_n, f_n)
+                jac_age = 0
+                solve = None
+            continue
+
+        x_n, y_n = x_n + h, y_new
+        f_n = fun(x_n, y_n)
+        stats['nfev'] += 1
+        stats['steps'] += 1
+        xs.append(x_n)
+        ys.append(y_n)
+
+        jac_age += 1
+        if jac_age >= max_jac_age:
+            J = jacobian(x_n, y_n, f_n)
+            jac_age = 0
+            solve = None
+
+        factor_h = MAX_FACTOR if error == 0\
+            else min(MAX_FACTOR, SAFETY / np.sqrt(error))
+        if not KEEP_BAND[0] <= factor_h <= KEEP_BAND[1]:
+            h_abs *= factor_h
+        h_abs = min(h_abs, max_step)
+
+    return np.array(xs), np.array(ys), stats
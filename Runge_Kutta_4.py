@@ -1,5 +1,22 @@
 import numpy as np
-from typing import Callable, Tuple
+import Events
+import JIT_Backend
+from typing import Any, Callable, Iterator, Optional, Sequence, Tuple
+
+
+def _stage(f: Callable[..., float], x: float, y: np.ndarray, params: Tuple,\
+    h: float, k: np.ndarray) -> None:
+    """
+    Fills k with one RK4 stage, h * dY/dx, for the trial state y.
+
+    The lower-order derivatives are just the next entries of the state, so 
+    they are shifted in directly and only the highest one needs f. Works on a 
+    single state vector or on a (batch, n) ensemble alike.
+    """
+
+    k[..., :-1] = y[..., 1:]
+    k[..., -1] = f(x, y, *params)
+    k *= h
 
 
 def step_1(f: Callable[..., float], x: float, y: np.array, params: Tuple,\
@@ -21,19 +38,8 @@ def step_1(f: Callable[..., float], x: float, y: np.array, params: Tuple,\
     - y_int (1-d array): The vector of integrated values at position x.
     """
 
-    # Initialize the output vector.
-    n = len(y)
-    y_int = np.zeros(n)
-
-    # Find dym/dx using the given function, then use it to compute dym-1/dx.
-    y_int[0] = f(x, y, *params) * h
-
-    # Starting with dym-1/dx, compute the other values down to y/dx.
-    for i in range(1, n):
-        y_int[i] = y[n-i] * h
-
-    # Reverse the output vector so y/dx is on top.
-    y_int = np.flipud(y_int)
+    y_int = np.empty(np.shape(y))
+    _stage(f, x, y, params, h, y_int)
 
     return y_int
 
@@ -58,19 +64,8 @@ def step_2(f: Callable[..., float], x: float, y: np.array, params: Tuple,\
     - y (1-d array): The vector of derivative values at position x.
     """
 
-    # Initialize the output vector.
-    n = len(y)
-    y_int = np.zeros(n)
-
-    # Find dym/dx using the given function, then use it to compute dym-1/dx.
-    y_int[0] = f(x + (h / 2), y + (k1 / 2), *params) * h
-
-    # Starting with dym-1/dx, compute the other values down to y/dx.
-    for i in range(1, n):
-        y_int[i] = (y[n-i] + (k1[n-i] / 2)) * h
-
-    # Reverse the output vector so y/dx is on top.
-    y_int = np.flipud(y_int)
+    y_int = np.empty(np.shape(y))
+    _stage(f, x + (h / 2), y + (k1 / 2), params, h, y_int)
 
     return y_int
 
@@ -95,19 +90,8 @@ def step_3(f: Callable[..., float], x: float, y: np.array, params: Tuple,\
     - y (1-d array): The vector of derivative values at position x.
     """
 
-    # Initialize the output vector.
-    n = len(y)
-    y_int = np.zeros(n)
-
-    # Find dym/dx using the given function, then use it to compute dym-1/dx.
-    y_int[0] = f(x + (h / 2), y + (k2 / 2), *params) * h
-
-    # Starting with dym-1/dx, compute the other values down to y/dx.
-    for i in range(1, n):
-        y_int[i] = (y[n-i] + (k2[n-i] / 2)) * h
-
-    # Reverse the output vector so y/dx is on top.
-    y_int = np.flipud(y_int)
+    y_int = np.empty(np.shape(y))
+    _stage(f, x + (h / 2), y + (k2 / 2), params, h, y_int)
 
     return y_int
 
@@ -132,26 +116,62 @@ def step_4(f: Callable[..., float], x: float, y: np.array, params: Tuple,\
     - y (1-d array): The vector of derivative values at position x.
     """
 
-    # Initialize the output vector.
-    n = len(y)
-    y_int = np.zeros(n)
+    y_int = np.empty(np.shape(y))
+    _stage(f, x + h, y + k3, params, h, y_int)
 
-    # Find dym/dx using the given function, then use it to compute dym-1/dx.
-    y_int[0] = f(x + h, y + k3, *params) * h
+    return y_int
 
-    # Starting with dym-1/dx, compute the other values down to y/dx.
-    for i in range(1, n):
-        y_int[i] = (y[n-i] + k3[n-1]) * h
 
-    # Reverse the output vector so y/dx is on top.
-    y_int = np.flipud(y_int)
+def step_fused(f: Callable[..., float], x: float, y: np.ndarray,\
+    params: Tuple, h: float, work: np.ndarray, out: np.ndarray) -> np.ndarray:
+    """
+    Computes a complete RK4 step, all four stages and their weighted sum, 
+    without allocating any arrays.
 
-    return y_int
+    Parameters
+    ----------
+    - f (function): The equation which RK4 is being used to evaluate.
+    - x (float): The x coordinate at the start of the step.
+    - y (array): The state at x; a vector, or a (batch, n) ensemble.
+    - params (n-tuple): Any additional parameters of f.
+    - h (float): The step size of x.
+    - work (array): Scratch space of shape (5,) + y.shape, reused between 
+    steps. Its contents are overwritten.
+    - out (array): Where the state at x + h is written; may be y itself.
+
+    Returns
+    -------
+    - out (array): The state at x + h.
+    """
+
+    k1, k2, k3, k4, y_trial = work
+
+    _stage(f, x, y, params, h, k1)
+    np.multiply(k1, 0.5, out=y_trial)
+    y_trial += y
+    _stage(f, x + (h / 2), y_trial, params, h, k2)
+    np.multiply(k2, 0.5, out=y_trial)
+    y_trial += y
+    _stage(f, x + (h / 2), y_trial, params, h, k3)
+    np.add(y, k3, out=y_trial)
+    _stage(f, x + h, y_trial, params, h, k4)
+
+    # y + (k1 + 2 k2 + 2 k3 + k4) / 6, accumulated in place.
+    k2 += k3
+    k2 *= 2
+    k2 += k1
+    k2 += k4
+    k2 /= 6
+    np.add(y, k2, out=out)
+
+    return out
 
 
 def Runge_Kutta_4(diff_fun: Callable[..., float],\
     x_range: Tuple[float, float, float], initial_value: np.array,\
-    params: Tuple) -> Tuple[np.array, np.array]:
+    params: Tuple, out: Optional[np.ndarray] = None,\
+    events: Optional[Sequence[Callable[..., float]]] = None,\
+    event_xtol: float = 1e-12, backend: str = 'numpy') -> Tuple:
     """
     Uses the 4th-order Runge-Kutta algorithm to numerically integrate an 
     arbitrary differential function.
@@ -167,14 +187,33 @@ def Runge_Kutta_4(diff_fun: Callable[..., float],\
     - initial_value (1-d array): An array representing a vector of the initial 
     values for the function and its derivatives.
     - params (n-tuple): A tuple of any additional parameters for diff_fun.
+    - out (2-d array): An optional (num_steps, n) array to write the results 
+    into instead of allocating a new one.
+    - events (sequence of functions): Optional event functions of the form 
+    g(x, Y, *args), with the terminal and direction attributes described in 
+    Events.event_settings. Each zero crossing is located to event_xtol on the 
+    cubic Hermite interpolant of its step.
+    - event_xtol (float): The tolerance on the x value of each event.
+    - backend (str): 'numpy', or 'numba' to compile the stepping loop together 
+    with diff_fun. Falls back to 'numpy' when numba is not installed or 
+    diff_fun can't be compiled. Not used with events.
 
     Returns
     -------
     - x (1-d array): The t values over the given range.
     - y (2-d array): A matrix of containing the values of the input vector for 
-    each t value.
+    each t value. If a terminal event stopped the integration, the last row is 
+    the state at the event itself.
+    - x_events (list of 1-d arrays): Only if events are given; the x values at 
+    which each event occurred.
+    - y_events (list of 2-d arrays): Only if events are given; the state at 
+    each of those x values.
     """
 
+    if events is not None:
+        return _Runge_Kutta_4_events(diff_fun, x_range, initial_value, params,\
+            out, events, event_xtol)
+
     # Extract the time step for ease of use and readability.
     dx = x_range[2]
     # Get the size of the parameter vector.
@@ -182,16 +221,253 @@ def Runge_Kutta_4(diff_fun: Callable[..., float],\
     # Initialize the output arrays.
     x = np.arange(x_range[0], x_range[1] + dx, dx)
     num_steps = len(x)
-    y = np.array([np.zeros(vec_size) for i in range(num_steps)])
+    if out is None:
+        y = np.empty((num_steps, vec_size))
+    elif out.shape != (num_steps, vec_size):
+        raise ValueError(f"out has shape {out.shape}, expected "\
+            f"{(num_steps, vec_size)}.")
+    else:
+        y = out
     y[0] = initial_value
+    if backend == 'numba' and JIT_Backend.Runge_Kutta_4(diff_fun, x, y, params):
+        return x, y
+    work = np.empty((5, vec_size))
 
     # Numerically compute the differential equation's parameters over the given 
     # range.
     for n in range(1, num_steps):
-        k1 = step_1(diff_fun, x[n-1], y[n-1], params, dx)
-        k2 = step_2(diff_fun, x[n-1], y[n-1], params, dx, k1)
-        k3 = step_3(diff_fun, x[n-1], y[n-1], params, dx, k2)
-        k4 = step_4(diff_fun, x[n-1], y[n-1], params, dx, k3)
-        y[n] = y[n-1] + ((k1 + (2 * k2) + (2 * k3) + k4) / 6)
+        step_fused(diff_fun, x[n-1], y[n-1], params, dx, work, y[n])
 
     return x, y
+
+
+def _Runge_Kutta_4_events(diff_fun: Callable[..., float],\
+    x_range: Tuple[float, float, float], initial_value: np.array,\
+    params: Tuple, out: Optional[np.ndarray],\
+    events: Sequence[Callable[..., float]], event_xtol: float) -> Tuple:
+    """
+    Runge_Kutta_4 with event detection. Since a terminal event usually ends 
+    the integration long before x_range[1], the output grows geometrically 
+    instead of being allocated for the whole range up front.
+    """
+
+    x_min, x_max, dx = x_range
+    vec_size = len(initial_value)
+    num_steps = max(int(np.ceil((x_max + dx - x_min) / dx)), 1)
+    if out is None:
+        y = np.empty((min(num_steps, 1024), vec_size))
+    elif out.shape != (num_steps, vec_size):
+        raise ValueError(f"out has shape {out.shape}, expected "\
+            f"{(num_steps, vec_size)}.")
+    else:
+        y = out
+    y[0] = initial_value
+    work = np.empty((5, vec_size))
+    f1 = np.empty(vec_size)
+
+    max_count, direction = Events.event_settings(events)
+    counts = np.zeros(len(events), dtype=int)
+    x_events = [[] for g in events]
+    y_events = [[] for g in events]
+    g0 = np.array([g(x_min, y[0], *params) for g in events])
+
+    n = 1
+    x_last = None
+    while n < num_steps:
+        if n == len(y):
+            y = np.concatenate((y, np.empty((min(len(y), num_steps - n),\
+                vec_size))))
+        x0 = x_min + ((n - 1) * dx)
+        x1 = x_min + (n * dx)
+        step_fused(diff_fun, x0, y[n-1], params, dx, work, y[n])
+        g1 = np.array([g(x1, y[n], *params) for g in events])
+
+        active = Events.crossings(g0, g1, direction)
+        if len(active) > 0:
+            # The first stage holds dY/dx * dx at the start of the step.
+            f0 = work[0] / dx
+            _stage(diff_fun, x1, y[n], params, 1.0, f1)
+            found = Events.locate(events, active, params, x0, x1, y[n-1],\
+                y[n], f0, f1, event_xtol)
+            for i, x_root, y_root in found:
+                counts[i] += 1
+                x_events[i].append(x_root)
+                y_events[i].append(y_root)
+                if max_count[i] and counts[i] >= max_count[i]:
+                    x_last = x_root
+                    y[n] = y_root
+                    break
+        if x_last is not None:
+            break
+
+        g0 = g1
+        n += 1
+
+    num_saved = min(n + 1, num_steps)
+    x = x_min + (np.arange(num_saved) * dx)
+    if x_last is not None:
+        x[-1] = x_last
+    x_events = [np.array(x_e) for x_e in x_events]
+    y_events = [np.array(y_e).reshape(-1, vec_size) for y_e in y_events]
+
+    return x, y[:num_saved], x_events, y_events
+
+
+def _param_columns(params: Sequence[Tuple], batch: int) -> Tuple[np.ndarray, ...]:
+    """
+    Transposes a batch of parameter tuples into one array per parameter so a 
+    vectorized diff_fun can be called once for the whole ensemble.
+
+    Parameters
+    ----------
+    - params (sequence of n-tuples): One parameter tuple per trajectory. An 
+    empty sequence means diff_fun takes no additional parameters.
+    - batch (int): The number of trajectories in the ensemble.
+
+    Returns
+    -------
+    - columns (tuple of 1-d arrays): The i-th array holds the i-th parameter of 
+    every trajectory.
+    """
+
+    if len(params) == 0:
+        return ()
+    table = np.asarray(params, dtype=float)
+    if table.ndim == 1:
+        table = table[:, np.newaxis]
+    if table.shape[0] != batch:
+        raise ValueError(f"Expected {batch} parameter tuples, got "\
+            f"{table.shape[0]}.")
+
+    return tuple(np.ascontiguousarray(table[:, i]) for i in \
+        range(table.shape[1]))
+
+
+def Runge_Kutta_4_ensemble(diff_fun: Callable[..., np.ndarray],\
+    x_range: Tuple[float, float, float], initial_values: np.ndarray,\
+    params: Sequence[Tuple] = (),\
+    reduce: Optional[Callable[[float, np.ndarray], np.ndarray]] = None)\
+    -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Uses the 4th-order Runge-Kutta algorithm to integrate many trajectories of 
+    the same differential function at once, one per initial condition and 
+    parameter set.
+
+    Parameters
+    ----------
+    - diff_fun (function): A vectorized function of the form f(x, Y, *args) 
+    where Y is a (batch, n) matrix of the values of y(x) and its derivatives 
+    for every trajectory, and each of args is a (batch,) array holding one 
+    parameter for every trajectory. It returns a (batch,) array of the 
+    highest-order derivative.
+    - x_range (3-tuple): A tuple of the form (min, max, step) for the values 
+    over which x will be evaluated.
+    - initial_values (2-d array): A (batch, n) matrix with one vector of 
+    initial values per trajectory.
+    - params (sequence of n-tuples): One tuple of additional parameters for 
+    diff_fun per trajectory. Leave empty if diff_fun takes no parameters.
+    - reduce (function): An optional function of the form reduce(x, Y) which 
+    is applied to the (batch, n) state at every x value; its results are 
+    stored instead of the full state.
+
+    Returns
+    -------
+    - x (1-d array): The x values over the given range.
+    - y (3-d array): A (steps, batch, n) array of the state of every 
+    trajectory at each x value, or the stacked output of reduce if given.
+    """
+
+    # Extract the time step for ease of use and readability.
+    dx = x_range[2]
+    y_n = np.array(initial_values, dtype=float, ndmin=2)
+    batch, vec_size = y_n.shape
+    columns = _param_columns(params, batch)
+    x = np.arange(x_range[0], x_range[1] + dx, dx)
+    num_steps = len(x)
+
+    # Workspace reused by every step: one buffer per stage plus the trial 
+    # state passed to diff_fun.
+    work = np.empty((5, batch, vec_size))
+
+    first = y_n if reduce is None else np.asarray(reduce(x[0], y_n))
+    y = np.empty((num_steps,) + first.shape)
+    y[0] = first
+
+    for n in range(1, num_steps):
+        step_fused(diff_fun, x[n-1], y_n, columns, dx, work, y_n)
+        y[n] = y_n if reduce is None else reduce(x[n], y_n)
+
+    return x, y
+
+
+def Runge_Kutta_4_stream(diff_fun: Callable[..., float],\
+    x_range: Tuple[float, float, float], initial_value: np.array,\
+    params: Tuple, chunk_size: int = 4096, save_every: int = 1,\
+    components=None, reducer: Optional[Callable[..., Any]] = None)\
+    -> Iterator:
+    """
+    Integrates the same problem as Runge_Kutta_4, but yields the trajectory in 
+    fixed-size chunks instead of building the whole matrix, so the memory used 
+    does not grow with the length of the run.
+
+    Parameters
+    ----------
+    - diff_fun (function): As in Runge_Kutta_4.
+    - x_range (3-tuple): A tuple of the form (min, max, step) for the values 
+    over which x will be evaluated.
+    - initial_value (1-d array): An array representing a vector of the initial 
+    values for the function and its derivatives.
+    - params (n-tuple): A tuple of any additional parameters for diff_fun.
+    - chunk_size (int): The number of saved samples per chunk. The last chunk 
+    may be shorter.
+    - save_every (int): Only every save_every-th step is saved, starting with 
+    the initial value.
+    - components (int, slice or sequence of ints): Which elements of the state 
+    vector to save; all of them by default. An int saves a 1-d column.
+    - reducer (function): An optional function of the form reducer(x, y) that 
+    is applied to each chunk; its result is yielded instead of the chunk.
+
+    Yields
+    ------
+    - x (1-d array): The x values of the saved samples in the chunk.
+    - y (1-d or 2-d array): The saved components at those x values.
+    Or, if reducer is given, reducer(x, y) for each chunk.
+    """
+
+    if chunk_size < 1 or save_every < 1:
+        raise ValueError("chunk_size and save_every must be positive.")
+
+    x_min, x_max, dx = x_range
+    # Same number of points as np.arange(x_min, x_max + dx, dx), without 
+    # building that array.
+    num_steps = max(int(np.ceil((x_max + dx - x_min) / dx)), 0)
+    if num_steps == 0:
+        return
+    num_saved = ((num_steps - 1) // save_every) + 1
+    if components is None:
+        components = slice(None)
+
+    y_n = np.array(initial_value, dtype=float)
+    work = np.empty((5,) + y_n.shape)
+    sample_shape = np.shape(y_n[components])
+
+    n = 0
+    for chunk_start in range(0, num_saved, chunk_size):
+        length = min(chunk_size, num_saved - chunk_start)
+        x_chunk = np.empty(length)
+        y_chunk = np.empty((length,) + sample_shape)
+
+        for j in range(length):
+            # Advance to the next saved step.
+            target = (chunk_start + j) * save_every
+            while n < target:
+                step_fused(diff_fun, x_min + (n * dx), y_n, params, dx,\
+                    work, y_n)
+                n += 1
+            x_chunk[j] = x_min + (n * dx)
+            y_chunk[j] = y_n[components]
+
+        if reducer is None:
+            yield x_chunk, y_chunk
+        else:
+            yield reducer(x_chunk, y_chunk)
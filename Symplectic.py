@@ -0,0 +1,99 @@
+import numpy as np
+from typing import Callable, List, Tuple
+
+
+# Each method is a sequence of ('drift', c) and ('kick', d) substeps, as
+# fractions of the time step: a drift moves the positions with the current
+# velocities, a kick changes the velocities with the current accelerations.
+_YOSHIDA_W1 = 1 / (2 - 2 ** (1 / 3))
+_YOSHIDA_W0 = -(2 ** (1 / 3)) / (2 - 2 ** (1 / 3))
+
+METHODS = {
+    'verlet': [('kick', 1/2), ('drift', 1), ('kick', 1/2)],
+    'leapfrog': [('drift', 1/2), ('kick', 1), ('drift', 1/2)],
+    'yoshida4': [
+        ('drift', _YOSHIDA_W1 / 2), ('kick', _YOSHIDA_W1),
+        ('drift', (_YOSHIDA_W0 + _YOSHIDA_W1) / 2), ('kick', _YOSHIDA_W0),
+        ('drift', (_YOSHIDA_W0 + _YOSHIDA_W1) / 2), ('kick', _YOSHIDA_W1),
+        ('drift', _YOSHIDA_W1 / 2)],
+}
+ORDERS = {'verlet': 2, 'leapfrog': 2, 'yoshida4': 4}
+
+
+def Symplectic(acc: Callable[..., np.ndarray],\
+    t_range: Tuple[float, float, float], position: np.ndarray,\
+    velocity: np.ndarray, params: Tuple, method: str = 'verlet',\
+    save_every: int = 1) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Integrates Newton's equations for a separable Hamiltonian, x'' = a(x), with
+    a symplectic method. The energy error of these methods stays bounded
+    instead of drifting, so orbits stay closed over very long runs even with
+    large steps.
+
+    Parameters
+    ----------
+    - acc (function): A function of the form acc(x, *args) that returns the
+    acceleration for the positions x, as an array of the same shape. It must
+    not depend on the velocities.
+    - t_range (3-tuple): A tuple of the form (min, max, step) for the times
+    over which to integrate.
+    - position (array): The initial positions, of any shape, e.g. (3,) for one
+    body or (N, 3) for N bodies.
+    - velocity (array): The initial velocities, of the same shape.
+    - params (n-tuple): A tuple of any additional parameters for acc.
+    - method (str): 'verlet' (velocity Verlet, kick-drift-kick), 'leapfrog'
+    (drift-kick-drift), both 2nd order with one acceleration per step, or
+    'yoshida4' (4th order, three accelerations per step).
+    - save_every (int): Only every save_every-th step is saved, starting with
+    the initial state.
+
+    Returns
+    -------
+    - t (1-d array): The saved times.
+    - x (array): The positions at each saved time; shape (steps,) + shape of
+    position.
+    - v (array): The velocities at each saved time.
+    """
+
+    try:
+        substeps = METHODS[method]
+    except KeyError:
+        raise ValueError(f"Unknown method {method!r}; expected one of "\
+            f"{sorted(METHODS)}.") from None
+    if save_every < 1:
+        raise ValueError("save_every must be positive.")
+
+    t_min, t_max, dt = t_range
+    # Same number of points as np.arange(t_min, t_max + dt, dt).
+    num_steps = max(int(np.ceil((t_max + dt - t_min) / dt)), 1)
+    num_saved = ((num_steps - 1) // save_every) + 1
+
+    x_n = np.array(position, dtype=float)
+    v_n = np.array(velocity, dtype=float)
+    t = t_min + (np.arange(num_saved) * save_every * dt)
+    x = np.empty((num_saved,) + x_n.shape)
+    v = np.empty((num_saved,) + v_n.shape)
+    x[0], v[0] = x_n, v_n
+
+    # Scale the coefficients by the step once.
+    scaled: List[Tuple[bool, float]] = [(kind == 'kick', coefficient * dt)\
+        for kind, coefficient in substeps]
+
+    # The acceleration stays valid until the positions move, so velocity
+    # Verlet reuses the one from the end of the previous step.
+    a_n = None
+    for n in range(1, num_steps):
+        for is_kick, coefficient in scaled:
+            if is_kick:
+                if a_n is None:
+                    a_n = np.asarray(acc(x_n, *params))
+                v_n += coefficient * a_n
+            else:
+                x_n += coefficient * v_n
+                a_n = None
+
+        if n % save_every == 0:
+            x[n // save_every] = x_n
+            v[n // save_every] = v_n
+
+    return t, x, v
@@ -2,6 +2,7 @@
 
 import numpy as np
 import matplotlib.pyplot as plt
+from Record_Buffer import RecordBuffer
 from mpl_toolkits.mplot3d import Axes3D
 
 # Define k_D(v) for drag coefficient
@@ -20,15 +21,11 @@ def euler(vx, vy, vz, phi):
     k_L = 4.00E-4 # Lift coefficient
     g = 9.81 
     global X, Y, Z
-    X = np.zeros(0)
-    Y = np.zeros(0)
-    Z = np.zeros(0)
+    path = RecordBuffer([('x', float), ('y', float), ('z', float)])
 
     # Now loop through for Euler's method
     while x <= 18.44:
-        X = np.append(X, x)
-        Y = np.append(Y, y)
-        Z = np.append(Z, z)
+        path.append(x, y, z)
         # Update velocity, then acceleration in each direction
         v = np.sqrt(vx**2 + vy**2 + vz**2)
         ax = -k_D(v)*v*vx + k_L*omega*(vz*np.sin(phi) - vy*np.cos(phi))
@@ -44,6 +41,7 @@ def euler(vx, vy, vz, phi):
         z += vz*dt
         # Update time
         t += dt
+    X, Y, Z = path.columns()
 
 
 v = 42.0 # meters / second
@@ -9,6 +9,7 @@ model a pitched baseball trajectory
 import numpy as np
 from mpl_toolkits.mplot3d import Axes3D
 import matplotlib.pyplot as plt
+from Record_Buffer import RecordBuffer
 
 #define the drag coefficient function
 def k_D(v):
@@ -28,15 +29,11 @@ def euler(vx,vy,vz, phi):
     #omega = 1800.0/60.0*2*pi
     g = 9.81
     global X,Y,Z
-    X = np.zeros(0)
-    Y = np.zeros(0)
-    Z = np.zeros(0)
+    path = RecordBuffer([('x', float), ('y', float), ('z', float)])
 
     
     while x <= 18.44:  #distance to home base from pitcher's mound
-        X = np.append(X, x)
-        Y = np.append(Y, y)
-        Z = np.append(Z, z)
+        path.append(x, y, z)
         
         v = np.sqrt(vx**2 + vy**2 + vz**2)
         #calculate acceleration components
@@ -52,6 +49,7 @@ def euler(vx,vy,vz, phi):
         y = y + vy*h
         z = z + vz*h
         t = t + h
+    X, Y, Z = path.columns()
         
 TYPE = str(input("Type of pitch:  Fastball(f), Curveball(c), Slider(s), Screwball (sc), No Spin (n) "))
 if TYPE == 'c' or TYPE == 'C':
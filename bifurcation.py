@@ -6,18 +6,14 @@ Created on Sun Nov  8 17:32:03 2020
 """
 import numpy as np
 import matplotlib.pyplot as plt
-xs = []
-rs = []
+from Bifurcation_Diagram import Bifurcation_Diagram, sine
 
-for r in np.arange(0.9, 0.94, 0.0001):
-    x = 0.25
-    for i in range(900):
-        #x = 4*r*x*(1-x)
-        x = 4*r*np.sin(x)
-        if (i > 800):
-            xs.append(x)
-            rs.append(r)
-            
+# Every r value is iterated at once; the 100 points after the first 800 
+# iterations are binned into an image instead of plotted one by one.
+image, r_edges, x_edges = Bifurcation_Diagram(sine, np.arange(0.9, 0.94, 0.0001),
+                                              x0=0.25, transient=801,
+                                              iterations=99)
 
-plt.plot(rs,xs, 'b.')
+plt.imshow(image > 0, origin='lower', aspect='auto', cmap='Blues',
+           extent=(r_edges[0], r_edges[-1], x_edges[0], x_edges[-1]))
 plt.show()
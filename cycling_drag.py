@@ -2,6 +2,8 @@
 
 import numpy as np
 import matplotlib.pyplot as plt
+from Record_Buffer import RecordBuffer
+from Cycling import three_segment_course
 
 # Initial conditions
 C_D = 1 # Drag coefficient
@@ -13,23 +15,16 @@ m = 70.0 # Mass of cyclist
 g = 9.81
 theta = 6
 
+# The course: uphill for the first km, flat for the second, downhill for the third
+course = three_segment_course(theta)
+
 def a(v: float, x: float) -> float:
     """Acceleration function.
-    x for hills"""
-    # Going uphill for the first km
-    if x <= 1000: 
-        return -0.5*C_D*rho*A*v*np.abs(v)/m + P/(m*v) - g*np.sin(theta*np.pi/180)
-    # Now on flat ground for second km
-    elif 1000 <= x <= 2000:
-        return -0.5*C_D*rho*A*v*np.abs(v)/m + P/(m*v)
-    # Now going downhill on third km
-    elif 2000 < x <= 3000:
-        return -0.5*C_D*rho*A*v*np.abs(v)/m + P/(m*v) + g*np.sin(theta*np.pi/180)
-
-# Create some arrays 
-x_c = np.zeros(0) # x calculated
-t_c = np.zeros(0) # time calculated
-v_c = np.zeros(0) # Velocity caclulated
+    x for hills, from the slope of the course there"""
+    return -0.5*C_D*rho*A*v*np.abs(v)/m + P/(m*v) - g*course.slope(x)
+
+# Create a table for x, time, and velocity calculated
+ride = RecordBuffer([('x', float), ('t', float), ('v', float)])
 
 # Initial positions
 x = 0
@@ -43,10 +38,9 @@ while x < 3000:
     v = v + a(v, x)*dt
     x = x + v*dt
     t += dt
-    # Update arrays
-    x_c = np.append(x_c, x)
-    v_c = np.append(v_c, v)
-    t_c = np.append(t_c, t)
+    # Update the table
+    ride.append(x=x, t=t, v=v)
+x_c, t_c, v_c = ride.columns()
 
 
 plt.plot(x_c, v_c)
@@ -3,7 +3,9 @@
 
 import numpy as np
 import matplotlib.pyplot as plt
+from Record_Buffer import RecordBuffer
 from numpy.core.fromnumeric import argmax
+from Projectile_Range import landing_range, optimal_angle
 
 # Parameters to start off
 g = 9.81 # m/s**2
@@ -17,13 +19,9 @@ x = 0 # meters
 y = 1.8 # meters
 dt = 0.01
 
-# Create arrays to store data that is calculated
-# They start empty, then we append values as they come
-t_calculated = np.zeros(0)
-x_calculated = np.zeros(0)
-y_calculated = np.zeros(0)
-angle = np.zeros(0)
-max_range = np.zeros(0)
+# Create a table to store data that is calculated
+# It starts empty, then we append rows as they come
+trajectory = RecordBuffer([('t', float), ('x', float), ('y', float)])
 
 
 # Define the functions we'll need
@@ -61,40 +59,41 @@ v_x = v0 * np.cos(theta * np.pi/180)
 v_y = v0 * np.sin(theta * np.pi/180)
 v = v0
 
-# Now let's calculate the velocity and the position as it moves
-for theta in np.arange(20, 70, 0.5): # Loop over throwing angles in degrees
-    x = 0
-    y = 1.8
-    t = 0
-    # Starting velocity components, with radian conversion for the angle
-    v_x = v0 * np.cos(theta * np.pi/180)
-    v_y = v0 * np.sin(theta * np.pi/180)
-    v = v0
-
-    while y >= 0:
-        # Update the velocities and positions, in x and y
-        v_x = heun_vel_x(v_x, v)
-        x = heun_position(x, v_x)
-        v_y = heun_vel_y(v_y, v)
-        y = heun_position(y, v_y)
-        # Update v
-        v = np.sqrt(v_x*v_x + v_y*v_y)
-        # Update the arrays
-        x_calculated = np.append(x_calculated, x)
-        y_calculated = np.append(y_calculated, y)
-        # Update the time and time's array
-        t = t + dt
-        t_calculated = np.append(t_calculated, t)
-
-    # Add the range we achieved 
-    angle = np.append(angle, theta)
-    max_range = np.append(max_range, x_calculated[-1])
+# Fly every throwing angle at once, each stopping when it lands
+angle = np.arange(20, 70, 0.5) # degrees
+max_range, flight_time = landing_range(v0, vt, angle, y0=1.8, g=g, dt=dt)
+
+# Then narrow down the best angle to 0.01 degrees
+best_angle, best_range = optimal_angle(v0, vt, y0=1.8, g=g, dt=dt)
+
+# Now let's calculate the velocity and the position as it moves, for the best throw
+x = 0
+y = 1.8
+t = 0
+# Starting velocity components, with radian conversion for the angle
+v_x = v0 * np.cos(best_angle * np.pi/180)
+v_y = v0 * np.sin(best_angle * np.pi/180)
+v = v0
+
+while y >= 0:
+    # Update the velocities and positions, in x and y
+    v_x = heun_vel_x(v_x, v)
+    x = heun_position(x, v_x)
+    v_y = heun_vel_y(v_y, v)
+    y = heun_position(y, v_y)
+    # Update v
+    v = np.sqrt(v_x*v_x + v_y*v_y)
+    # Update the time, then add the row to the table
+    t = t + dt
+    trajectory.append(t, x, y)
+t_calculated, x_calculated, y_calculated = trajectory.columns()
 
 # Plot the results and figure some things out
 plt.xlabel('Angle of throw (degrees)')
 plt.ylabel('Horizontal distance of throw (m)')
 plt.plot(angle, max_range, 'r', label='')
-print(f"Range = {x_calculated[np.argmax(x_calculated)]:0.4f} meters")
+print(f"Best angle = {best_angle:0.2f} degrees")
+print(f"Range = {best_range:0.4f} meters")
 # These are two useful lines, argmax gets you the index of the max value in the array
 print(f"Max height = {y_calculated[argmax(y_calculated)]:4.2f} meters") 
 print(f"Time at max height = {t_calculated[argmax(y_calculated)]:4.2f} seconds")
@@ -5,31 +5,24 @@ Measures if a system is chaotic or not.
 
 import numpy as np 
 import matplotlib.pyplot as plt 
+from Lyapunov_Exponents import logistic, logistic_derivative, map_exponent
 
 # Initial values
-dx = 0 
-sumd = 0 
 n = 10000
 
 r = np.linspace(0.01, 1.0, 1000)
-lamb = np.zeros(r.size)
 
 '''
 Lambda > 0: chaos
 Lambda < 0: other type of behavior
 '''
 
-# Iteratic the logisistic equation and sum terms to get lambda
-for index,i in enumerate(r):
-    x = 0.25
-    for index2,j in enumerate(np.arange(0, n)):
-        dx = 4*i*(1 - 2*x)
-        if j > 5000: 
-            sumd += np.log(abs(dx))
-        x = 4*i*x*(1 - x)
-    # Now actually calculate lambda and put it into the array
-    lamb[index] = sumd/n/np.log(2)
-    sumd = 0
+# Iterate the logistic equation for every r at once and average the terms
+# after the first 5001 iterations to get lambda. The sum of those n - 5001
+# terms is divided by n, as it always has been here.
+lamb = map_exponent(logistic, logistic_derivative, r, x0=0.25,
+                    transient=5001, iterations=n - 5001, base=2)
+lamb = lamb * (n - 5001) / n
 
 plt.plot(r, lamb, 'r-')
 plt.xlabel("r values")
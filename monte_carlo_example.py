@@ -3,37 +3,18 @@
 import numpy as np
 import matplotlib.pyplot as plt
 
-# Linear regression/least squares method from class, used in Monte Carlo
-def least_squares(x: list, y: list):
-    """Calculates the least squares regression for the x and y data.
-        Returns a tuple of (A, sigma_A, B, sigma_B)."""
-    # Initialize some variables
-    N = len(x)
-    #y_uncertainty = np.std(y)
-    
-    # Perform the sums
-    sum_x = np.sum(x)
-    sum_y = np.sum(y)
-    sum_xx = np.inner(x,x) # Dot product for the arrays
-    sum_xy = np.inner(x, y) 
-
-    # Now calculate the coefficients
-    delta = (N * sum_xx) - sum_x**2
-    A = (sum_xx * sum_y  -  sum_x * sum_xy) / delta
-    B = (N * sum_xy  -  sum_x * sum_y) / delta
-    sigma_A = np.sqrt(sum((y-(A+B*x))**2/(N-2)))*np.sqrt(sum_xx/delta)
-    sigma_B = np.sqrt(sum((y-(A+B*x))**2/(N-2)))*np.sqrt(N/delta)
-
-    return (A, sigma_A, B, sigma_B)
-
-
+# Linear regression/least squares method from class, used in Monte Carlo.
+# It fits every trial at once when given 2-d arrays.
+from Least_Squares import least_squares, monte_carlo
 
 
 # Our data for this example
-data = np.loadtxt("Global_O2_Concentration_2010_2020.txt", skiprows=1, usecols=(2, 3, 4))
-x = data[:,0]
-y = data[:,1]
-sig_y = data[:,2]
+# Parsed once and cached as binary; the dates are in data['date'].
+from Datasets import load
+data = load("Global_O2_Concentration_2010_2020.txt")
+x = data['julian_date']
+y = data['value']
+sig_y = data['std']
 
 coefficients = least_squares(x, y)
 A, sigma_A, B, sigma_B = coefficients
@@ -44,24 +25,18 @@ A, sigma_A, B, sigma_B = coefficients
 # How many times to roll the dice in the estimation
 number_of_trials = 1000
 # Some other variables
-array_fit_parameters = np.array([])
-# Create arrays for values of A, B, and their uncertainties 
-A_values = np.zeros(number_of_trials)
-B_values = np.zeros(number_of_trials)
-sigma_A = np.zeros(number_of_trials) # A and B uncertainty
-sigma_B = np.zeros(number_of_trials)
 N = x.size
-y_error = np.sqrt(sum((y-(A+B*x))**2)/(N-2))
+y_error = np.sqrt(np.sum((y-(A+B*x))**2)/(N-2))
 x_min = x[0]
 x_max = x[-1]
 
 
 # Create our random data
 # Crux of the Monte Carlo method: making new values in the range of our values, uniformely random
-for j in range(number_of_trials):
-    x_trial = np.random.uniform(x_min, x_max, size=N) # Uniform random distribution for x values
-    y_trial = A + B*x_trial + np.random.normal(loc=0, scale=y_error, size=N) # Add some randomness to our y data, still fit it though
-    A_values[j], sigma_A[j], B_values[j], sigma_B[j] = least_squares(x_trial, y_trial)
+# All trials are drawn and fitted in chunks of 2-d arrays; raise workers to
+# spread the chunks over processes (the results don't change with it).
+fits, summary = monte_carlo(A, B, y_error, x_min, x_max, N, number_of_trials, seed=0)
+A_values, sigma_A, B_values, sigma_B = fits.T
 plt.hist(A_values, bins=50) # Distribution of A values
 plt.title("Distribution of A values from Monte Carlo simulation")
 plt.show()
@@ -1,8 +1,8 @@
 # One-dimensional vertical motion with drag
 # Solve Newton's Laws for vertical motion with air resistance
 
-import numpy as np
 import matplotlib.pyplot as plt
+from Record_Buffer import RecordBuffer
 from numpy.core.fromnumeric import argmax
 
 # Parameters to start off
@@ -16,10 +16,9 @@ y = 0
 v = v0
 dt = 0.01
 
-# Create arrays to store data that is calculated
-# They start empty, then we append values as they come
-t_calculated = np.zeros(0)
-y_calculated = np.zeros(0)
+# Create a table to store data that is calculated
+# It starts empty, then we append rows as they come
+trajectory = RecordBuffer([('t', float), ('y', float)])
 
 
 # Define the functions we'll need
@@ -45,13 +44,13 @@ def heun_y(v: float, y: float) -> float:
 
 # Now let's calculate the velocity and the position as it moves
 while y >= 0:
-    # Update velocity and y position; add y to its array
+    # Update velocity and y position
     v = heun_vel(v)
     y = heun_y(v, y)
-    y_calculated = np.append(y_calculated, y)
-    # Update the time and time's array
+    # Update the time, then add the row to the table
     t = t + dt
-    t_calculated = np.append(t_calculated, t)
+    trajectory.append(t, y)
+t_calculated, y_calculated = trajectory.columns()
 
 # Plot the results and figure some things out
 plt.xlabel('Time (s)')
@@ -3,6 +3,7 @@
 
 import numpy as np 
 import matplotlib.pyplot as plt 
+from Record_Buffer import RecordBuffer
 
 
 def acc(x: float, v: float, t: float) -> float:
@@ -18,8 +19,7 @@ omega = 2.0/3  #0.005 gives 1 point -> period 1
 c = 1.78
 n = 1000
 i = 1
-xs = np.array([])
-vs = np.array([])
+section = RecordBuffer([('x', float), ('v', float)])
 h = 2*np.pi/omega/n # Units of time
 
 t = 0
@@ -53,11 +53,11 @@ while t < 1000:
     if value == i: 
         # Get rid of initial transcient behavior
         if t > 100:
-            xs = np.append(xs, x)
-            vs = np.append(vs, v)
+            section.append(x, v)
         i += 1
     t += h 
 
+xs, vs = section.columns()
 plt.plot(xs, vs, 'r.')
 plt.title("Poincare map")
 plt.xlabel("x position")
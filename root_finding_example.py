@@ -23,4 +23,10 @@ plt.show()
 # Print the solution
 print(f"fsolve: {fsolve(func, 1.3)}") #1.3 is the starting point for solving it
 print(f"bisect: {bisect(func, 0.1,2)}")
-print(f"newton: {newton(func, 1.3)}")
\ No newline at end of file
+print(f"newton: {newton(func, 1.3)}")
+
+# The function has a root near every (n + 1/2) pi on the positive axis; find
+# all of them at once instead of one per hand-picked starting point.
+from Root_Finding import all_roots
+roots, index = all_roots(func, -2, 50)
+print(f"all_roots: {roots}")
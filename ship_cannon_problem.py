@@ -5,6 +5,7 @@ import numpy as np
 import matplotlib.pyplot as plt
 from scipy.optimize import curve_fit
 from scipy.optimize import newton
+import Root_Finding
 
 
 def fun(theta, yi, yf, v0, xf, xi, v_ship):
@@ -12,6 +13,12 @@ def fun(theta, yi, yf, v0, xf, xi, v_ship):
     return (yi - yf + ((v0 * np.sin(theta) * (xf - xi)) / (v0*np.cos(theta) + v_ship)) - \
             (9.8/2) * ((xf - xi)/(v0*np.cos(theta) + v_ship))**2)
 
+def fun_prime(theta, yi, yf, v0, xf, xi, v_ship):
+    """Derivative of fun with respect to the firing angle theta."""
+    u = v0*np.cos(theta) + v_ship
+    return (v0*np.cos(theta)*(xf - xi)/u + (v0*np.sin(theta))**2 * (xf - xi)/u**2 - \
+            9.8 * (xf - xi)**2 * v0*np.sin(theta)/u**3)
+
 # Initial values
 # Distance: meters
 # Speed: meters per second
@@ -27,8 +34,16 @@ firing_angle = newton(fun, 25*np.pi/180, args=(yi,yf,v0,xf,xi,v_ship))
 print(f"Firing angle: {firing_angle*180/np.pi} degrees")
 
 ship_range = np.linspace(0.514, 1.514, 50)
-angles = np.array([newton(fun, 25*np.pi/180, args=(yi,yf,v0,xf,xi,speed)) for speed in ship_range])
+# Every speed is solved at once; each starts from its neighbour's angle.
+angles, converged = Root_Finding.newton(fun, 25*np.pi/180, args=(yi,yf,v0,xf,xi,ship_range),
+                                        fprime=fun_prime, continuation=True)
 plt.plot(ship_range, angles*180/np.pi)
 plt.xlabel("Ship speed in meters per second")
 plt.ylabel("Firing angle in degrees")
-plt.show()
\ No newline at end of file
+plt.show()
+
+# A firing table: every combination of ship speed and target distance.
+speeds, targets = np.meshgrid(np.linspace(0.514, 1.514, 1000), np.linspace(100, 2000, 1000), indexing='ij')
+table, converged = Root_Finding.newton(fun, 25*np.pi/180, args=(yi,yf,v0,targets,xi,speeds),
+                                       fprime=fun_prime, continuation=True)
+print(f"Firing table solved for {converged.sum()} of {converged.size} combinations")
\ No newline at end of file
@@ -2,7 +2,9 @@
 G = 6.67E-11  # Gravitational constant
 AU = 1.5E11   # Astronomical unit
 
+import numpy as np
 from vpython import *
+from Render_Pipeline import animate
 
 scene = canvas(tittle = "Kepler's First Law", background = color.black)
 
@@ -10,23 +12,25 @@ scene = canvas(tittle = "Kepler's First Law", background = color.black)
 sun = sphere(pos=vec(0,0,0), radius = 1E10, mass = 2E30, color=color.yellow)
 earth = sphere(pos=vec(AU, 0,0), radius = .8E10, mass=2E24, color=color.blue)
 
-# Initial conditions
-earth.vel = vec(0, 1.3*sqrt(G*sun.mass/mag(earth.pos)), 0.1*sqrt(G*sun.mass/mag(earth.pos)))
-
-
-# Create a trail for the earth
-earth.trail = curve(pos=earth.pos, color=earth.color)
+# Initial conditions, kept in plain arrays so the physics doesn't have to go 
+# through vpython
+pos = np.array([AU, 0, 0])
+vel = np.array([0, 1.3, 0.1]) * np.sqrt(G*sun.mass/AU)
+sun_pos = np.zeros(3)
 
 # Define a time interval
 dt = 1E5 # Time in seconds
 
-# Animation loop
-while True:
-    r = mag(earth.pos - sun.pos)
-    a = -G*sun.mass*(earth.pos-sun.pos) / r**3
+def step():
+    """One physics step, same Euler update as before."""
+    global pos, vel
+    r = np.linalg.norm(pos - sun_pos)
+    a = -G*sun.mass*(pos - sun_pos) / r**3
     # Update earth's velocity with Euler's method
-    earth.vel = earth.vel + a*dt
-    earth.pos = earth.pos + earth.vel*dt
-    # Give the earth a trail
-    earth.trail.append(pos=earth.pos, color=earth.color)
-    rate(100) # 100 FPS
+    vel = vel + a*dt
+    pos = pos + vel*dt
+
+# Animation loop: 10 physics steps per frame at 100 FPS, with the earth's 
+# trail held to 2000 points
+animate(step, lambda: pos[np.newaxis], [earth], substeps=10, fps=100,
+        trail_budget=2000)
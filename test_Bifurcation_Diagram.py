@@ -0,0 +1,50 @@
+from Bifurcation_Diagram import Bifurcation_Diagram, logistic
+import numpy as np
+import unittest
+import warnings
+
+
+class TestBifurcationDiagram(unittest.TestCase):
+
+    def test_period_doubling(self):
+        # Fixed point below r = 0.75, period 2 just above it, and every 
+        # point lands in the image.
+        r = np.array([0.6, 0.8])
+        image, r_edges, x_edges = Bifurcation_Diagram(logistic, r,\
+            transient=2000, iterations=50, resolution=(500, None),\
+            x_range=(0, 1))
+        self.assertEqual(image.shape, (500, 2))
+        self.assertEqual(image.sum(), 100)
+        self.assertEqual(np.count_nonzero(image[:, 0]), 1)
+        self.assertEqual(np.count_nonzero(image[:, 1]), 2)
+        # The fixed point of the logistic map is 1 - 1/(4r).
+        row = np.nonzero(image[:, 0])[0][0]
+        self.assertTrue(x_edges[row] <= 1 - (1 / 2.4) < x_edges[row + 1])
+
+    def test_narrow_and_diverging(self):
+        # More columns asked for than parameters, and a lane with r > 1
+        # that runs off to -inf and must simply be left out of the image.
+        r = np.array([0.6, 0.8, 1.5])
+        with warnings.catch_warnings(record=True) as caught:
+            warnings.simplefilter('always')
+            with np.errstate(over='ignore'):
+                image, r_edges, x_edges = Bifurcation_Diagram(logistic, r,\
+                    transient=2000, iterations=50, resolution=(50, 10),\
+                    x_range=(0, 1))
+        self.assertFalse([w for w in caught if 'cast' in str(w.message)])
+        self.assertEqual(image.shape, (50, 3))
+        self.assertEqual(len(r_edges), 4)
+        self.assertEqual(image[:, :2].sum(), 100)
+        self.assertEqual(image[:, 2].sum(), 0)
+
+    def test_workers_match(self):
+        r = np.linspace(0.7, 1.0, 3000)
+        serial = Bifurcation_Diagram(logistic, r, resolution=(200, 300),\
+            block=1000)[0]
+        parallel = Bifurcation_Diagram(logistic, r, resolution=(200, 300),\
+            block=1000, workers=2)[0]
+        np.testing.assert_array_equal(serial, parallel)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,49 @@
+from Cycling import Course, optimize_pacing, simulate_pacing,\
+    three_segment_course
+import numpy as np
+import unittest
+
+
+class TestCycling(unittest.TestCase):
+
+    def test_course(self):
+        course = three_segment_course()
+        np.testing.assert_allclose(course.slope([0, 1000, 1500, 2500, 3500]),\
+            np.sin(np.radians([6, 6, 0, -6, -6])))
+        hill = Course.from_profile([0, 300, 400], [0, 0, 100])
+        self.assertAlmostEqual(hill.length, 300 + 100*np.sqrt(2))
+        self.assertAlmostEqual(hill.slope(350), np.sqrt(0.5))
+
+    def test_simulate(self):
+        course = three_segment_course()
+        # The Euler run of cycling_drag.py at 400 W takes 329.0 s.
+        time, energy = simulate_pacing(course, [[400.0]], dx=0.25)
+        self.assertAlmostEqual(time[0], 329.0, delta=0.1)
+        self.assertAlmostEqual(energy[0], 400 * time[0], delta=1e-6)
+
+        # Segment-wise plans equal to a constant one ride the same.
+        plans = np.array([[300.0, 300.0, 300.0], [500.0, 300.0, 100.0],\
+            [2.0, 300.0, 300.0]])
+        time, energy = simulate_pacing(course, plans, course.edges)
+        constant, work = simulate_pacing(course, [[300.0]])
+        self.assertAlmostEqual(time[0], constant[0])
+        self.assertTrue(np.isnan(time[2]))
+        self.assertLess(time[1], time[0])
+        # A plan per metre.
+        time, energy = simulate_pacing(course, np.full((2, 3000), 300.0))
+        np.testing.assert_allclose(time, constant[0])
+
+    def test_optimize(self):
+        course = three_segment_course(length=300.0)
+        constant, budget = simulate_pacing(course, [[400.0]])
+        plan, time, energy = optimize_pacing(course, budget[0],\
+            population=200, iterations=8, seed=0)
+        self.assertLessEqual(energy, budget[0])
+        self.assertLess(time, constant[0] - 1)
+        # Hard on the climb, easy on the descent.
+        self.assertGreater(plan[0], plan[1])
+        self.assertGreater(plan[1], plan[2])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,51 @@
+from Datasets import Format, columns, load
+import numpy as np
+import os
+import tempfile
+import unittest
+
+
+class TestDatasets(unittest.TestCase):
+
+    def test_o2(self):
+        with tempfile.TemporaryDirectory() as cache_dir:
+            data = load('Global_O2_Concentration_2010_2020.txt',\
+                cache_dir=cache_dir, chunk_size=50)
+            expected = np.loadtxt('Global_O2_Concentration_2010_2020.txt',\
+                skiprows=1, usecols=(2, 3, 4))
+            np.testing.assert_array_equal(data['julian_date'], expected[:, 0])
+            np.testing.assert_array_equal(data['value'], expected[:, 1])
+            self.assertEqual(data['date'][0],\
+                np.datetime64('2010-11-17T00:49'))
+            self.assertEqual(data['date'][-2],\
+                np.datetime64('2020-06-04T21:58'))
+            # Later loads map the same cache.
+            self.assertIs(load('Global_O2_Concentration_2010_2020.txt',\
+                cache_dir=cache_dir), data)
+            self.assertFalse(data.flags.writeable)
+
+    def test_rebuilt_when_changed(self):
+        data_format = Format(np.dtype([('x', 'f8'), ('y', 'f8')]), 1,\
+            columns([('x', 'f8'), ('y', 'f8')]))
+        with tempfile.TemporaryDirectory() as folder:
+            filename = os.path.join(folder, 'points.txt')
+            with open(filename, 'w') as f:
+                f.write('x y\n1 2\n\n3 4\n')
+            data = load(filename, data_format, chunk_size=1)
+            np.testing.assert_array_equal(data['y'], [2, 4])
+            # The cache of a file whose name starts the same is kept.
+            with open(filename + '.bak', 'w') as f:
+                f.write('x y\n7 8\n')
+            load(filename + '.bak', data_format)
+
+            with open(filename, 'a') as f:
+                f.write('5 6\n')
+            data = load(filename, data_format)
+            np.testing.assert_array_equal(data['x'], [1, 3, 5])
+            caches = os.listdir(os.path.join(folder, '.npy_cache'))
+            self.assertEqual(len(caches), 2)
+            self.assertEqual(len([c for c in caches if '.bak.' in c]), 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
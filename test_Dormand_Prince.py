@@ -0,0 +1,40 @@
+from Dormand_Prince import Dormand_Prince
+import numpy as np
+import unittest
+
+
+def spring(x, Y):
+    """Simple harmonic oscillator, y'' = -y."""
+    return -Y[0]
+
+
+class TestDormandPrince(unittest.TestCase):
+
+    def test_harmonic_oscillator(self):
+        x, y = Dormand_Prince(spring, (0, 20), np.array([1.0, 0.0]), (),\
+            rtol=1e-9, atol=1e-12)
+        np.testing.assert_allclose(y[:, 0], np.cos(x), atol=1e-7)
+        # Far fewer steps than a fixed step small enough for this accuracy.
+        self.assertLess(len(x), 500)
+
+    def test_dense_output(self):
+        x_eval = np.linspace(0, 20, 1001)
+        x, y, dense = Dormand_Prince(spring, (0, 20), np.array([1.0, 0.0]),\
+            (), rtol=1e-9, atol=1e-12, dense_output=True)
+        np.testing.assert_allclose(dense(x_eval)[:, 0], np.cos(x_eval),\
+            atol=1e-7)
+        np.testing.assert_allclose(dense(x[-1]), y[-1], atol=1e-12)
+
+    def test_system_backwards(self):
+        def decay(t, N, k1, k2):
+            return np.array([-k1*N[0], k1*N[0] - k2*N[1]])
+
+        t_eval = np.array([30.0, 15.0, 0.0])
+        t, N = Dormand_Prince(decay, (30, 0), np.array([1000 * np.exp(-4.5),\
+            0.0]), (0.15, 0.2), x_eval=t_eval, system=True)
+        np.testing.assert_allclose(N[:, 0], 1000 * np.exp(-0.15 * t_eval),\
+            rtol=1e-5)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,49 @@
+from Explicit_RK import Explicit_RK, TABLEAUX, Tableau
+from Runge_Kutta_4 import Runge_Kutta_4
+import numpy as np
+import unittest
+
+
+def spring(x, Y):
+    """Simple harmonic oscillator, y'' = -y."""
+    return -Y[0]
+
+
+class TestExplicitRK(unittest.TestCase):
+
+    def test_orders(self):
+        # Halving the step should shrink the error by about 2**order.
+        for name, tableau in TABLEAUX.items():
+            errors = []
+            for h in (0.02, 0.01):
+                x, y, nfev = Explicit_RK(spring, (0, 2, h),\
+                    np.array([1.0, 0.0]), (), name)
+                errors.append(abs(y[-1, 0] - np.cos(x[-1])))
+            observed = np.log2(errors[0] / errors[1])
+            self.assertAlmostEqual(observed, tableau.order, delta=0.3,\
+                msg=name)
+
+    def test_evaluation_counts(self):
+        x, y, nfev = Explicit_RK(spring, (0, 1, 0.1), np.array([1.0, 0.0]),\
+            (), 'rk4')
+        self.assertEqual(nfev, 4 * (len(x) - 1))
+        # FSAL reuses the last stage, so only the first step costs 4.
+        x, y, nfev = Explicit_RK(spring, (0, 1, 0.1), np.array([1.0, 0.0]),\
+            (), 'bogacki_shampine')
+        self.assertEqual(nfev, 3 * (len(x) - 1) + 1)
+
+    def test_matches_Runge_Kutta_4(self):
+        x, y = Runge_Kutta_4(spring, (0, 5, 0.1), np.array([1.0, 0.0]), ())
+        x_rk, y_rk, nfev = Explicit_RK(spring, (0, 5, 0.1),\
+            np.array([1.0, 0.0]), ())
+        np.testing.assert_allclose(y_rk, y, rtol=1e-13, atol=1e-13)
+
+    def test_user_tableau_system(self):
+        euler = Tableau(np.zeros((1, 1)), np.ones(1), np.zeros(1), 1)
+        x, y, nfev = Explicit_RK(lambda t, N, k: -k*N, (0, 1, 0.5),\
+            np.array([1000.0]), (2.5,), euler, system=True)
+        np.testing.assert_allclose(y[:, 0], [1000, -250, 62.5])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,52 @@
+from Heun import Heun
+import JIT_Backend
+import numpy as np
+import unittest
+
+
+def relaxation(x, y, a):
+    """A first order system relaxing towards a driven equilibrium."""
+    return -a*y + np.cos(x)
+
+
+class TestHeun(unittest.TestCase):
+
+    def test_terminal_event(self):
+        # A height rising at 10 - g x from 1.8 m. Heun's method is exact for
+        # a linear slope, so even large steps find the exact landing time.
+        def ground(x, y, g):
+            return y
+        ground.terminal = True
+        ground.direction = -1
+
+        def apex(x, y, g):
+            return 10 - (g * x)
+
+        x, y, x_events, y_events = Heun(lambda x, y, g: 10 - (g * x),\
+            (9.81,), (0, 100, 0.25), 1.8, events=[ground, apex])
+        t_land = (10 + np.sqrt(100 + (2 * 9.81 * 1.8))) / 9.81
+
+        self.assertAlmostEqual(x[-1], t_land, places=10)
+        self.assertAlmostEqual(y[-1], 0, places=10)
+        self.assertAlmostEqual(x_events[0][0], t_land, places=10)
+        self.assertAlmostEqual(x_events[1][0], 10 / 9.81, places=10)
+        self.assertAlmostEqual(y_events[1][0], 1.8 + (50 / 9.81), places=10)
+        self.assertEqual(len(y), int(t_land / 0.25) + 2)
+
+    def test_numba_backend(self):
+        # Falls back to the NumPy loop when numba is missing, so the results
+        # match either way; with numba the compiled loop must really run.
+        x, y = Heun(relaxation, (0.5,), (0, 10, 0.01), 1.0)
+        x_jit, y_jit = Heun(relaxation, (0.5,), (0, 10, 0.01), 1.0,\
+            backend='numba')
+        np.testing.assert_allclose(y_jit, y, rtol=1e-12, atol=1e-12)
+
+        if JIT_Backend.available():
+            y_jit = np.zeros_like(y)
+            y_jit[0] = y[0]
+            self.assertTrue(JIT_Backend.Heun(relaxation, x, y_jit, (0.5,)))
+            np.testing.assert_allclose(y_jit, y, rtol=1e-12, atol=1e-12)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,31 @@
+from Kepler import Kepler, orbital_elements
+import numpy as np
+import unittest
+
+
+class TestKepler(unittest.TestCase):
+
+    def test_matches_numerical_integration(self):
+        # Units where mu = 1; a bound and an unbound orbit, forwards and 
+        # backwards in time.
+        t = np.linspace(-20, 20, 9)
+        for v0 in (np.array([0, 1.3, 0.1]), np.array([0, 1.6, 0.0])):
+            r, v = Kepler(np.array([1.0, 0, 0]), v0, 1.0, t)
+            r_num, v_num = Kepler(np.array([1.0, 0, 0]), v0, 1.0, t,\
+                perturbation=lambda t, r, v: np.zeros(3), atol=1e-12)
+            np.testing.assert_allclose(r, r_num, atol=1e-6)
+            np.testing.assert_allclose(v, v_num, atol=1e-6)
+
+    def test_many_periods(self):
+        r0, v0 = np.array([1.0, 0, 0]), np.array([0, 1.3, 0.1])
+        elements = orbital_elements(r0, v0, 1.0)
+        self.assertAlmostEqual(elements['e'], 0.7, places=12)
+
+        t = elements['period'] * np.arange(0, 10 ** 6, 1000)
+        r, v = Kepler(r0, v0, 1.0, t)
+        np.testing.assert_allclose(r, np.tile(r0, (len(t), 1)), atol=1e-6)
+        np.testing.assert_allclose(v, np.tile(v0, (len(t), 1)), atol=1e-6)
+
+
+if __name__ == "__main__":
+    unittest.main()
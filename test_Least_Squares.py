@@ -0,0 +1,66 @@
+from Least_Squares import least_squares, monte_carlo, LeastSquaresAccumulator
+import numpy as np
+import unittest
+
+
+class TestLeastSquares(unittest.TestCase):
+
+    def test_batched_matches_single(self):
+        rng = np.random.default_rng(3)
+        x = rng.uniform(0, 10, size=(4, 30))
+        y = 1.5 - 0.7*x + rng.normal(scale=0.2, size=x.shape)
+        batched = np.stack(least_squares(x, y), axis=-1)
+        for row in range(4):
+            A, sigma_A, B, sigma_B = least_squares(x[row], y[row])
+            np.testing.assert_allclose(batched[row],\
+                [A, sigma_A, B, sigma_B], rtol=1e-12)
+            fit, cov = np.polyfit(x[row], y[row], 1, cov='unscaled')
+            np.testing.assert_allclose((B, A), fit, rtol=1e-9)
+
+    def test_monte_carlo(self):
+        fits, summary = monte_carlo(2.0, 0.5, 0.1, 0, 10, 50, 2500, seed=7,\
+            chunk=1000)
+        self.assertEqual(fits.shape, (2500, 4))
+        # The spread of the fitted slopes matches the quoted uncertainty.
+        self.assertAlmostEqual(summary['mean'][2], 0.5, places=3)
+        self.assertAlmostEqual(summary['std'][2] / summary['mean'][3], 1,\
+            delta=0.1)
+        pooled, _ = monte_carlo(2.0, 0.5, 0.1, 0, 10, 50, 2500, seed=7,\
+            chunk=1000, workers=2)
+        np.testing.assert_array_equal(fits, pooled)
+
+    def test_accumulator_chunks_and_merge(self):
+        rng = np.random.default_rng(5)
+        x = rng.uniform(0, 10, 1000)
+        y = 3 - 2*x + rng.normal(scale=0.5, size=x.size)
+        first, second = LeastSquaresAccumulator(), LeastSquaresAccumulator()
+        for start in range(0, 600, 128):
+            first.update(x[start:min(start + 128, 600)],\
+                y[start:min(start + 128, 600)])
+        second.update(x[600:], y[600:])
+        np.testing.assert_allclose(first.merge(second).fit(),\
+            least_squares(x, y), rtol=1e-10)
+
+    def test_accumulator_offset(self):
+        # Raw sums lose every digit of the slope this far from the origin.
+        x = 1e8 + np.linspace(0, 1, 1000)
+        y = 3 + 2*(x - 1e8)
+        accumulator = LeastSquaresAccumulator()
+        for start in range(0, 1000, 100):
+            accumulator.update(x[start:start + 100], y[start:start + 100])
+        self.assertAlmostEqual(accumulator.fit()[2], 2, places=6)
+
+    def test_accumulator_file(self):
+        data = np.loadtxt('CSIRO_Recons_gmsl_mo_2011.txt', skiprows=1)
+        expected = least_squares(data[:, 0], data[:, 1])
+        for workers in (1, 3):
+            accumulator = LeastSquaresAccumulator.from_file(\
+                'CSIRO_Recons_gmsl_mo_2011.txt', skiprows=1, chunk_size=100,\
+                workers=workers)
+            self.assertEqual(accumulator.n, len(data))
+            np.testing.assert_allclose(accumulator.fit(), expected,\
+                rtol=1e-10)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,34 @@
+from Lyapunov_Exponents import flow_spectrum, logistic, logistic_derivative,\
+    lorenz, lorenz_jacobian, map_exponent
+import numpy as np
+import unittest
+
+
+class TestLyapunovExponents(unittest.TestCase):
+
+    def test_logistic_map(self):
+        r = np.array([0.5, 1.0])
+        exponent = map_exponent(logistic, logistic_derivative, r,\
+            iterations=20000)
+        # x = 1/2 at r = 0.5 is superstable, r = 1 is fully chaotic with 
+        # exponent ln 2.
+        self.assertLess(exponent[0], -10)
+        self.assertAlmostEqual(exponent[1], np.log(2), places=2)
+
+    def test_lorenz_spectrum(self):
+        # Two orbits with different r; the classic r = 28 spectrum is about 
+        # (0.906, 0, -14.57), and the sum is the divergence -(s + 1 + b).
+        exponents, Y = flow_spectrum(lorenz, lorenz_jacobian,\
+            np.array([[0, 1, 1.05], [0, 1, 1.05]]),\
+            (10.0, np.array([28.0, 10.0]), 8 / 3), dt=0.01, steps=20000)
+        self.assertAlmostEqual(exponents[0, 0], 0.906, delta=0.05)
+        self.assertAlmostEqual(exponents[0, 1], 0.0, delta=0.02)
+        self.assertAlmostEqual(exponents[0, 2], -14.572, delta=0.05)
+        np.testing.assert_allclose(exponents.sum(axis=1), -(11 + (8 / 3)),\
+            atol=1e-3)
+        # r = 10 settles onto a stable fixed point.
+        self.assertLess(exponents[1, 0], 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
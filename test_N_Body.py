@@ -0,0 +1,38 @@
+from N_Body import N_Body, barnes_hut_accelerations, direct_accelerations
+import numpy as np
+import unittest
+
+
+class TestNBody(unittest.TestCase):
+
+    def setUp(self):
+        rng = np.random.default_rng(0)
+        self.positions = rng.normal(size=(500, 3))
+        self.masses = rng.uniform(0.5, 1.5, 500)
+
+    def test_barnes_hut_exact_at_zero_angle(self):
+        exact = direct_accelerations(self.positions, self.masses, 1.0, 0.01)
+        tree = barnes_hut_accelerations(self.positions, self.masses, 1.0,\
+            0.01, theta=0.0)
+        np.testing.assert_allclose(tree, exact, rtol=1e-10, atol=1e-12)
+
+    def test_barnes_hut_accuracy(self):
+        exact = direct_accelerations(self.positions, self.masses, 1.0, 0.01)
+        tree = barnes_hut_accelerations(self.positions, self.masses, 1.0,\
+            0.01, theta=0.5)
+        error = np.linalg.norm(tree - exact, axis=1)\
+            / np.linalg.norm(exact, axis=1)
+        self.assertLess(np.median(error), 0.01)
+
+    def test_circular_orbit(self):
+        # A light body on a circular orbit returns to its start after one 
+        # period, in units where G = 1.
+        period = 2 * np.pi
+        t, x, v = N_Body(np.array([[0.0, 0, 0], [1, 0, 0]]),\
+            np.array([[0.0, 0, 0], [0, 1, 0]]), np.array([1.0, 1e-12]),\
+            (0, period, period / 1000), G=1.0)
+        np.testing.assert_allclose(x[-1, 1], [1, 0, 0], atol=1e-4)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,46 @@
+from Pitch import PITCH_TYPES, PLATE, k_D, simulate_pitches
+import numpy as np
+import unittest
+
+
+class TestPitch(unittest.TestCase):
+
+    def test_against_euler(self):
+        # A fine Euler run of baseballpitch.py's curveball.
+        omega, phi = PITCH_TYPES['curveball']
+        theta = np.radians(1.0)
+        vx, vy, vz = 42*np.cos(theta), 0.0, 42*np.sin(theta)
+        x, y, z, t, h, k_L = 0.0, 0.0, 1.8, 0.0, 1e-5, 4.0E-4
+        while x < PLATE:
+            v = np.sqrt(vx**2 + vy**2 + vz**2)
+            ax = -k_D(v)*v*vx + k_L*omega*(vz*np.sin(phi) - vy*np.cos(phi))
+            ay = -k_D(v)*v*vy + k_L*omega*vx*np.cos(phi)
+            az = -k_D(v)*v*vz - k_L*omega*vx*np.sin(phi) - 9.81
+            vx, vy, vz = vx + ax*h, vy + ay*h, vz + az*h
+            x, y, z, t = x + vx*h, y + vy*h, z + vz*h, t + h
+
+        crossing = simulate_pitches(42.0, theta, omega, phi)
+        self.assertAlmostEqual(crossing['t'], t, places=4)
+        self.assertAlmostEqual(crossing['y'], y, places=4)
+        self.assertAlmostEqual(crossing['z'], z, places=3)
+
+    def test_break_map(self):
+        names = ['no spin', 'curveball', 'fastball', 'slider']
+        omega, phi = np.array([PITCH_TYPES[name] for name in names]).T
+        speed = np.array([[35.0], [42.0]])
+        crossing = simulate_pitches(speed, np.radians(1.0), omega, phi)
+        self.assertEqual(crossing['z'].shape, (2, 4))
+        np.testing.assert_array_equal(crossing['break_y'][:, 0], 0)
+        np.testing.assert_array_equal(crossing['break_z'][:, 0], 0)
+        # Topspin drops, backspin rises, and the slider moves sideways.
+        self.assertTrue(np.all(crossing['break_z'][:, 1] < -0.1))
+        self.assertTrue(np.all(crossing['break_z'][:, 2] > 0.1))
+        self.assertTrue(np.all(np.abs(crossing['break_y'][:, 3]) > 0.2))
+        # Slower pitches take longer and break more.
+        self.assertTrue(np.all(crossing['t'][0] > crossing['t'][1]))
+        self.assertGreater(-crossing['break_z'][0, 1],\
+            -crossing['break_z'][1, 1])
+
+
+if __name__ == "__main__":
+    unittest.main()
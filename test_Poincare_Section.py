@@ -0,0 +1,31 @@
+from Poincare_Section import Poincare_Section
+import numpy as np
+import unittest
+
+
+class TestPoincareSection(unittest.TestCase):
+
+    def test_sweep(self):
+        # A weak drive locks onto the drive period, so the section is a 
+        # single point; c = 1.5 is chaotic and spreads out.
+        c = np.array([0.2, 1.5])
+        x, v = Poincare_Section(0.5, c, 2.0/3, periods=50)
+        self.assertEqual(x.shape, (2, 50))
+        self.assertLess(np.ptp(x[0]), 1e-9)
+        self.assertLess(np.ptp(v[0]), 1e-9)
+        self.assertGreater(np.ptp(v[1]), 0.5)
+        self.assertTrue(np.all((x >= -np.pi) & (x < np.pi)))
+
+    def test_grid_and_workers(self):
+        k, c = np.meshgrid([0.4, 0.5], [1.0, 1.2, 1.4], indexing='ij')
+        x, v = Poincare_Section(k, c, 2.0/3, transient_periods=10,\
+            periods=5)
+        self.assertEqual(x.shape, (2, 3, 5))
+        x_pool, v_pool = Poincare_Section(k, c, 2.0/3, transient_periods=10,\
+            periods=5, workers=2, block=2)
+        np.testing.assert_array_equal(x, x_pool)
+        np.testing.assert_array_equal(v, v_pool)
+
+
+if __name__ == "__main__":
+    unittest.main()
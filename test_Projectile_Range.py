@@ -0,0 +1,36 @@
+from Projectile_Range import landing_range, optimal_angle
+import numpy as np
+import unittest
+
+
+class TestProjectileRange(unittest.TestCase):
+
+    def test_vacuum(self):
+        # Without drag and from the ground the range is v0**2 sin(2 theta)/g.
+        theta = np.array([15.0, 30.0, 45.0, 60.0])
+        x, t = landing_range(30, 1e9, theta, y0=0)
+        np.testing.assert_allclose(x, 900*np.sin(np.radians(2*theta))/9.81,\
+            rtol=1e-9)
+        np.testing.assert_allclose(t, 60*np.sin(np.radians(theta))/9.81,\
+            rtol=1e-9)
+
+    def test_optimal_angle(self):
+        v0 = np.array([[20.0], [30.0]])
+        vt = np.array([30.0, 45.0, 1e9])
+        angle, x = optimal_angle(v0, vt, y0=0)
+        self.assertEqual(angle.shape, (2, 3))
+        # 45 degrees in a vacuum, and lower the more the drag matters.
+        np.testing.assert_allclose(angle[:, 2], 45, atol=0.01)
+        self.assertTrue(np.all(np.diff(angle, axis=1) > 0))
+        self.assertLess(angle[1, 0], angle[0, 0])
+
+        # No angle of a fine sweep flies further.
+        sweep = np.linspace(angle[1, 1] - 0.2, angle[1, 1] + 0.2, 401)
+        ranges, t = landing_range(30, 45, sweep, y0=0)
+        self.assertAlmostEqual(sweep[np.argmax(ranges)], angle[1, 1],\
+            delta=0.01)
+        self.assertGreaterEqual(x[1, 1], ranges.max() - 1e-6)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,63 @@
+from Record_Buffer import RecordBuffer
+import numpy as np
+import unittest
+
+
+class TestRecordBuffer(unittest.TestCase):
+
+    def test_growth(self):
+        buffer = RecordBuffer([('t', float), ('step', np.int64)], capacity=4)
+        for i in range(100):
+            buffer.append(0.1 * i, i)
+        self.assertEqual(len(buffer), 100)
+        self.assertEqual(buffer.capacity, 128)
+        self.assertEqual(buffer['step'].dtype, np.int64)
+        np.testing.assert_array_equal(buffer['step'], np.arange(100))
+        # Columns are views of the storage, not copies.
+        self.assertTrue(np.shares_memory(buffer['t'], buffer._data[0]))
+
+        buffer.extend(t=np.zeros(50), step=np.arange(100, 150))
+        t, step = buffer.columns()
+        np.testing.assert_array_equal(step, np.arange(150))
+
+    def test_ring(self):
+        buffer = RecordBuffer([('t', float), ('position', float, 3)],\
+            capacity=2, maxlen=10)
+        for i in range(57):
+            buffer.append(t=i, position=[i, 2*i, 3*i])
+        self.assertEqual(len(buffer), 10)
+        self.assertLessEqual(buffer.capacity, 20)
+        np.testing.assert_array_equal(buffer['t'], np.arange(47, 57))
+        self.assertEqual(buffer['position'].shape, (10, 3))
+        np.testing.assert_array_equal(buffer['position'][:, 2],\
+            3 * np.arange(47, 57))
+
+        # A batch longer than the ring keeps only its end.
+        buffer.extend(np.arange(100, 125), np.zeros((25, 3)))
+        np.testing.assert_array_equal(buffer['t'], np.arange(115, 125))
+        buffer.extend(np.arange(200, 203), np.zeros((3, 3)))
+        np.testing.assert_array_equal(buffer['t'][-4:], [124, 200, 201, 202])
+
+    def test_views_keep_values(self):
+        # Views taken before the ring wraps or the buffer is cleared are not
+        # written over by the rows appended afterwards.
+        buffer = RecordBuffer([('x', float)], capacity=6, maxlen=3)
+        for i in range(5):
+            buffer.append(i)
+        view = buffer['x']
+        np.testing.assert_array_equal(view, [2, 3, 4])
+        for i in range(5, 20):
+            buffer.append(i)
+        np.testing.assert_array_equal(view, [2, 3, 4])
+        np.testing.assert_array_equal(buffer['x'], [17, 18, 19])
+
+        view = buffer['x']
+        buffer.clear()
+        for i in range(3):
+            buffer.append(-i)
+        np.testing.assert_array_equal(view, [17, 18, 19])
+        np.testing.assert_array_equal(buffer['x'], [0, -1, -2])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,28 @@
+from Render_Pipeline import TrailBuffer, decimate
+import numpy as np
+import unittest
+
+
+class TestRenderPipeline(unittest.TestCase):
+
+    def test_trail_budget(self):
+        trail = TrailBuffer(100)
+        for i in range(100000):
+            trail.push(np.array([i, 0.0, 0.0]))
+            self.assertLessEqual(trail.size, 100)
+        x = trail.view()[:, 0]
+        # Evenly spaced over the whole run.
+        self.assertEqual(x[0], 0)
+        self.assertEqual(len(np.unique(np.diff(x))), 1)
+        self.assertGreater(x[-1], 100000 - (2 * trail.stride))
+
+    def test_decimate(self):
+        for n in range(2, 60):
+            kept = decimate(np.arange(n), 7)
+            self.assertLessEqual(len(kept), 7)
+            self.assertEqual(kept[0], 0)
+            self.assertEqual(kept[-1], n - 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
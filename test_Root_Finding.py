@@ -0,0 +1,66 @@
+from Root_Finding import all_roots, newton
+import numpy as np
+from scipy.optimize import newton as scipy_newton
+import unittest
+
+
+def firing(theta, v0, xf, v_ship):
+    # The firing angle equation of ship_cannon_problem.py with yf = xf.
+    u = v0*np.cos(theta) + v_ship
+    return (v0*np.sin(theta)*xf/u) - (9.8/2)*(xf/u)**2 - xf
+
+
+class TestNewton(unittest.TestCase):
+
+    def test_matches_scipy(self):
+        speeds = np.linspace(0.514, 1.514, 7)
+        roots, converged = newton(firing, np.radians(25),\
+            args=(200, 100, speeds))
+        self.assertTrue(np.all(converged))
+        for root, speed in zip(roots, speeds):
+            self.assertAlmostEqual(root, scipy_newton(firing, np.radians(25),\
+                args=(200, 100, speed)), places=10)
+
+    def test_halley_and_continuation(self):
+        c = np.linspace(1, 100, 1001)[:, np.newaxis] * [1, 2]
+        roots, converged = newton(lambda x, c: x**3 - c, 1.0, args=(c,),\
+            fprime=lambda x, c: 3*x**2, fprime2=lambda x, c: 6*x, tol=1e-12,\
+            continuation=True)
+        self.assertEqual(roots.shape, (1001, 2))
+        self.assertTrue(np.all(converged))
+        np.testing.assert_allclose(roots, np.cbrt(c), rtol=1e-12)
+
+    def test_convergence_mask(self):
+        # x**2 + c has no real root for c > 0.
+        c = np.array([-4.0, 1.0, -9.0])
+        roots, converged = newton(lambda x, c: x**2 + c, 1.0, args=(c,),\
+            fprime=lambda x, c: 2*x, max_iter=30)
+        np.testing.assert_array_equal(converged, [True, False, True])
+        np.testing.assert_allclose(roots[[0, 2]], [2, 3])
+
+
+class TestAllRoots(unittest.TestCase):
+
+    def test_single_function(self):
+        func = lambda x: np.exp(-x) - np.cos(x)
+        roots, index = all_roots(func, -2, 20)
+        self.assertEqual(len(roots), 7)
+        self.assertAlmostEqual(roots[0], 0, places=10)
+        self.assertAlmostEqual(roots[1], 1.29269572, places=8)
+        np.testing.assert_allclose(func(roots), 0, atol=1e-10)
+        # Sign changes across the poles of tan are not roots.
+        roots, index = all_roots(np.tan, 0.5, 7)
+        np.testing.assert_allclose(roots, [np.pi, 2*np.pi])
+
+    def test_batch(self):
+        k = np.array([1.0, 2.5, 10.0])
+        roots, index = all_roots(lambda x, k: np.sin(k*x), 0.1, 10,\
+            args=(k,))
+        for i in range(3):
+            expected = np.arange(1, int(10*k[i]/np.pi) + 1) * np.pi / k[i]
+            np.testing.assert_allclose(roots[index == i], expected,\
+                atol=2e-12)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,49 @@
+from Rosenbrock import Rosenbrock, color_columns, fd_jacobian
+import numpy as np
+import scipy.sparse as sp
+import unittest
+
+
+def chain(t, N, k1, k2):
+    """Parent and daughter decay with very different rates."""
+    return np.array([-k1*N[0], k1*N[0] - k2*N[1]])
+
+
+class TestRosenbrock(unittest.TestCase):
+
+    def test_stiff_decay_chain(self):
+        k1, k2 = 1.0, 1.0E4
+        t, N, stats = Rosenbrock(chain, (0, 10), np.array([1.0, 0.0]),\
+            (k1, k2), system=True)
+        daughter = k1 / (k2 - k1) * (np.exp(-k1*t) - np.exp(-k2*t))
+
+        np.testing.assert_allclose(N[:, 0], np.exp(-k1*t), atol=1e-3)
+        np.testing.assert_allclose(N[:, 1], daughter, atol=1e-6)
+        # An explicit method would need over 50,000 steps to stay stable.
+        self.assertLess(stats['steps'], 5000)
+        self.assertLess(stats['njev'], stats['steps'] / 5)
+
+    def test_colored_jacobian(self):
+        n = 50
+        sparsity = sp.diags([1, 1, 1], [-1, 0, 1], shape=(n, n), dtype=bool)
+        colors = color_columns(sparsity)
+        self.assertEqual(colors.max() + 1, 3)
+
+        laplacian = sp.diags([1.0, -2.0, 1.0], [-1, 0, 1], shape=(n, n))
+        def fun(t, u):
+            return (laplacian @ u) - u**3
+        u = np.linspace(0, 1, n)
+        J, nfev = fd_jacobian(fun, 0, u, fun(0, u), sparsity, colors)
+        J_dense, nfev_dense = fd_jacobian(fun, 0, u, fun(0, u))
+        self.assertEqual(nfev, 3)
+        np.testing.assert_allclose(J.toarray(), J_dense, atol=1e-6)
+
+        # Columns sharing 256 rows still conflict.
+        sparsity = np.zeros((256, 3), dtype=bool)
+        sparsity[:, :2] = True
+        colors = color_columns(sparsity)
+        self.assertNotEqual(colors[0], colors[1])
+
+
+if __name__ == "__main__":
+    unittest.main()
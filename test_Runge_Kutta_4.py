@@ -0,0 +1,105 @@
+from Runge_Kutta_4 import Runge_Kutta_4, Runge_Kutta_4_ensemble,\
+    Runge_Kutta_4_stream
+import JIT_Backend
+import numpy as np
+import unittest
+
+
+def driven_oscillator(t, Y, k, c):
+    """Damped driven pendulum; works on single states and ensembles alike."""
+    return -k*Y[..., 1] - np.sin(Y[..., 0]) + c*np.cos(2.0*t/3)
+
+
+class TestRungeKutta4(unittest.TestCase):
+
+    def test_third_order(self):
+        # y''' = y with y = y' = y'' = 1 at x = 0 is solved by exp(x).
+        out = np.empty((101, 3))
+        x, y = Runge_Kutta_4(lambda x, Y: Y[0], (0, 1, 0.01),\
+            np.ones(3), (), out=out)
+        self.assertIs(y, out)
+        for i in range(3):
+            np.testing.assert_allclose(y[:, i], np.exp(x), rtol=1e-9)
+
+    def test_ensemble_matches_single(self):
+        x_range = (0, 10, 0.01)
+        initial_values = np.array([[-0.75, 1.2], [0.0, 0.0], [1.0, -0.5]])
+        params = [(0.5, 1.15), (0.5, 1.5), (0.1, 0.0)]
+
+        x, y = Runge_Kutta_4_ensemble(driven_oscillator, x_range,\
+            initial_values, params)
+        self.assertEqual(y.shape, (len(x), 3, 2))
+
+        for i in range(3):
+            x_single, y_single = Runge_Kutta_4(driven_oscillator, x_range,\
+                initial_values[i], params[i])
+            np.testing.assert_allclose(y[:, i], y_single, rtol=1e-12,\
+                atol=1e-12)
+
+    def test_ensemble_reduce(self):
+        x, y = Runge_Kutta_4_ensemble(driven_oscillator, (0, 1, 0.1),\
+            np.zeros((4, 2)), [(0.5, c) for c in range(4)],\
+            reduce=lambda t, Y: Y[:, 0])
+        self.assertEqual(y.shape, (len(x), 4))
+        np.testing.assert_array_equal(y[0], np.zeros(4))
+
+    def test_stream_matches_full(self):
+        x_range = (0, 10, 0.01)
+        x, y = Runge_Kutta_4(driven_oscillator, x_range,\
+            np.array([-0.75, 1.2]), (0.5, 1.15))
+
+        chunks = list(Runge_Kutta_4_stream(driven_oscillator, x_range,\
+            np.array([-0.75, 1.2]), (0.5, 1.15), chunk_size=7,\
+            save_every=3, components=0))
+        self.assertTrue(all(len(x_c) == 7 for x_c, y_c in chunks[:-1]))
+        x_s = np.concatenate([x_c for x_c, y_c in chunks])
+        y_s = np.concatenate([y_c for x_c, y_c in chunks])
+        np.testing.assert_allclose(x_s, x[::3])
+        np.testing.assert_allclose(y_s, y[::3, 0], rtol=1e-12, atol=1e-12)
+
+        peaks = Runge_Kutta_4_stream(driven_oscillator, x_range,\
+            np.array([-0.75, 1.2]), (0.5, 1.15), chunk_size=100,\
+            reducer=lambda x_c, y_c: np.max(y_c[:, 1]))
+        self.assertAlmostEqual(max(peaks), np.max(y[:, 1]), places=12)
+
+    def test_terminal_event(self):
+        # Free fall from 1.8 m at 10 m/s upwards; the position is quadratic, 
+        # so even large steps find the exact landing time.
+        def ground(t, Y, g):
+            return Y[0]
+        ground.terminal = True
+        ground.direction = -1
+
+        def apex(t, Y, g):
+            return Y[1]
+
+        x, y, x_events, y_events = Runge_Kutta_4(lambda t, Y, g: -g,\
+            (0, 100, 0.25), np.array([1.8, 10.0]), (9.81,),\
+            events=[ground, apex])
+        t_land = (10 + np.sqrt(100 + (2 * 9.81 * 1.8))) / 9.81
+
+        self.assertAlmostEqual(x[-1], t_land, places=10)
+        self.assertAlmostEqual(y[-1, 0], 0, places=10)
+        self.assertAlmostEqual(x_events[0][0], t_land, places=10)
+        self.assertAlmostEqual(x_events[1][0], 10 / 9.81, places=10)
+        self.assertEqual(len(y), int(t_land / 0.25) + 2)
+
+    def test_numba_backend(self):
+        # Falls back to the NumPy loop when numba is missing, so the results
+        # match either way; with numba the compiled loop must really run.
+        x_range = (0, 10, 0.01)
+        x, y = Runge_Kutta_4(driven_oscillator, x_range,\
+            np.array([-0.75, 1.2]), (0.5, 1.15))
+        x_jit, y_jit = Runge_Kutta_4(driven_oscillator, x_range,\
+            np.array([-0.75, 1.2]), (0.5, 1.15), backend='numba')
+        np.testing.assert_allclose(y_jit, y, rtol=1e-12, atol=1e-12)
+
+        if JIT_Backend.available():
+            y_jit = np.empty_like(y)
+            y_jit[0] = y[0]
+            self.assertTrue(JIT_Backend.Runge_Kutta_4(driven_oscillator, x,\
+                y_jit, (0.5, 1.15)))
+            np.testing.assert_allclose(y_jit, y, rtol=1e-12, atol=1e-12)
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,37 @@
+from Symplectic import Symplectic, ORDERS
+import numpy as np
+import unittest
+
+
+def gravity(x, GM):
+    """Acceleration towards a fixed central mass."""
+    return -GM * x / np.linalg.norm(x) ** 3
+
+
+class TestSymplectic(unittest.TestCase):
+
+    def test_orders(self):
+        for method, order in ORDERS.items():
+            errors = []
+            for h in (0.02, 0.01):
+                t, x, v = Symplectic(lambda x: -x, (0, 2, h), np.ones(1),\
+                    np.zeros(1), (), method)
+                errors.append(abs(x[-1, 0] - np.cos(t[-1])))
+            self.assertAlmostEqual(np.log2(errors[0] / errors[1]), order,\
+                delta=0.1, msg=method)
+
+    def test_energy_bounded(self):
+        # Eccentric orbit in units with GM = 1, over 200 periods at 100 
+        # steps per period.
+        for method in ORDERS:
+            t, x, v = Symplectic(gravity, (0, 400 * np.pi, 0.02 * np.pi),\
+                np.array([1.0, 0.0]), np.array([0.0, 1.2]), (1.0,), method,\
+                save_every=10)
+            energy = (0.5 * np.sum(v ** 2, axis=1))\
+                - (1 / np.linalg.norm(x, axis=1))
+            drift = np.max(np.abs((energy / energy[0]) - 1))
+            self.assertLess(drift, 0.05, msg=method)
+
+
+if __name__ == "__main__":
+    unittest.main()
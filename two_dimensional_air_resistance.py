@@ -3,6 +3,7 @@
 
 import numpy as np
 import matplotlib.pyplot as plt
+from Record_Buffer import RecordBuffer
 from numpy.core.fromnumeric import argmax
 
 # Parameters to start off
@@ -17,11 +18,9 @@ x = 0 # meters
 y = 1.25 # meters
 dt = 0.01
 
-# Create arrays to store data that is calculated
-# They start empty, then we append values as they come
-t_calculated = np.zeros(0)
-x_calculated = np.zeros(0)
-y_calculated = np.zeros(0)
+# Create a table to store data that is calculated
+# It starts empty, then we append rows as they come
+trajectory = RecordBuffer([('t', float), ('x', float), ('y', float)])
 
 
 # Define the functions we'll need
@@ -68,12 +67,10 @@ while y >= 0:
     y = heun_position(y, v_y)
     # Update v
     v = np.sqrt(v_x**2 + v_y**2)
-    # Update the arrays
-    x_calculated = np.append(x_calculated, x)
-    y_calculated = np.append(y_calculated, y)
-    # Update the time and time's array
+    # Update the time, then add the row to the table
     t = t + dt
-    t_calculated = np.append(t_calculated, t)
+    trajectory.append(t, x, y)
+t_calculated, x_calculated, y_calculated = trajectory.columns()
 
 # Plot the results and figure some things out
 plt.xlabel('Horizontal position (m)')